@@ -0,0 +1,313 @@
+"""Minimal test harness used by test_sdk.py.
+
+Tests are plain or async functions registered with @test("name") under the
+current section("Title"); they run as soon as they are declared, or in
+parallel at the end of a concurrent() block, where a group("name") block
+keeps a chain of dependent tests together on one worker.
+"""
+
+import asyncio
+import json
+import linecache
+import os
+import re
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Set, Tuple
+
+# Worker threads for concurrent() blocks; 1 runs everything serially.
+WORKERS = max(1, int(os.environ.get("WATCHPOST_TEST_WORKERS", "16")))
+
+# Longest repr shown for a local in a bare-assert failure.
+_REPR_LIMIT = 120
+
+# Where the names of the last run's failures are kept for --lf.
+LASTFAILED_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".test_cache", "lastfailed.json")
+
+# Case-insensitive substrings and exact names; when either is set, only tests
+# matching one of them run (plus setup tests). See select().
+_selected: Optional[List[str]] = None
+_selected_names: Optional[Set[str]] = None
+
+
+def select(patterns, names=None):
+    """Only run tests whose name contains one of patterns (case-insensitive)
+    or is one of names.
+
+    Tests declared with setup=True always run, since later tests depend on
+    the fixtures they create.
+    """
+    global _selected, _selected_names
+    _selected = [p.lower() for p in patterns] or None
+    _selected_names = set(names) if names else None
+
+
+def _deselected(name):
+    if _selected is None and _selected_names is None:
+        return False
+    if _selected_names and name in _selected_names:
+        return False
+    return not (_selected and any(p in name.lower() for p in _selected))
+
+
+def load_last_failed():
+    """Names of the tests that failed in the previous run (empty if none)."""
+    try:
+        with open(LASTFAILED_PATH) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return []
+
+
+def save_last_failed():
+    """Record this run's failures for the next --lf run."""
+    os.makedirs(os.path.dirname(LASTFAILED_PATH), exist_ok=True)
+    with open(LASTFAILED_PATH, "w") as f:
+        json.dump([name for _, name, _ in report.errors], f, indent=1)
+
+
+# Title of the section tests are currently being declared in. See section().
+_section = ""
+
+
+def section(title):
+    """Start a new group of tests.
+
+    The title is printed before the group's first result, so a section
+    whose tests are all deselected prints nothing, and the summary
+    reports results per section.
+    """
+    global _section
+    _section = title
+
+
+@dataclass
+class TestReport:
+    """Outcome counts for the run, (section, name, detail) for each failure,
+    (name, seconds) for every test that ran and [passed, failed] per section.
+
+    With quiet set, passing tests print nothing and a section's header is
+    only printed before its first failure.
+
+    Printed lines are buffered and written in one go when output moves on
+    to the next section, or on flush().
+    """
+
+    passed: int = 0
+    failed: int = 0
+    skipped: int = 0
+    errors: List[Tuple[str, str, str]] = field(default_factory=list)
+    timings: List[Tuple[str, float]] = field(default_factory=list)
+    sections: Dict[str, List[int]] = field(default_factory=dict)
+    quiet: bool = False
+    _headed: Set[str] = field(default_factory=set, repr=False)
+    _buffered: List[str] = field(default_factory=list, repr=False)
+
+    def record(self, name: str, detail: Optional[str], elapsed: float = 0.0, section: str = "") -> None:
+        counts = self.sections.setdefault(section, [0, 0])
+        self.timings.append((name, elapsed))
+        if detail is None:
+            self.passed += 1
+            counts[0] += 1
+            if not self.quiet:
+                self._print(section, f"  ✅ {name}")
+            return
+        self.failed += 1
+        counts[1] += 1
+        self.errors.append((section, name, detail))
+        self._print(section, f"  ❌ {name}: {detail}")
+
+    def _print(self, section: str, line: str) -> None:
+        if section and section not in self._headed:
+            self.flush()
+            self._headed.add(section)
+            self._buffered.append(f"\n{section}:\n")
+        self._buffered.append(line + "\n")
+
+    def flush(self) -> None:
+        """Write out the buffered lines."""
+        if self._buffered:
+            sys.stdout.write("".join(self._buffered))
+            sys.stdout.flush()
+            self._buffered.clear()
+
+    def summary(self, slowest: int = 10) -> str:
+        result = f"Results: {self.passed} passed, {self.failed} failed"
+        if self.skipped:
+            result += f", {self.skipped} deselected"
+        lines = ["", "=" * 50, result]
+        if self.sections:
+            lines.append("\n  pass  fail  section")
+            lines.extend(
+                f"  {ok:4d}  {bad:4d}  {title or '(none)'}" for title, (ok, bad) in self.sections.items()
+            )
+        if self.errors:
+            lines.append("\nFailed tests:")
+            last = None
+            for title, name, err in self.errors:
+                if title != last:
+                    lines.append(f"  {title or '(none)'}:")
+                    last = title
+                lines.append(f"    ❌ {name}: {err}")
+        if slowest and self.timings:
+            lines.append(f"\nSlowest {min(slowest, len(self.timings))} tests:")
+            ranked = sorted(self.timings, key=lambda t: -t[1])[:slowest]
+            lines.extend(f"  {secs * 1000:7.1f}ms  {name}" for name, secs in ranked)
+        lines.append("=" * 50)
+        return "\n".join(lines) + "\n"
+
+
+report = TestReport()
+
+# Tests declared inside a concurrent() block are queued here instead of
+# running immediately.
+_pending = None
+
+# Name of the group() block tests are being declared in, if any.
+_group = None
+
+
+def _run(name, fn):
+    """Call fn and return (name, None or failure detail, wall time in seconds).
+
+    An async def test is run to completion on its own event loop.
+    """
+    start = time.perf_counter()
+    try:
+        if asyncio.iscoroutinefunction(fn):
+            asyncio.run(fn())
+        else:
+            fn()
+        detail = None
+    except Exception as e:
+        detail = _describe(e, fn.__code__.co_filename)
+    return name, detail, time.perf_counter() - start
+
+
+def _describe(exc, filename):
+    """Format a failure as 'Type at line N: message'.
+
+    The line is the deepest frame in filename (the file the test was
+    declared in), i.e. the failing assert or SDK call in the test body.
+    A bare assert has no message, so the source line and the values of
+    the local names it mentions are shown instead.
+    """
+    frame = line = None
+    tb = exc.__traceback__
+    while tb is not None:
+        if tb.tb_frame.f_code.co_filename == filename:
+            frame, line = tb.tb_frame, tb.tb_lineno
+        tb = tb.tb_next
+    where = f" at line {line}" if line else ""
+    msg = str(exc)
+    if not msg and isinstance(exc, AssertionError) and frame is not None:
+        msg = _explain_assert(filename, line, frame.f_locals)
+    return f"{type(exc).__name__}{where}: {msg}" if msg else f"{type(exc).__name__}{where}"
+
+
+def _explain_assert(filename, line, local_vars):
+    """The failing source line plus name=value for the locals it uses."""
+    source = linecache.getline(filename, line).strip()
+    if not source:
+        return ""
+    names = dict.fromkeys(re.findall(r"\b[A-Za-z_]\w*\b", source))
+    values = []
+    for name in names:
+        if name in local_vars and not callable(local_vars[name]):
+            value = repr(local_vars[name])
+            if len(value) > _REPR_LIMIT:
+                value = value[:_REPR_LIMIT - 3] + "..."
+            values.append(f"{name}={value}")
+    return f"{source}  [{', '.join(values)}]" if values else source
+
+
+def test(name, *, setup=False):
+    """Decorator for test functions, plain or async def.
+
+    setup=True marks a test that creates fixtures for later ones, so it
+    runs even when select() would filter it out.
+    """
+    def decorator(fn):
+        if not setup and _deselected(name):
+            report.skipped += 1
+        elif _pending is not None:
+            _pending.append((_section, name, fn, _group))
+        else:
+            report.record(*_run(name, fn), section=_section)
+        return fn
+    return decorator
+
+
+@contextmanager
+def concurrent(workers=None):
+    """Run the tests declared in the block in parallel once it exits.
+
+    Only use this for tests that don't depend on each other's side effects,
+    or put the ones that do in a group(). Results are still recorded and
+    printed in declaration order. The pool size defaults to
+    WATCHPOST_TEST_WORKERS.
+    """
+    global _pending
+    _pending = []
+    try:
+        yield
+    finally:
+        batch, _pending = _pending, None
+        # Indexes into batch, one list per worker task: a group's tests
+        # share a list, every ungrouped test gets its own.
+        units: Dict[object, List[int]] = {}
+        for i, (_, _, _, name) in enumerate(batch):
+            units.setdefault(i if name is None else ("group", name), []).append(i)
+
+        def run_unit(indexes):
+            return [(i, _run(batch[i][1], batch[i][2])) for i in indexes]
+
+        results: List[Optional[tuple]] = [None] * len(batch)
+        with ThreadPoolExecutor(max_workers=workers or WORKERS) as pool:
+            for done in pool.map(run_unit, units.values()):
+                for i, result in done:
+                    results[i] = result
+        for (title, _, _, _), result in zip(batch, results):
+            report.record(*result, section=title)
+
+
+@contextmanager
+def group(name):
+    """Run the tests declared in the block in order, on one worker.
+
+    Inside concurrent(), this lets a chain of dependent tests (create,
+    update, delete) run alongside other chains and ungrouped tests.
+    Outside concurrent() tests already run in order, so it has no effect.
+    """
+    global _group
+    previous, _group = _group, name
+    try:
+        yield
+    finally:
+        _group = previous
+
+
+class Raised:
+    """Yielded by expect_raises(); value is the caught exception."""
+
+    value: Optional[BaseException] = None
+
+
+@contextmanager
+def expect_raises(exc_type):
+    """Fail unless the block raises exc_type (a class or tuple of classes).
+
+    Use "with expect_raises(E) as raised:" to inspect raised.value after
+    the block.
+    """
+    raised = Raised()
+    try:
+        yield raised
+    except exc_type as e:
+        raised.value = e
+        return
+    types = exc_type if isinstance(exc_type, tuple) else (exc_type,)
+    raise AssertionError("Expected " + " or ".join(t.__name__ for t in types))
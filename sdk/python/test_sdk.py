@@ -3,17 +3,58 @@
 
 Run against a live instance:
     WATCHPOST_URL=http://192.168.0.79:3007 python3 test_sdk.py
+
+Or let the script start a throwaway server on loopback with a temp database,
+which also skips cleanup since the database is deleted with the server:
+    WATCHPOST_BIN=../../target/release/watchpost python3 test_sdk.py
+
+Independent sections run on a thread pool; set WATCHPOST_TEST_WORKERS=1 to
+run every test serially when debugging. -k runs only the tests whose name
+contains the given substring (repeatable):
+    python3 test_sdk.py -k badge -k "status page"
+
+Failures are recorded in .test_cache/; --lf reruns just those:
+    python3 test_sdk.py --lf
+
+-q prints only failures and the summary, not a line per passing test.
 """
 
+import argparse
+import asyncio
+import contextlib
+import copy
 import json
 import os
+import pickle
+import shutil
+import socket
+import subprocess
 import sys
+import tempfile
+import threading
 import time
-import traceback
+import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest import mock
+
+from harness import (
+    concurrent,
+    expect_raises,
+    group,
+    load_last_failed,
+    report,
+    save_last_failed,
+    section,
+    select,
+    test,
+)
 
-# Import from same directory
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+# Resolves to the sibling watchpost.py when run as a script, or to an
+# installed copy (pip install -e sdk/python) otherwise.
 from watchpost import (
+    AsyncWatchpost,
+    Monitor,
     Watchpost,
     WatchpostError,
     NotFoundError,
@@ -24,226 +65,546 @@ from watchpost import (
 )
 
 BASE_URL = os.environ.get("WATCHPOST_URL", "http://192.168.0.79:3007")
+# Target for the monitors the tests create. Point it at a local httpbin
+# (e.g. docker run -p 8080:80 kennethreitz/httpbin) to avoid the public one.
+# With WATCHPOST_BIN and no HTTPBIN_URL, main() serves a loopback stub instead.
+HTTPBIN_URL = HTTPBIN_HOST = HTTPBIN_TCP = None
+
+
+def set_httpbin(url):
+    """Point the monitor target constants at url."""
+    global HTTPBIN_URL, HTTPBIN_HOST, HTTPBIN_TCP
+    HTTPBIN_URL = url.rstrip("/")
+    parsed = urllib.parse.urlsplit(HTTPBIN_URL)
+    HTTPBIN_HOST = parsed.hostname
+    HTTPBIN_TCP = f"{HTTPBIN_HOST}:{parsed.port or (443 if parsed.scheme == 'https' else 80)}"
+
+
+set_httpbin(os.environ.get("HTTPBIN_URL", "https://httpbin.org"))
+
+# A well-formed id that never matches a real resource.
+ZERO_UUID = "00000000-0000-0000-0000-000000000000"
+# A maintenance window that is always in the future.
+FUTURE_START = "2099-01-01T00:00:00Z"
+FUTURE_END = "2099-01-01T01:00:00Z"
+
+# Fields each response must include (checked as a subset of its keys).
+CREATE_RESPONSE_FIELDS = frozenset({"id", "name", "url", "manage_key"})
+MONITOR_DETAIL_FIELDS = frozenset({
+    "id", "name", "url", "monitor_type", "method", "interval_seconds",
+    "timeout_ms", "expected_status", "is_public", "current_status",
+})
+MONITOR_LIST_ITEM_FIELDS = frozenset({"id", "name", "url", "current_status"})
+EXPORT_FIELDS = frozenset({"name", "url", "monitor_type"})
+DOWNTIME_SUMMARY_FIELDS = frozenset({
+    "is_down", "current_status", "current_incident", "uptime_24h", "uptime_7d", "uptime_30d",
+})
+
+
+def start_local_server(binary):
+    """Start a Watchpost server on a free 127.0.0.1 port with a temp database.
+
+    Returns (base_url, stop) where stop() kills the server and removes the
+    temp directory.
+    """
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+
+    workdir = tempfile.mkdtemp(prefix="watchpost-sdk-test-")
+    env = dict(
+        os.environ,
+        DATABASE_PATH=os.path.join(workdir, "watchpost.db"),
+        ROCKET_ADDRESS="127.0.0.1",
+        ROCKET_PORT=str(port),
+        MONITOR_RATE_LIMIT="1000",
+    )
+    log = open(os.path.join(workdir, "server.log"), "wb")
+    proc = subprocess.Popen([binary], env=env, cwd=workdir, stdout=log, stderr=subprocess.STDOUT)
+
+    def stop():
+        proc.terminate()
+        try:
+            proc.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+        log.close()
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    base_url = f"http://127.0.0.1:{port}"
+    probe = Watchpost(base_url, timeout=1)
+    deadline = time.time() + 30
+    while time.time() < deadline:
+        if proc.poll() is not None:
+            break
+        try:
+            probe.health()
+            probe.close()
+            return base_url, stop
+        except OSError:
+            time.sleep(0.1)
+    probe.close()
+    with open(os.path.join(workdir, "server.log"), "rb") as f:
+        output = f.read().decode(errors="replace")
+    stop()
+    raise RuntimeError(f"Watchpost server did not come up on {base_url}:\n{output}")
+
+
+class _StubTargetHandler(BaseHTTPRequestHandler):
+    """Minimal httpbin stand-in for the endpoints the tests use.
+
+    /status/<code> answers with that code, /html returns a small page (for
+    body_contains checks), /headers echoes the request headers as JSON,
+    and any other path (e.g. /post for webhooks) answers 200 with the
+    request echoed as JSON.
+    """
+
+    protocol_version = "HTTP/1.1"
+
+    def _respond(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length) if length else b""
+        parts = self.path.split("?")[0].strip("/").split("/")
+        status, content_type = 200, "application/json"
+        if len(parts) == 2 and parts[0] == "status" and parts[1].isdigit():
+            status, content_type, payload = int(parts[1]), "text/plain", b""
+        elif parts == ["html"]:
+            content_type = "text/html; charset=utf-8"
+            payload = b"<!DOCTYPE html><html><body><h1>Stub target</h1></body></html>"
+        elif parts == ["headers"]:
+            payload = json.dumps({"headers": dict(self.headers)}).encode()
+        else:
+            payload = json.dumps({
+                "method": self.command,
+                "headers": dict(self.headers),
+                "data": body.decode("utf-8", errors="replace"),
+            }).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        if self.command != "HEAD":
+            self.wfile.write(payload)
+
+    do_GET = do_HEAD = do_POST = do_PUT = do_PATCH = do_DELETE = _respond
+
+    def log_message(self, *args):
+        pass
+
+
+def start_stub_target():
+    """Serve _StubTargetHandler on a free 127.0.0.1 port in a daemon thread.
+
+    Returns (base_url, stop).
+    """
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StubTargetHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    def stop():
+        server.shutdown()
+        server.server_close()
+
+    return f"http://127.0.0.1:{server.server_address[1]}", stop
+
+
+class _SlowReadHandler(BaseHTTPRequestHandler):
+    """Serves a single monitor, "m", for the cache race tests.
+
+    PATCH /api/v1/monitors/m renames it. The first GET reads the name and
+    then waits for server.release before answering, so a test can write
+    while that GET is in flight; later GETs answer at once.
+    """
+
+    protocol_version = "HTTP/1.1"
+
+    def _reply(self, payload):
+        body = json.dumps(payload).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        server = self.server
+        with server.lock:
+            first = server.gets == 0
+            server.gets += 1
+            monitor = {"id": "m", "name": server.name}
+        if first:
+            server.started.set()
+            server.release.wait(10)
+        self._reply(monitor)
+
+    def do_PATCH(self):
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        with self.server.lock:
+            self.server.name = body["name"]
+            monitor = {"id": "m", "name": self.server.name}
+        self._reply({"monitor": monitor})
+
+    def log_message(self, *args):
+        pass
+
+
+@contextlib.contextmanager
+def slow_read_server():
+    """Serve _SlowReadHandler on a free 127.0.0.1 port; yields the server,
+    with its URL as server.url."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _SlowReadHandler)
+    server.daemon_threads = True
+    server.lock = threading.Lock()
+    server.started, server.release = threading.Event(), threading.Event()
+    server.gets, server.name = 0, "old"
+    server.url = f"http://127.0.0.1:{server.server_address[1]}"
+    # A short poll interval keeps shutdown() from adding half a second per test.
+    threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True).start()
+    try:
+        yield server
+    finally:
+        server.release.set()
+        server.shutdown()
+        server.server_close()
+
+
+def create_monitors(wp, created_monitors, *specs):
+    """Create independent monitors concurrently and register them for cleanup.
+
+    Each spec is (name, url, kwargs). Returns the create responses in spec
+    order.
+    """
+    with ThreadPoolExecutor(max_workers=len(specs)) as pool:
+        monitors = list(pool.map(lambda spec: wp.create_monitor(spec[0], spec[1], **spec[2]), specs))
+    for mon in monitors:
+        created_monitors[mon["id"]] = mon["manage_key"]
+    return monitors
+
+
+def shape_tests(calls):
+    """Register one test per (name, call) that only checks call() returns a
+    list or dict.
+
+    For endpoints where the response shape is all that can be asserted
+    (e.g. histories that may be empty on a fresh server). Each call is a
+    lambda so the request runs with the test, not at declaration.
+    """
+    for name, call in calls:
+        @test(name)
+        def _(call=call):
+            result = call()
+            assert isinstance(result, (list, dict)), f"Unexpected type: {type(result)}"
+
+
+def teardown(wp, created_monitors, created_pages):
+    """Delete every resource the run created, whatever state it ended in.
+
+    Status pages are deleted concurrently alongside one bulk delete of all
+    monitors (which the SDK splits into concurrent 50-monitor requests).
+    """
+    section("Cleanup")
+
+    def delete_page(slug, key):
+        try:
+            wp.delete_status_page(slug, key)
+            return 1, 0
+        except Exception:
+            return 0, 1
 
-passed = 0
-failed = 0
-errors = []
+    def delete_monitors(pairs):
+        if not pairs:
+            return 0, 0
+        try:
+            result = wp.bulk_delete_monitors(pairs)
+            return result["succeeded"], result["failed"]
+        except Exception:
+            return 0, len(pairs)
 
+    with ThreadPoolExecutor(max_workers=16) as pool:
+        jobs = [pool.submit(delete_page, slug, key) for slug, key in created_pages.items()]
+        jobs.append(pool.submit(delete_monitors, list(created_monitors.items())))
+        results = [job.result() for job in jobs]
 
-def test(name):
-    """Decorator for test functions."""
-    def decorator(fn):
-        global passed, failed
-        try:
-            fn()
-            passed += 1
-            print(f"  ✅ {name}")
-        except Exception as e:
-            failed += 1
-            errors.append((name, str(e)))
-            print(f"  ❌ {name}: {e}")
-        return fn
-    return decorator
+    cleanup_ok = sum(ok for ok, _ in results)
+    cleanup_fail = sum(fail for _, fail in results)
+    print(f"  Cleaned up {cleanup_ok} resources ({cleanup_fail} failed)")
 
 
 def main():
-    global passed, failed
-    wp = Watchpost(BASE_URL)
+    global BASE_URL
+    parser = argparse.ArgumentParser(description="Watchpost SDK integration tests")
+    parser.add_argument("-k", dest="patterns", action="append", default=[], metavar="SUBSTRING",
+                        help="only run tests whose name contains SUBSTRING (repeatable)")
+    parser.add_argument("--lf", "--last-failed", dest="last_failed", action="store_true",
+                        help="only rerun the tests that failed last time (all tests if none did)")
+    parser.add_argument("-q", "--quiet", action="store_true",
+                        help="don't print passing tests, only failures and the summary")
+    args = parser.parse_args()
+    report.quiet = args.quiet
+    select(args.patterns, load_last_failed() if args.last_failed else None)
+
+    stop_server = stop_target = None
+    if os.environ.get("WATCHPOST_BIN"):
+        # A local server can reach a loopback target, so the monitors it
+        # probes don't need the public internet either.
+        if not os.environ.get("HTTPBIN_URL"):
+            url, stop_target = start_stub_target()
+            set_httpbin(url)
+        BASE_URL, stop_server = start_local_server(os.environ["WATCHPOST_BIN"])
+
+    try:
+        # A throwaway server's database is deleted with it, so there is
+        # nothing to clean up one resource at a time.
+        return run_suite(disposable=stop_server is not None)
+    finally:
+        if stop_server:
+            stop_server()
+        if stop_target:
+            stop_target()
+
+
+def run_suite(disposable=False):
+    # Writes through wp clear its GET cache, so read-after-write stays fresh.
+    wp = Watchpost(BASE_URL, cache=True)
+    # Resolve the host and open a pooled connection up front so the first
+    # test isn't charged for it. Failures surface in the health tests.
+    try:
+        wp.health()
+    except (OSError, WatchpostError):
+        pass
 
     print(f"\n🧪 Running Watchpost SDK integration tests against {BASE_URL}\n")
 
-    # Track monitors to clean up
-    created_monitors = []  # (id, key) tuples
-    created_pages = []  # (slug, key) tuples
+    # Track resources to clean up; dicts so re-registering is a no-op
+    created_monitors = {}  # id -> manage key
+    created_pages = {}  # slug -> manage key
+
+    try:
+        run_tests(wp, created_monitors, created_pages)
+    finally:
+        report.flush()
+        if not disposable:
+            teardown(wp, created_monitors, created_pages)
+        wp.close()
+
+    print(report.summary())
+    save_last_failed()
+    return 0 if report.failed == 0 else 1
 
+
+def run_tests(wp, created_monitors, created_pages):
+    """Run every section in order.
+
+    Sections that just need *a* monitor reuse the main monitor (monitor_id)
+    or the SLA monitor (sla_monitor_id) rather than creating throwaways.
+    Anything created must be recorded in created_monitors/created_pages so
+    teardown() can remove it, even if a section raises.
+    """
     # ── Health & Discovery ──────────────────────────────────────────────
-    print("Health & Discovery:")
+    section("Health & Discovery")
 
-    @test("health returns version")
-    def _():
-        h = wp.health()
-        assert "version" in h or "status" in h, f"Unexpected health: {h}"
+    with concurrent():
+        @test("health returns version")
+        def _():
+            h = wp.health()
+            assert "version" in h or "status" in h, f"Unexpected health: {h}"
 
-    @test("llms.txt returns text")
-    def _():
-        txt = wp.get_llms_txt()
-        assert "Watchpost" in txt, f"Missing 'Watchpost' in llms.txt"
+        @test("llms.txt returns text")
+        def _():
+            txt = wp.get_llms_txt()
+            assert "Watchpost" in txt, f"Missing 'Watchpost' in llms.txt"
 
-    @test("skills index returns JSON")
-    def _():
-        idx = wp.get_skills_index()
-        assert "skills" in idx or "name" in idx, f"Unexpected skills index: {idx}"
+        @test("skills index returns JSON")
+        def _():
+            idx = wp.get_skills_index()
+            assert "skills" in idx or "name" in idx, f"Unexpected skills index: {idx}"
 
-    @test("skill.md returns markdown")
-    def _():
-        md = wp.get_skill()
-        assert "watchpost" in md.lower() or "monitor" in md.lower(), "SKILL.md missing expected content"
+        @test("skill.md returns markdown")
+        def _():
+            md = wp.get_skill()
+            assert "watchpost" in md.lower() or "monitor" in md.lower(), "SKILL.md missing expected content"
 
     # ── Monitor CRUD ────────────────────────────────────────────────────
-    print("\nMonitor CRUD:")
+    section("Monitor CRUD")
 
     monitor_id = None
     monitor_key = None
+    sla_monitor_id = None
+    sla_monitor_key = None
+    dep_monitor_id = None
+    dep_monitor_key = None
+    setup = {}  # name -> flattened create response
+
+    # The fixture monitors used by the sections below are created in one
+    # bulk request rather than one create_monitor round trip each.
+    @test("bulk create fixture monitors", setup=True)
+    def _():
+        nonlocal monitor_id, monitor_key, sla_monitor_id, sla_monitor_key
+        nonlocal dep_monitor_id, dep_monitor_key
+        result = wp.bulk_create_monitors([
+            {
+                "name": "SDK Test Monitor",
+                "url": f"{HTTPBIN_URL}/status/200",
+                "is_public": True,
+                "tags": ["sdk-test", "ci"],
+                "group_name": "SDK Tests",
+            },
+            {
+                "name": "SLA Test",
+                "url": f"{HTTPBIN_URL}/status/200",
+                "is_public": True,
+                "sla_target": 99.9,
+                "sla_period_days": 30,
+                "response_time_threshold_ms": 5000,
+            },
+            {"name": "TCP Test", "url": HTTPBIN_TCP, "monitor_type": "tcp", "is_public": True},
+            {
+                "name": "DNS Test",
+                "url": HTTPBIN_HOST,
+                "monitor_type": "dns",
+                "dns_record_type": "A",
+                "is_public": True,
+            },
+            {"name": "Upstream DB", "url": f"{HTTPBIN_URL}/status/200", "is_public": True},
+            {"name": "Bulk A", "url": f"{HTTPBIN_URL}/status/200", "is_public": True},
+            {"name": "Bulk B", "url": f"{HTTPBIN_URL}/status/201", "is_public": True},
+            {"name": "Dep Chain A", "url": f"{HTTPBIN_URL}/status/200", "is_public": True},
+            {"name": "Cascade Test", "url": f"{HTTPBIN_URL}/status/200", "is_public": True},
+            {"name": "Delete Test", "url": f"{HTTPBIN_URL}/status/200", "is_public": True},
+            {"name": "Double Delete", "url": f"{HTTPBIN_URL}/status/200", "is_public": True},
+            {"name": "Iso-A", "url": f"{HTTPBIN_URL}/status/200", "is_public": True, "tags": ["iso-a"]},
+            {"name": "Iso-B", "url": f"{HTTPBIN_URL}/status/201", "is_public": True, "tags": ["iso-b"]},
+            {"name": "Chain-A (DB)", "url": f"{HTTPBIN_URL}/status/200", "is_public": True},
+            {"name": "Chain-B (API)", "url": f"{HTTPBIN_URL}/status/200", "is_public": True},
+            {"name": "Chain-C (Web)", "url": f"{HTTPBIN_URL}/status/200", "is_public": True},
+        ])
+        for m in result["created"]:
+            created_monitors[m["id"]] = m["manage_key"]
+            setup[m["name"]] = m
+        assert result["failed"] == 0, f"Bulk setup errors: {result['errors']}"
+        monitor_id = setup["SDK Test Monitor"]["id"]
+        monitor_key = setup["SDK Test Monitor"]["manage_key"]
+        sla_monitor_id = setup["SLA Test"]["id"]
+        sla_monitor_key = setup["SLA Test"]["manage_key"]
+        dep_monitor_id = setup["Upstream DB"]["id"]
+        dep_monitor_key = setup["Upstream DB"]["manage_key"]
 
     @test("create monitor")
     def _():
-        nonlocal monitor_id, monitor_key
-        mon = wp.create_monitor(
-            "SDK Test Monitor",
-            "https://httpbin.org/status/200",
-            is_public=True,
-            tags=["sdk-test", "ci"],
-            group_name="SDK Tests",
-        )
+        mon = setup["SDK Test Monitor"]
         assert "id" in mon, f"Missing id: {mon}"
         assert "manage_key" in mon, f"Missing manage_key: {mon}"
-        monitor_id = mon["id"]
-        monitor_key = mon["manage_key"]
-        created_monitors.append((monitor_id, monitor_key))
 
     @test("get monitor")
     def _():
         mon = wp.get_monitor(monitor_id)
         assert mon["name"] == "SDK Test Monitor", f"Wrong name: {mon['name']}"
-        assert mon["url"] == "https://httpbin.org/status/200"
+        assert mon["url"] == f"{HTTPBIN_URL}/status/200"
 
-    @test("list monitors includes created")
+    @test("get monitor as object")
     def _():
-        monitors = wp.list_monitors()
-        ids = [m["id"] for m in monitors]
-        assert monitor_id in ids, f"Monitor {monitor_id} not in list"
+        mon = wp.get_monitor(monitor_id, as_object=True)
+        assert isinstance(mon, Monitor), f"Expected Monitor: {type(mon)}"
+        assert mon.name == "SDK Test Monitor", f"Wrong name: {mon.name}"
+        assert not mon.is_paused
+        assert "sdk-test" in mon.tags
 
-    @test("update monitor name")
+    @test("Monitor records copy, pickle and hash by id")
     def _():
-        result = wp.update_monitor(monitor_id, monitor_key, name="SDK Renamed")
-        assert isinstance(result, dict), f"Expected dict: {result}"
-        # PATCH returns {"message": "Monitor updated"}, verify via GET
-        mon = wp.get_monitor(monitor_id)
-        assert mon["name"] == "SDK Renamed", f"Name not updated: {mon['name']}"
+        mon = Monitor.from_dict({"id": ZERO_UUID, "name": "Copy Probe", "tags": ["a"], "future_field": 1})
+        assert copy.copy(mon) is mon and copy.deepcopy(mon) is mon
+        restored = pickle.loads(pickle.dumps(mon))
+        assert restored == mon and restored.extra == {"future_field": 1}
+        assert hash(restored) == hash(mon) and len({mon, restored}) == 1
+        with expect_raises(AttributeError):
+            restored.name = "changed"
+
+    # One unfiltered listing shared by the list tests below; cleared by
+    # anything in this section that changes a monitor.
+    listed = {}
+
+    def listed_monitors():
+        if not listed:
+            listed.update((m.id, m) for m in wp.list_monitors(as_object=True))
+        return listed
 
-    @test("update monitor without key raises AuthError")
+    @test("list monitors as objects")
     def _():
-        try:
-            wp.update_monitor(monitor_id, "wrong-key", name="Bad Update")
-            assert False, "Expected AuthError"
-        except AuthError:
-            pass
+        assert all(isinstance(m, Monitor) for m in listed_monitors().values())
 
-    @test("get nonexistent monitor raises NotFoundError")
+    @test("list monitors includes created")
     def _():
-        try:
-            wp.get_monitor("00000000-0000-0000-0000-000000000000")
-            assert False, "Expected NotFoundError"
-        except NotFoundError:
-            pass
+        assert monitor_id in listed_monitors(), f"Monitor {monitor_id} not in list"
 
-    # ── Monitor with options ────────────────────────────────────────────
-    print("\nMonitor Options:")
+    @test("update monitor name")
+    def _():
+        # PATCH returns the updated monitor, no follow-up GET needed
+        mon = wp.update_monitor(monitor_id, monitor_key, name="SDK Renamed")
+        listed.clear()
+        assert mon["id"] == monitor_id, f"Unexpected response: {mon}"
+        assert mon["name"] == "SDK Renamed", f"Name not updated: {mon['name']}"
 
-    sla_monitor_id = None
-    sla_monitor_key = None
+    # ── Monitor with options ────────────────────────────────────────────
+    section("Monitor Options")
 
     @test("create monitor with SLA target")
     def _():
-        nonlocal sla_monitor_id, sla_monitor_key
-        mon = wp.create_monitor(
-            "SLA Test",
-            "https://httpbin.org/status/200",
-            is_public=True,
-            sla_target=99.9,
-            sla_period_days=30,
-            response_time_threshold_ms=5000,
-        )
-        sla_monitor_id = mon["id"]
-        sla_monitor_key = mon["manage_key"]
-        created_monitors.append((sla_monitor_id, sla_monitor_key))
+        mon = setup["SLA Test"]
+        assert mon.get("sla_target") == 99.9, f"SLA not set: {mon}"
 
     @test("create TCP monitor")
     def _():
-        mon = wp.create_monitor(
-            "TCP Test",
-            "httpbin.org:443",
-            monitor_type="tcp",
-            is_public=True,
-        )
-        created_monitors.append((mon["id"], mon["manage_key"]))
+        mon = setup["TCP Test"]
+        assert mon.get("monitor_type") == "tcp", f"Wrong type: {mon}"
 
     @test("create DNS monitor")
     def _():
-        mon = wp.create_monitor(
-            "DNS Test",
-            "httpbin.org",
-            monitor_type="dns",
-            dns_record_type="A",
-            is_public=True,
-        )
-        created_monitors.append((mon["id"], mon["manage_key"]))
+        mon = setup["DNS Test"]
+        assert mon.get("monitor_type") == "dns", f"Wrong type: {mon}"
 
     @test("create monitor with invalid URL raises ValidationError")
     def _():
-        try:
+        with expect_raises((ValidationError, WatchpostError)):
             wp.create_monitor("Bad", "not-a-url")
-            assert False, "Expected ValidationError"
-        except (ValidationError, WatchpostError):
-            pass
 
     # ── Pause / Resume ──────────────────────────────────────────────────
-    print("\nPause / Resume:")
+    section("Pause / Resume")
 
     @test("pause monitor")
     def _():
-        result = wp.pause_monitor(monitor_id, monitor_key)
-        # Verify pause took effect
-        mon = wp.get_monitor(monitor_id)
-        assert mon.get("is_paused") == True, f"Not paused: {mon}"
+        mon = wp.pause_monitor(monitor_id, monitor_key)
+        assert mon.get("is_paused") is True, f"Not paused: {mon}"
 
     @test("resume monitor")
     def _():
-        result = wp.resume_monitor(monitor_id, monitor_key)
-        mon = wp.get_monitor(monitor_id)
-        assert mon.get("is_paused") == False, f"Still paused: {mon}"
-
-    @test("pause without key raises AuthError")
-    def _():
-        try:
-            wp.pause_monitor(monitor_id, "wrong-key")
-            assert False, "Expected AuthError"
-        except AuthError:
-            pass
+        mon = wp.resume_monitor(monitor_id, monitor_key)
+        assert mon.get("is_paused") is False, f"Still paused: {mon}"
 
     # ── Heartbeats ──────────────────────────────────────────────────────
-    print("\nHeartbeats:")
-
-    @test("list heartbeats (may be empty)")
-    def _():
-        hb = wp.list_heartbeats(monitor_id)
-        assert isinstance(hb, (list, dict)), f"Unexpected type: {type(hb)}"
+    section("Heartbeats")
 
-    @test("list heartbeats with limit")
-    def _():
-        hb = wp.list_heartbeats(monitor_id, limit=5)
-        assert isinstance(hb, (list, dict)), f"Unexpected type: {type(hb)}"
+    with concurrent():
+        shape_tests([
+            ("list heartbeats (may be empty)", lambda: wp.list_heartbeats(monitor_id)),
+            ("list heartbeats with limit", lambda: wp.list_heartbeats(monitor_id, limit=5)),
+        ])
 
     # ── Uptime ──────────────────────────────────────────────────────────
-    print("\nUptime:")
-
-    @test("get uptime stats")
-    def _():
-        up = wp.get_uptime(monitor_id)
-        assert isinstance(up, dict), f"Unexpected type: {type(up)}"
+    section("Uptime")
 
-    @test("get uptime history per monitor")
-    def _():
-        hist = wp.get_uptime_history(monitor_id, days=7)
-        assert isinstance(hist, (list, dict)), f"Unexpected type: {type(hist)}"
+    with concurrent():
+        @test("get uptime stats")
+        def _():
+            up = wp.get_uptime(monitor_id)
+            assert isinstance(up, dict), f"Unexpected type: {type(up)}"
 
-    @test("get aggregate uptime history")
-    def _():
-        hist = wp.get_uptime_history(days=7)
-        assert isinstance(hist, (list, dict)), f"Unexpected type: {type(hist)}"
+        shape_tests([
+            ("get uptime history per monitor", lambda: wp.get_uptime_history(monitor_id, days=7)),
+            ("get aggregate uptime history", lambda: wp.get_uptime_history(days=7)),
+        ])
 
     # ── SLA ─────────────────────────────────────────────────────────────
-    print("\nSLA:")
+    section("SLA")
 
     @test("get SLA status")
     def _():
@@ -252,30 +613,21 @@ def main():
 
     @test("get SLA on monitor without target raises NotFoundError")
     def _():
-        # Create a monitor without SLA target
-        mon = wp.create_monitor("No SLA", "https://httpbin.org/status/200", is_public=True)
-        created_monitors.append((mon["id"], mon["manage_key"]))
-        try:
-            wp.get_sla(mon["id"])
-            assert False, "Expected NotFoundError for no SLA"
-        except (NotFoundError, WatchpostError):
-            pass
+        # The main monitor has no SLA target
+        with expect_raises((NotFoundError, WatchpostError)):
+            wp.get_sla(monitor_id)
 
     # ── Incidents ────────────────────────────────────────────────────────
-    print("\nIncidents:")
-
-    @test("list incidents (may be empty)")
-    def _():
-        inc = wp.list_incidents(monitor_id)
-        assert isinstance(inc, (list, dict)), f"Unexpected type: {type(inc)}"
+    section("Incidents")
 
-    @test("list incidents with limit")
-    def _():
-        inc = wp.list_incidents(monitor_id, limit=5)
-        assert isinstance(inc, (list, dict)), f"Unexpected type: {type(inc)}"
+    with concurrent():
+        shape_tests([
+            ("list incidents (may be empty)", lambda: wp.list_incidents(monitor_id)),
+            ("list incidents with limit", lambda: wp.list_incidents(monitor_id, limit=5)),
+        ])
 
     # ── Notifications ───────────────────────────────────────────────────
-    print("\nNotifications:")
+    section("Notifications")
 
     notif_id = None
 
@@ -286,7 +638,7 @@ def main():
             monitor_id,
             "Test Webhook",
             "webhook",
-            {"url": "https://httpbin.org/post"},
+            {"url": f"{HTTPBIN_URL}/post"},
             monitor_key,
         )
         assert "id" in notif, f"Missing id: {notif}"
@@ -300,7 +652,8 @@ def main():
     @test("update notification (disable)")
     def _():
         result = wp.update_notification(notif_id, monitor_key, is_enabled=False)
-        assert isinstance(result, dict)
+        assert result["id"] == notif_id, f"Unexpected: {result}"
+        assert result["is_enabled"] == False
 
     @test("delete notification")
     def _():
@@ -308,21 +661,13 @@ def main():
         # Verify it's gone
         notifs = wp.list_notifications(monitor_id, monitor_key)
         if isinstance(notifs, list):
-            ids = [n["id"] for n in notifs]
+            ids = {n["id"] for n in notifs}
         else:
-            ids = [n["id"] for n in notifs.get("notifications", notifs.get("items", []))]
+            ids = {n["id"] for n in notifs.get("notifications", notifs.get("items", []))}
         assert notif_id not in ids, "Notification still present"
 
-    @test("create notification without key raises AuthError")
-    def _():
-        try:
-            wp.create_notification(monitor_id, "Bad", "webhook", {"url": "http://x"}, "wrong")
-            assert False, "Expected AuthError"
-        except AuthError:
-            pass
-
     # ── Maintenance Windows ─────────────────────────────────────────────
-    print("\nMaintenance Windows:")
+    section("Maintenance Windows")
 
     maint_id = None
 
@@ -332,8 +677,8 @@ def main():
         m = wp.create_maintenance(
             monitor_id,
             "Deploy v2",
-            "2099-01-01T00:00:00Z",
-            "2099-01-01T01:00:00Z",
+            FUTURE_START,
+            FUTURE_END,
             monitor_key,
         )
         assert "id" in m, f"Missing id: {m}"
@@ -349,7 +694,7 @@ def main():
         wp.delete_maintenance(maint_id, monitor_key)
 
     # ── Alert Rules ─────────────────────────────────────────────────────
-    print("\nAlert Rules:")
+    section("Alert Rules")
 
     @test("set alert rules")
     def _():
@@ -375,27 +720,14 @@ def main():
     @test("delete alert rules")
     def _():
         wp.delete_alert_rules(monitor_id, monitor_key)
-        try:
+        with expect_raises(NotFoundError):
             wp.get_alert_rules(monitor_id, monitor_key)
-            assert False, "Expected NotFoundError"
-        except NotFoundError:
-            pass
 
     # ── Dependencies ────────────────────────────────────────────────────
-    print("\nDependencies:")
+    section("Dependencies")
 
-    dep_monitor_id = None
-    dep_monitor_key = None
     dep_id = None
 
-    @test("create dependency monitor (upstream)")
-    def _():
-        nonlocal dep_monitor_id, dep_monitor_key
-        mon = wp.create_monitor("Upstream DB", "https://httpbin.org/status/200", is_public=True)
-        dep_monitor_id = mon["id"]
-        dep_monitor_key = mon["manage_key"]
-        created_monitors.append((dep_monitor_id, dep_monitor_key))
-
     @test("add dependency")
     def _():
         nonlocal dep_id
@@ -415,87 +747,76 @@ def main():
 
     @test("self-dependency raises error")
     def _():
-        try:
+        with expect_raises((ConflictError, ValidationError, WatchpostError)):
             wp.add_dependency(monitor_id, monitor_id, monitor_key)
-            assert False, "Expected error for self-dependency"
-        except (ConflictError, ValidationError, WatchpostError):
-            pass
 
     @test("delete dependency")
     def _():
         wp.delete_dependency(monitor_id, dep_id, monitor_key)
 
     # ── Tags & Groups ───────────────────────────────────────────────────
-    print("\nTags & Groups:")
-
-    @test("list tags")
-    def _():
-        tags = wp.list_tags()
-        assert isinstance(tags, list), f"Expected list: {type(tags)}"
-
-    @test("list groups")
-    def _():
-        groups = wp.list_groups()
-        assert isinstance(groups, list), f"Expected list: {type(groups)}"
-
-    @test("filter monitors by tag")
-    def _():
-        monitors = wp.list_monitors(tag="sdk-test")
-        assert isinstance(monitors, list)
-
-    @test("filter monitors by group")
-    def _():
-        monitors = wp.list_monitors(group="SDK Tests")
-        assert isinstance(monitors, list)
-
-    @test("filter monitors by status")
-    def _():
-        monitors = wp.list_monitors(status="unknown")
-        assert isinstance(monitors, list)
-
-    @test("search monitors by name")
-    def _():
-        monitors = wp.list_monitors(search="SDK")
-        assert isinstance(monitors, list)
+    section("Tags & Groups")
+
+    with concurrent():
+        @test("list tags")
+        def _():
+            tags = wp.list_tags()
+            assert isinstance(tags, list), f"Expected list: {type(tags)}"
+
+        @test("list groups")
+        def _():
+            groups = wp.list_groups()
+            assert isinstance(groups, list), f"Expected list: {type(groups)}"
+
+        list_filters = [
+            ("filter monitors by tag", {"tag": "sdk-test"}),
+            ("filter monitors by group", {"group": "SDK Tests"}),
+            ("filter monitors by status", {"status": "unknown"}),
+            ("search monitors by name", {"search": "SDK"}),
+        ]
+        for what, filters in list_filters:
+            @test(what)
+            def _(filters=filters):
+                monitors = wp.list_monitors(**filters)
+                assert isinstance(monitors, list), f"Not a list for {filters}: {type(monitors)}"
 
     # ── Status / Dashboard ──────────────────────────────────────────────
-    print("\nStatus / Dashboard:")
+    section("Status / Dashboard")
 
-    @test("get public status page")
-    def _():
-        status = wp.get_status()
-        assert isinstance(status, dict)
+    with concurrent():
+        @test("get public status page")
+        def _():
+            status = wp.get_status()
+            assert isinstance(status, dict)
 
-    @test("get status filtered by tag")
-    def _():
-        status = wp.get_status(tag="sdk-test")
-        assert isinstance(status, dict)
+        @test("get status filtered by tag")
+        def _():
+            status = wp.get_status(tag="sdk-test")
+            assert isinstance(status, dict)
 
-    @test("get dashboard (no auth)")
-    def _():
-        dash = wp.get_dashboard()
-        assert isinstance(dash, dict)
+        @test("get dashboard (no auth)")
+        def _():
+            dash = wp.get_dashboard()
+            assert isinstance(dash, dict)
 
     # ── Badges ──────────────────────────────────────────────────────────
-    print("\nBadges:")
-
-    @test("get uptime badge SVG")
-    def _():
-        svg = wp.get_uptime_badge(monitor_id, period="24h")
-        assert "<svg" in svg, f"Not SVG: {svg[:100]}"
-
-    @test("get status badge SVG")
-    def _():
-        svg = wp.get_status_badge(monitor_id)
-        assert "<svg" in svg, f"Not SVG: {svg[:100]}"
-
-    @test("get badge with custom label")
-    def _():
-        svg = wp.get_uptime_badge(monitor_id, period="7d", label="My Service")
-        assert "<svg" in svg
+    section("Badges")
+
+    with concurrent():
+        badges = [
+            ("get uptime badge SVG", lambda: wp.get_uptime_badge(monitor_id, period="24h", raw=True)),
+            ("get status badge SVG", lambda: wp.get_status_badge(monitor_id, raw=True)),
+            ("get badge with custom label",
+             lambda: wp.get_uptime_badge(monitor_id, period="7d", label="My Service", raw=True)),
+        ]
+        for what, fetch in badges:
+            @test(what)
+            def _(fetch=fetch):
+                svg = fetch()
+                assert svg.startswith(b"<svg"), f"Not SVG: {svg[:100]!r}"
 
     # ── Export ──────────────────────────────────────────────────────────
-    print("\nExport:")
+    section("Export")
 
     @test("export monitor config")
     def _():
@@ -503,32 +824,18 @@ def main():
         assert isinstance(config, dict)
         assert "name" in config or "url" in config
 
-    @test("export without auth raises error")
-    def _():
-        try:
-            wp.export_monitor(monitor_id, "wrong-key")
-            assert False, "Expected AuthError"
-        except AuthError:
-            pass
-
     # ── Bulk Operations ─────────────────────────────────────────────────
-    print("\nBulk Operations:")
+    section("Bulk Operations")
 
     @test("bulk create monitors")
     def _():
-        result = wp.bulk_create_monitors([
-            {"name": "Bulk A", "url": "https://httpbin.org/status/200", "is_public": True},
-            {"name": "Bulk B", "url": "https://httpbin.org/status/201", "is_public": True},
-        ])
-        assert "succeeded" in result or "created" in result, f"Unexpected: {result}"
-        # Track for cleanup
-        if "created" in result:
-            for m in result["created"]:
-                if "id" in m and "manage_key" in m:
-                    created_monitors.append((m["id"], m["manage_key"]))
+        # Created by the fixture bulk request at the top of the run
+        for name in ("Bulk A", "Bulk B"):
+            mon = setup[name]
+            assert "id" in mon and "manage_key" in mon, f"Unexpected: {mon}"
 
     # ── Status Pages ────────────────────────────────────────────────────
-    print("\nStatus Pages:")
+    section("Status Pages")
 
     page_key = None
 
@@ -542,7 +849,7 @@ def main():
         )
         assert "manage_key" in page, f"Missing manage_key: {page}"
         page_key = page["manage_key"]
-        created_pages.append(("sdk-test-page", page_key))
+        created_pages["sdk-test-page"] = page_key
 
     @test("list status pages")
     def _():
@@ -576,18 +883,19 @@ def main():
     @test("delete status page")
     def _():
         wp.delete_status_page("sdk-test-page", page_key)
-        created_pages.clear()
+        del created_pages["sdk-test-page"]
 
     # ── Settings ────────────────────────────────────────────────────────
-    print("\nSettings:")
+    section("Settings")
 
-    @test("get settings")
-    def _():
-        settings = wp.get_settings()
-        assert isinstance(settings, dict)
+    with concurrent():
+        @test("get settings")
+        def _():
+            settings = wp.get_settings()
+            assert isinstance(settings, dict)
 
     # ── Convenience Helpers ─────────────────────────────────────────────
-    print("\nConvenience Helpers:")
+    section("Convenience Helpers")
 
     @test("is_up returns bool")
     def _():
@@ -608,133 +916,98 @@ def main():
 
     @test("quick_monitor creates and returns key")
     def _():
-        mon = wp.quick_monitor("Quick Test", "https://httpbin.org/status/200")
+        mon = wp.quick_monitor("Quick Test", f"{HTTPBIN_URL}/status/200")
         assert "manage_key" in mon
-        created_monitors.append((mon["id"], mon["manage_key"]))
+        created_monitors[mon["id"]] = mon["manage_key"]
 
     # ── Webhook Deliveries ──────────────────────────────────────────────
-    print("\nWebhook Deliveries:")
-
-    @test("list webhook deliveries (may be empty)")
-    def _():
-        deliveries = wp.list_webhook_deliveries(monitor_id, monitor_key)
-        assert isinstance(deliveries, dict)
-
-    @test("list deliveries with filters")
-    def _():
-        deliveries = wp.list_webhook_deliveries(
-            monitor_id, monitor_key, limit=10, status="success"
-        )
-        assert isinstance(deliveries, dict)
+    section("Webhook Deliveries")
+
+    with concurrent():
+        @test("list webhook deliveries (may be empty)")
+        def _():
+            deliveries = wp.list_webhook_deliveries(monitor_id, monitor_key)
+            assert isinstance(deliveries, dict)
+
+        @test("list deliveries with filters")
+        def _():
+            deliveries = wp.list_webhook_deliveries(
+                monitor_id, monitor_key, limit=10, status="success"
+            )
+            assert isinstance(deliveries, dict)
 
     # ── Monitor Update Advanced Fields ─────────────────────────────────
-    print("\nMonitor Update (Advanced Fields):")
-
-    @test("update monitor tags")
-    def _():
-        wp.update_monitor(monitor_id, monitor_key, tags=["updated-tag", "sdk"])
-        mon = wp.get_monitor(monitor_id)
-        tags = mon.get("tags", [])
-        assert "updated-tag" in tags, f"Tag not set: {tags}"
+    section("Monitor Update (Advanced Fields)")
 
-    @test("update monitor group_name")
+    @test("update advanced fields in one PATCH")
     def _():
-        wp.update_monitor(monitor_id, monitor_key, group_name="Updated Group")
-        mon = wp.get_monitor(monitor_id)
+        mon = wp.update_monitor(
+            monitor_id, monitor_key,
+            tags=["updated-tag", "sdk"],
+            group_name="Updated Group",
+            follow_redirects=False,
+            sla_target=99.5,
+            sla_period_days=7,
+            response_time_threshold_ms=3000,
+            confirmation_threshold=3,
+            interval_seconds=1200,
+            timeout_ms=15000,
+        )
+        assert "updated-tag" in mon.get("tags", []), f"Tag not set: {mon.get('tags')}"
         assert mon.get("group_name") == "Updated Group", f"Group not set: {mon.get('group_name')}"
-
-    @test("update monitor follow_redirects")
-    def _():
-        wp.update_monitor(monitor_id, monitor_key, follow_redirects=False)
-        mon = wp.get_monitor(monitor_id)
         assert mon.get("follow_redirects") == False, f"follow_redirects not updated"
-
-    @test("update monitor SLA target")
-    def _():
-        wp.update_monitor(monitor_id, monitor_key, sla_target=99.5, sla_period_days=7)
-        mon = wp.get_monitor(monitor_id)
         assert mon.get("sla_target") == 99.5, f"SLA not set: {mon.get('sla_target')}"
-
-    @test("update monitor response_time_threshold_ms")
-    def _():
-        wp.update_monitor(monitor_id, monitor_key, response_time_threshold_ms=3000)
-        mon = wp.get_monitor(monitor_id)
         assert mon.get("response_time_threshold_ms") == 3000
-
-    @test("update monitor is_public to false and back")
-    def _():
-        wp.update_monitor(monitor_id, monitor_key, is_public=False)
-        # Monitor may not appear in public list now
-        wp.update_monitor(monitor_id, monitor_key, is_public=True)
-        mon = wp.get_monitor(monitor_id)
-        assert mon.get("is_public") == True
-
-    @test("update monitor confirmation_threshold")
-    def _():
-        wp.update_monitor(monitor_id, monitor_key, confirmation_threshold=3)
-        mon = wp.get_monitor(monitor_id)
         assert mon.get("confirmation_threshold") == 3
-
-    @test("update monitor interval_seconds")
-    def _():
-        wp.update_monitor(monitor_id, monitor_key, interval_seconds=1200)
-        mon = wp.get_monitor(monitor_id)
         assert mon.get("interval_seconds") == 1200
+        assert mon.get("timeout_ms") == 15000
 
-    @test("update monitor timeout_ms")
+    @test("update monitor is_public to false and back")
     def _():
-        wp.update_monitor(monitor_id, monitor_key, timeout_ms=15000)
-        mon = wp.get_monitor(monitor_id)
-        assert mon.get("timeout_ms") == 15000
+        mon = wp.update_monitor(monitor_id, monitor_key, is_public=False)
+        assert mon.get("is_public") == False
+        mon = wp.update_monitor(monitor_id, monitor_key, is_public=True)
+        assert mon.get("is_public") == True
 
     # ── Heartbeat Cursor Pagination ─────────────────────────────────────
-    print("\nHeartbeat Cursor Pagination:")
-
-    @test("heartbeats default returns list")
-    def _():
-        hb = wp.list_heartbeats(monitor_id)
-        assert isinstance(hb, (list, dict)), f"Unexpected: {type(hb)}"
+    section("Heartbeat Cursor Pagination")
 
-    @test("heartbeats with after=0 cursor")
-    def _():
-        hb = wp.list_heartbeats(monitor_id, after=0)
-        assert isinstance(hb, (list, dict))
+    with concurrent():
+        shape_tests([
+            ("heartbeats default returns list", lambda: wp.list_heartbeats(monitor_id)),
+            ("heartbeats with after=0 cursor", lambda: wp.list_heartbeats(monitor_id, after=0)),
+        ])
 
-    @test("heartbeats with limit=1")
-    def _():
-        hb = wp.list_heartbeats(monitor_id, limit=1)
-        items = hb if isinstance(hb, list) else hb.get("heartbeats", hb.get("items", []))
-        assert len(items) <= 1
+        @test("heartbeats with limit=1")
+        def _():
+            hb = wp.list_heartbeats(monitor_id, limit=1)
+            items = hb if isinstance(hb, list) else hb.get("heartbeats", hb.get("items", []))
+            assert len(items) <= 1
 
     # ── Monitor List Combined Filters ───────────────────────────────────
-    print("\nMonitor List (Combined Filters):")
-
-    @test("list monitors with search + tag")
-    def _():
-        monitors = wp.list_monitors(search="SDK", tag="updated-tag")
-        assert isinstance(monitors, list)
-
-    @test("list monitors with search + status")
-    def _():
-        monitors = wp.list_monitors(search="SDK", status="unknown")
-        assert isinstance(monitors, list)
-
-    @test("list monitors with group + status")
-    def _():
-        monitors = wp.list_monitors(group="Updated Group", status="unknown")
-        assert isinstance(monitors, list)
-
-    @test("list monitors returns expected fields")
-    def _():
-        monitors = wp.list_monitors()
-        if monitors:
-            m = monitors[0]
+    section("Monitor List (Combined Filters)")
+
+    @test("list monitors filter matrix")
+    async def _():
+        filters = [
+            {"search": "SDK", "tag": "updated-tag"},
+            {"search": "SDK", "status": "unknown"},
+            {"group": "Updated Group", "status": "unknown"},
+            {},
+        ]
+        async with AsyncWatchpost(client=wp) as awp:
+            results = await asyncio.gather(*(awp.list_monitors(**f) for f in filters))
+        for f, monitors in zip(filters, results):
+            assert isinstance(monitors, list), f"Not a list for {f}: {type(monitors)}"
+        unfiltered = results[-1]
+        if unfiltered:
+            m = unfiltered[0]
             assert "id" in m, f"Missing id field"
             assert "name" in m, f"Missing name field"
             assert "url" in m, f"Missing url field"
 
     # ── Status Page Full Lifecycle ──────────────────────────────────────
-    print("\nStatus Page (Full Lifecycle):")
+    section("Status Page (Full Lifecycle)")
 
     page2_key = None
 
@@ -749,7 +1022,7 @@ def main():
         )
         assert "manage_key" in page
         page2_key = page["manage_key"]
-        created_pages.append(("sdk-lifecycle-test", page2_key))
+        created_pages["sdk-lifecycle-test"] = page2_key
 
     @test("add multiple monitors to status page")
     def _():
@@ -772,8 +1045,7 @@ def main():
 
     @test("update status page description")
     def _():
-        wp.update_status_page("sdk-lifecycle-test", page2_key, description="Updated desc")
-        page = wp.get_status_page("sdk-lifecycle-test")
+        page = wp.update_status_page("sdk-lifecycle-test", page2_key, description="Updated desc")
         assert page.get("description") == "Updated desc", f"Desc: {page.get('description')}"
 
     @test("remove one monitor from page")
@@ -781,175 +1053,174 @@ def main():
         wp.remove_monitor_from_page("sdk-lifecycle-test", sla_monitor_id, page2_key)
         monitors = wp.list_page_monitors("sdk-lifecycle-test")
         if isinstance(monitors, list):
-            ids = [m.get("id") or m.get("monitor_id") for m in monitors]
+            ids = {m.get("id") or m.get("monitor_id") for m in monitors}
             assert sla_monitor_id not in ids, "Monitor not removed"
 
-    @test("create status page with duplicate slug raises error")
-    def _():
-        try:
-            wp.create_status_page("sdk-lifecycle-test", "Duplicate")
-            assert False, "Expected error for duplicate slug"
-        except (ConflictError, ValidationError, WatchpostError):
-            pass
+    # Rejected requests leave the page untouched, so these run together
+    with concurrent():
+        @test("create status page with duplicate slug raises error")
+        def _():
+            with expect_raises((ConflictError, ValidationError, WatchpostError)):
+                wp.create_status_page("sdk-lifecycle-test", "Duplicate")
 
-    @test("get nonexistent status page raises NotFoundError")
-    def _():
-        try:
-            wp.get_status_page("nonexistent-slug-xyz")
-            assert False, "Expected NotFoundError"
-        except NotFoundError:
-            pass
+        @test("get nonexistent status page raises NotFoundError")
+        def _():
+            with expect_raises(NotFoundError):
+                wp.get_status_page("nonexistent-slug-xyz")
 
-    @test("update status page without key raises AuthError")
-    def _():
-        try:
-            wp.update_status_page("sdk-lifecycle-test", "wrong-key", title="Hack")
-            assert False, "Expected AuthError"
-        except AuthError:
-            pass
+        @test("update status page without key raises AuthError")
+        def _():
+            with expect_raises(AuthError):
+                wp.update_status_page("sdk-lifecycle-test", "wrong-key", title="Hack")
 
-    @test("delete status page with wrong key raises AuthError")
-    def _():
-        try:
-            wp.delete_status_page("sdk-lifecycle-test", "wrong-key")
-            assert False, "Expected AuthError"
-        except AuthError:
-            pass
+        @test("delete status page with wrong key raises AuthError")
+        def _():
+            with expect_raises(AuthError):
+                wp.delete_status_page("sdk-lifecycle-test", "wrong-key")
 
     # cleanup lifecycle page
     @test("delete status page (lifecycle)")
     def _():
         wp.delete_status_page("sdk-lifecycle-test", page2_key)
-        created_pages.remove(("sdk-lifecycle-test", page2_key))
+        del created_pages["sdk-lifecycle-test"]
 
     # ── Dashboard Auth Variants ─────────────────────────────────────────
-    print("\nDashboard (Auth Variants):")
+    section("Dashboard (Auth Variants)")
 
-    @test("dashboard without auth returns aggregate stats")
-    def _():
-        dash = wp.get_dashboard()
-        assert "total" in dash or "monitors" in dash or isinstance(dash, dict)
+    with concurrent():
+        @test("dashboard without auth returns aggregate stats")
+        def _():
+            dash = wp.get_dashboard()
+            assert "total" in dash or "monitors" in dash or isinstance(dash, dict)
 
-    @test("dashboard with wrong auth still returns data")
-    def _():
-        # Dashboard with key may include more detail (recent incidents, slowest)
-        dash = wp.get_dashboard(key="invalid-key")
-        assert isinstance(dash, dict)
+        @test("dashboard with wrong auth still returns data")
+        def _():
+            # Dashboard with key may include more detail (recent incidents, slowest)
+            dash = wp.get_dashboard(key="invalid-key")
+            assert isinstance(dash, dict)
 
-    @test("dashboard with monitor key returns data")
-    def _():
-        dash = wp.get_dashboard(key=monitor_key)
-        assert isinstance(dash, dict)
+        @test("dashboard with monitor key returns data")
+        def _():
+            dash = wp.get_dashboard(key=monitor_key)
+            assert isinstance(dash, dict)
 
     # ── Admin Verify ────────────────────────────────────────────────────
-    print("\nAdmin Verify:")
-
-    @test("verify_admin with wrong key returns valid=false")
-    def _():
-        result = wp.verify_admin("definitely-wrong-key")
-        assert result.get("valid") == False, f"Expected valid=false: {result}"
-
-    @test("verify_admin with monitor key returns valid=false")
-    def _():
-        result = wp.verify_admin(monitor_key)
-        assert result.get("valid") == False, f"Monitor key should not be admin key"
+    section("Admin Verify")
+
+    with concurrent():
+        @test("verify_admin with wrong key returns valid=false")
+        def _():
+            result = wp.verify_admin("definitely-wrong-key")
+            assert result.get("valid") == False, f"Expected valid=false: {result}"
+
+        @test("verify_admin with monitor key returns valid=false")
+        def _():
+            result = wp.verify_admin(monitor_key)
+            assert result.get("valid") == False, f"Monitor key should not be admin key"
+
+    # ── Auth Rejections ─────────────────────────────────────────────────
+    section("Auth Rejections")
+
+    # Keyed operations on the main monitor, each sent with a key that isn't
+    # its manage key. They are rejected before any state changes, so they
+    # can all run at once.
+    auth_probes = [
+        ("update monitor", lambda k: wp.update_monitor(monitor_id, k, name="Bad Update")),
+        ("pause monitor", lambda k: wp.pause_monitor(monitor_id, k)),
+        ("export monitor", lambda k: wp.export_monitor(monitor_id, k)),
+        ("create notification", lambda k: wp.create_notification(monitor_id, "Bad", "webhook", {"url": "http://x"}, k)),
+        ("get alert rules", lambda k: wp.get_alert_rules(monitor_id, k)),
+        ("add dependency", lambda k: wp.add_dependency(monitor_id, dep_monitor_id, k)),
+        ("create maintenance", lambda k: wp.create_maintenance(
+            monitor_id, "Unauth", "2099-06-01T00:00:00Z", "2099-06-01T01:00:00Z", k,
+        )),
+    ]
+
+    with concurrent():
+        for what, call in auth_probes:
+            @test(f"{what} with wrong key raises AuthError")
+            def _(call=call):
+                with expect_raises(AuthError):
+                    call("wrong-key")
 
     # ── Settings (auth-gated) ───────────────────────────────────────────
-    print("\nSettings (Auth-Gated):")
-
-    @test("get settings returns dict with expected fields")
-    def _():
-        settings = wp.get_settings()
-        assert isinstance(settings, dict)
-        # Settings should have title, description, logo_url (even if null)
-        for k in ("title", "description", "logo_url"):
-            assert k in settings, f"Missing settings field: {k}"
-
-    @test("update settings with wrong key raises AuthError")
-    def _():
-        try:
-            wp.update_settings("wrong-admin-key", title="Hacked")
-            assert False, "Expected AuthError"
-        except AuthError:
-            pass
+    section("Settings (Auth-Gated)")
+
+    with concurrent():
+        @test("get settings returns dict with expected fields")
+        def _():
+            settings = wp.get_settings()
+            assert isinstance(settings, dict)
+            # Settings should have title, description, logo_url (even if null)
+            for k in ("title", "description", "logo_url"):
+                assert k in settings, f"Missing settings field: {k}"
+
+        @test("update settings with wrong key raises AuthError")
+        def _():
+            with expect_raises(AuthError):
+                wp.update_settings("wrong-admin-key", title="Hacked")
 
     # ── Location Management (auth-gated) ────────────────────────────────
-    print("\nLocations (Auth-Gated):")
+    section("Locations (Auth-Gated)")
 
-    @test("list locations (public)")
-    def _():
-        locs = wp.list_locations()
-        assert isinstance(locs, list)
+    with concurrent():
+        @test("list locations (public)")
+        def _():
+            locs = wp.list_locations()
+            assert isinstance(locs, list)
 
-    @test("create location with wrong key raises AuthError")
-    def _():
-        try:
-            wp.create_location("Test Probe", "us-east", "wrong-admin-key")
-            assert False, "Expected AuthError"
-        except AuthError:
-            pass
+        @test("create location with wrong key raises AuthError")
+        def _():
+            with expect_raises(AuthError):
+                wp.create_location("Test Probe", "us-east", "wrong-admin-key")
 
-    @test("delete location with wrong key raises AuthError")
-    def _():
-        try:
-            wp.delete_location("00000000-0000-0000-0000-000000000000", "wrong-key")
-            assert False, "Expected AuthError or NotFoundError"
-        except (AuthError, NotFoundError):
-            pass
+        @test("delete location with wrong key raises AuthError")
+        def _():
+            with expect_raises((AuthError, NotFoundError)):
+                wp.delete_location(ZERO_UUID, "wrong-key")
 
-    @test("get location nonexistent raises NotFoundError")
-    def _():
-        try:
-            wp.get_location("00000000-0000-0000-0000-000000000000")
-            assert False, "Expected NotFoundError"
-        except NotFoundError:
-            pass
+        @test("get location nonexistent raises NotFoundError")
+        def _():
+            with expect_raises(NotFoundError):
+                wp.get_location(ZERO_UUID)
 
     # ── Probe Submission (auth-gated) ───────────────────────────────────
-    print("\nProbe Submission:")
-
-    @test("submit probe with wrong key raises AuthError")
-    def _():
-        try:
-            wp.submit_probe("wrong-probe-key", [{
-                "monitor_id": monitor_id,
-                "status": "up",
-                "response_time_ms": 100,
-            }])
-            assert False, "Expected AuthError"
-        except AuthError:
-            pass
-
-    @test("get location status for monitor (may be empty)")
-    def _():
-        locs = wp.get_location_status(monitor_id)
-        assert isinstance(locs, (list, dict))
-
-    @test("get consensus for monitor without consensus config")
-    def _():
-        try:
-            result = wp.get_consensus(monitor_id)
-            # May return data or error depending on config
-            assert isinstance(result, dict)
-        except (ValidationError, WatchpostError):
-            pass  # Expected if no consensus_threshold set
+    section("Probe Submission")
+
+    with concurrent():
+        @test("submit probe with wrong key raises AuthError")
+        def _():
+            with expect_raises(AuthError):
+                wp.submit_probe("wrong-probe-key", [{
+                    "monitor_id": monitor_id,
+                    "status": "up",
+                    "response_time_ms": 100,
+                }])
+
+        @test("get location status for monitor (may be empty)")
+        def _():
+            locs = wp.get_location_status(monitor_id)
+            assert isinstance(locs, (list, dict))
+
+        @test("get consensus for monitor without consensus config")
+        def _():
+            # Raises if no consensus_threshold is set, which is also fine
+            with contextlib.suppress(WatchpostError):
+                result = wp.get_consensus(monitor_id)
+                assert isinstance(result, dict)
 
     # ── Alert Rule Validation ───────────────────────────────────────────
-    print("\nAlert Rule Validation:")
+    section("Alert Rule Validation")
 
     @test("set alert rules with minimum valid values")
     def _():
+        # The PUT returns the stored rules, so no follow-up GET is needed
         rules = wp.set_alert_rules(
             monitor_id, monitor_key,
             repeat_interval_minutes=5,
             max_repeats=1,
             escalation_after_minutes=5,
         )
-        assert isinstance(rules, dict)
-
-    @test("get alert rules after setting")
-    def _():
-        rules = wp.get_alert_rules(monitor_id, monitor_key)
         assert rules.get("repeat_interval_minutes") == 5
         assert rules.get("max_repeats") == 1
 
@@ -961,27 +1232,14 @@ def main():
             max_repeats=10,
             escalation_after_minutes=60,
         )
-        assert isinstance(rules, dict)
-        rules = wp.get_alert_rules(monitor_id, monitor_key)
         assert rules.get("repeat_interval_minutes") == 30
         assert rules.get("max_repeats") == 10
 
-    @test("get alert rules without key raises AuthError")
-    def _():
-        try:
-            wp.get_alert_rules(monitor_id, "wrong-key")
-            assert False, "Expected AuthError"
-        except AuthError:
-            pass
-
     @test("delete alert rules and verify gone")
     def _():
         wp.delete_alert_rules(monitor_id, monitor_key)
-        try:
+        with expect_raises(NotFoundError):
             wp.get_alert_rules(monitor_id, monitor_key)
-            assert False, "Expected NotFoundError"
-        except NotFoundError:
-            pass
 
     @test("list alert log (empty after rule deletion)")
     def _():
@@ -989,18 +1247,14 @@ def main():
         assert isinstance(log, (list, dict))
 
     # ── Dependencies (Advanced) ─────────────────────────────────────────
-    print("\nDependencies (Advanced):")
+    section("Dependencies (Advanced)")
 
-    dep2_id = None
-    dep2_key = None
+    dep2_id = setup.get("Dep Chain A", {}).get("id")
 
     @test("create second dependency monitor")
     def _():
-        nonlocal dep2_id, dep2_key
-        mon = wp.create_monitor("Dep Chain A", "https://httpbin.org/status/200", is_public=True)
-        dep2_id = mon["id"]
-        dep2_key = mon["manage_key"]
-        created_monitors.append((dep2_id, dep2_key))
+        # Created by the fixture bulk request at the top of the run
+        assert dep2_id, "Dep Chain A fixture missing"
 
     @test("add dependency and verify in list")
     def _():
@@ -1017,19 +1271,8 @@ def main():
 
     @test("duplicate dependency raises ConflictError")
     def _():
-        try:
+        with expect_raises((ConflictError, ValidationError, WatchpostError)):
             wp.add_dependency(monitor_id, dep2_id, monitor_key)
-            assert False, "Expected ConflictError for duplicate"
-        except (ConflictError, ValidationError, WatchpostError):
-            pass
-
-    @test("add dependency without key raises AuthError")
-    def _():
-        try:
-            wp.add_dependency(monitor_id, dep2_id, "wrong-key")
-            assert False, "Expected AuthError"
-        except AuthError:
-            pass
 
     @test("cleanup dependencies")
     def _():
@@ -1044,47 +1287,33 @@ def main():
                         pass
 
     # ── Maintenance Window (Advanced) ───────────────────────────────────
-    print("\nMaintenance Window (Advanced):")
-
-    @test("create maintenance window in the past (should work)")
-    def _():
-        m = wp.create_maintenance(
-            monitor_id, "Past Maint",
-            "2020-01-01T00:00:00Z", "2020-01-01T01:00:00Z",
-            monitor_key,
-        )
-        assert "id" in m
-        # Clean up
-        wp.delete_maintenance(m["id"], monitor_key)
-
-    @test("create maintenance without key raises AuthError")
-    def _():
-        try:
-            wp.create_maintenance(
-                monitor_id, "Unauth",
-                "2099-06-01T00:00:00Z", "2099-06-01T01:00:00Z",
-                "wrong-key",
+    section("Maintenance Window (Advanced)")
+
+    with concurrent():
+        @test("create maintenance window in the past (should work)")
+        def _():
+            m = wp.create_maintenance(
+                monitor_id, "Past Maint",
+                "2020-01-01T00:00:00Z", "2020-01-01T01:00:00Z",
+                monitor_key,
             )
-            assert False, "Expected AuthError"
-        except AuthError:
-            pass
+            assert "id" in m
+            # Clean up
+            wp.delete_maintenance(m["id"], monitor_key)
 
-    @test("delete nonexistent maintenance raises NotFoundError")
-    def _():
-        try:
-            wp.delete_maintenance("00000000-0000-0000-0000-000000000000", monitor_key)
-            assert False, "Expected NotFoundError"
-        except NotFoundError:
-            pass
+        @test("delete nonexistent maintenance raises NotFoundError")
+        def _():
+            with expect_raises(NotFoundError):
+                wp.delete_maintenance(ZERO_UUID, monitor_key)
 
-    @test("list maintenance returns list")
-    def _():
-        mw = wp.list_maintenance(monitor_id)
-        # Should be a list (possibly empty if we cleaned up the earlier one)
-        assert isinstance(mw, (list, dict))
+        @test("list maintenance returns list")
+        def _():
+            mw = wp.list_maintenance(monitor_id)
+            # Should be a list (possibly empty if we cleaned up the earlier one)
+            assert isinstance(mw, (list, dict))
 
     # ── Notification Advanced ───────────────────────────────────────────
-    print("\nNotification (Advanced):")
+    section("Notification (Advanced)")
 
     notif2_id = None
 
@@ -1093,7 +1322,7 @@ def main():
         nonlocal notif2_id
         notif = wp.create_notification(
             monitor_id, "Chat Hook", "webhook",
-            {"url": "https://httpbin.org/post", "payload_format": "chat"},
+            {"url": f"{HTTPBIN_URL}/post", "payload_format": "chat"},
             monitor_key,
         )
         assert "id" in notif
@@ -1101,12 +1330,9 @@ def main():
 
     @test("update notification name and verify")
     def _():
-        wp.update_notification(notif2_id, monitor_key, name="Renamed Hook")
-        notifs = wp.list_notifications(monitor_id, monitor_key)
-        items = notifs if isinstance(notifs, list) else notifs.get("notifications", notifs.get("items", []))
-        found = [n for n in items if n["id"] == notif2_id]
-        assert len(found) == 1
-        assert found[0]["name"] == "Renamed Hook"
+        notif = wp.update_notification(notif2_id, monitor_key, name="Renamed Hook")
+        assert notif["id"] == notif2_id
+        assert notif["name"] == "Renamed Hook"
 
     @test("create email notification")
     def _():
@@ -1125,40 +1351,31 @@ def main():
 
     @test("delete nonexistent notification raises error")
     def _():
-        try:
-            wp.delete_notification("00000000-0000-0000-0000-000000000000", monitor_key)
-            assert False, "Expected NotFoundError"
-        except (NotFoundError, WatchpostError):
-            pass
+        with expect_raises((NotFoundError, WatchpostError)):
+            wp.delete_notification(ZERO_UUID, monitor_key)
 
     # ── Webhook Deliveries (Advanced) ───────────────────────────────────
-    print("\nWebhook Deliveries (Advanced):")
+    section("Webhook Deliveries (Advanced)")
 
-    @test("list deliveries with event filter")
-    def _():
-        d = wp.list_webhook_deliveries(monitor_id, monitor_key, event="incident.created")
-        assert isinstance(d, dict)
+    with concurrent():
+        delivery_filters = [
+            ("list deliveries with event filter", {"event": "incident.created"}),
+            ("list deliveries with status filter", {"status": "failed"}),
+            ("list deliveries with cursor pagination", {"after": 0, "limit": 5}),
+        ]
+        for what, filters in delivery_filters:
+            @test(what)
+            def _(filters=filters):
+                d = wp.list_webhook_deliveries(monitor_id, monitor_key, **filters)
+                assert isinstance(d, dict), f"Not a dict for {filters}: {type(d)}"
 
-    @test("list deliveries with status filter")
-    def _():
-        d = wp.list_webhook_deliveries(monitor_id, monitor_key, status="failed")
-        assert isinstance(d, dict)
-
-    @test("list deliveries with cursor pagination")
-    def _():
-        d = wp.list_webhook_deliveries(monitor_id, monitor_key, after=0, limit=5)
-        assert isinstance(d, dict)
-
-    @test("list deliveries without key raises AuthError")
-    def _():
-        try:
-            wp.list_webhook_deliveries(monitor_id, "wrong-key")
-            assert False, "Expected AuthError"
-        except AuthError:
-            pass
+        @test("list deliveries without key raises AuthError")
+        def _():
+            with expect_raises(AuthError):
+                wp.list_webhook_deliveries(monitor_id, "wrong-key")
 
     # ── Export/Import Roundtrip ──────────────────────────────────────────
-    print("\nExport/Import:")
+    section("Export/Import")
 
     @test("export monitor config and verify fields")
     def _():
@@ -1178,150 +1395,134 @@ def main():
         if isinstance(result, dict) and "created" in result:
             for m in result["created"]:
                 if "id" in m and "manage_key" in m:
-                    created_monitors.append((m["id"], m["manage_key"]))
+                    created_monitors[m["id"]] = m["manage_key"]
         assert result.get("succeeded", 0) >= 1 or len(result.get("created", [])) >= 1
 
     # ── Bulk Create Edge Cases ──────────────────────────────────────────
-    print("\nBulk Create (Edge Cases):")
-
-    @test("bulk create with one valid and one invalid")
-    def _():
-        result = wp.bulk_create_monitors([
-            {"name": "Bulk Valid", "url": "https://httpbin.org/status/200", "is_public": True},
-            {"name": "Bulk Invalid", "url": "no-scheme"},
-        ])
-        assert isinstance(result, dict)
-        # Should have partial success
-        if "created" in result:
-            for m in result["created"]:
-                if "id" in m and "manage_key" in m:
-                    created_monitors.append((m["id"], m["manage_key"]))
-
-    @test("bulk create empty list")
-    def _():
-        try:
-            result = wp.bulk_create_monitors([])
-            # May succeed with 0 created or may error
+    section("Bulk Create (Edge Cases)")
+
+    with concurrent():
+        @test("bulk create with one valid and one invalid")
+        def _():
+            result = wp.bulk_create_monitors([
+                {"name": "Bulk Valid", "url": f"{HTTPBIN_URL}/status/200", "is_public": True},
+                {"name": "Bulk Invalid", "url": "no-scheme"},
+            ])
             assert isinstance(result, dict)
-        except (ValidationError, WatchpostError):
-            pass  # Some APIs reject empty arrays
+            # Should have partial success
+            if "created" in result:
+                for m in result["created"]:
+                    if "id" in m and "manage_key" in m:
+                        created_monitors[m["id"]] = m["manage_key"]
+
+        @test("bulk create empty list")
+        def _():
+            # May succeed with 0 created, or reject the empty array
+            with contextlib.suppress(WatchpostError):
+                result = wp.bulk_create_monitors([])
+                assert isinstance(result, dict)
 
     # ── Incidents (Advanced) ────────────────────────────────────────────
-    print("\nIncidents (Advanced):")
+    section("Incidents (Advanced)")
 
-    @test("list incidents with cursor pagination")
-    def _():
-        inc = wp.list_incidents(monitor_id, after=0, limit=5)
-        assert isinstance(inc, (list, dict))
+    with concurrent():
+        @test("list incidents with cursor pagination")
+        def _():
+            inc = wp.list_incidents(monitor_id, after=0, limit=5)
+            assert isinstance(inc, (list, dict))
 
-    @test("list incidents for nonexistent monitor raises NotFoundError")
-    def _():
-        try:
-            wp.list_incidents("00000000-0000-0000-0000-000000000000")
-            assert False, "Expected NotFoundError"
-        except NotFoundError:
-            pass
+        @test("list incidents for nonexistent monitor raises NotFoundError")
+        def _():
+            with expect_raises(NotFoundError):
+                wp.list_incidents(ZERO_UUID)
 
-    @test("get nonexistent incident raises NotFoundError")
-    def _():
-        try:
-            wp.get_incident("00000000-0000-0000-0000-000000000000")
-            assert False, "Expected NotFoundError"
-        except NotFoundError:
-            pass
+        @test("get nonexistent incident raises NotFoundError")
+        def _():
+            with expect_raises(NotFoundError):
+                wp.get_incident(ZERO_UUID)
 
-    @test("acknowledge nonexistent incident raises NotFoundError")
-    def _():
-        try:
-            wp.acknowledge_incident("00000000-0000-0000-0000-000000000000", monitor_key)
-            assert False, "Expected NotFoundError"
-        except NotFoundError:
-            pass
+        @test("acknowledge nonexistent incident raises NotFoundError")
+        def _():
+            with expect_raises(NotFoundError):
+                wp.acknowledge_incident(ZERO_UUID, monitor_key)
 
     # ── Incident Notes (auth-gated) ─────────────────────────────────────
-    print("\nIncident Notes:")
+    section("Incident Notes")
 
-    @test("list notes for nonexistent incident raises NotFoundError")
-    def _():
-        try:
-            wp.list_incident_notes("00000000-0000-0000-0000-000000000000")
-            assert False, "Expected NotFoundError"
-        except NotFoundError:
-            pass
+    with concurrent():
+        @test("list notes for nonexistent incident raises NotFoundError")
+        def _():
+            with expect_raises(NotFoundError):
+                wp.list_incident_notes(ZERO_UUID)
 
-    @test("add note to nonexistent incident raises NotFoundError")
-    def _():
-        try:
-            wp.add_incident_note("00000000-0000-0000-0000-000000000000", "Test note", monitor_key)
-            assert False, "Expected NotFoundError"
-        except NotFoundError:
-            pass
+        @test("add note to nonexistent incident raises NotFoundError")
+        def _():
+            with expect_raises(NotFoundError):
+                wp.add_incident_note(ZERO_UUID, "Test note", monitor_key)
 
     # ── Badges (Advanced) ───────────────────────────────────────────────
-    print("\nBadges (Advanced):")
-
-    @test("uptime badge all periods")
-    def _():
-        for period in ("24h", "7d", "30d", "90d"):
-            svg = wp.get_uptime_badge(monitor_id, period=period)
-            assert "<svg" in svg, f"Period {period} not SVG"
-
-    @test("status badge with custom label")
-    def _():
-        svg = wp.get_status_badge(monitor_id, label="My Custom Service")
-        assert "<svg" in svg
-        assert "My Custom Service" in svg
-
-    @test("badge for nonexistent monitor raises NotFoundError")
-    def _():
-        try:
-            wp.get_uptime_badge("00000000-0000-0000-0000-000000000000")
-            assert False, "Expected NotFoundError"
-        except NotFoundError:
-            pass
+    section("Badges (Advanced)")
+
+    with concurrent():
+        @test("uptime badge all periods")
+        def _():
+            periods = ("24h", "7d", "30d", "90d")
+            svgs = wp.get_uptime_badges(monitor_id, periods)
+            assert list(svgs) == list(periods), f"Wrong periods: {list(svgs)}"
+            for period, svg in svgs.items():
+                assert svg.startswith("<svg"), f"Period {period} not SVG"
+
+        @test("status badge with custom label")
+        def _():
+            svg = wp.get_status_badge(monitor_id, label="My Custom Service", raw=True)
+            assert svg.startswith(b"<svg")
+            assert b"My Custom Service" in svg
+
+        @test("badge for nonexistent monitor raises NotFoundError")
+        def _():
+            with expect_raises(NotFoundError):
+                wp.get_uptime_badge(ZERO_UUID)
+
+        @test("batched badges for nonexistent monitor raise NotFoundError")
+        def _():
+            with expect_raises(NotFoundError):
+                wp.get_uptime_badges(ZERO_UUID)
 
     # ── Status Page Filters ─────────────────────────────────────────────
-    print("\nStatus (Filters):")
-
-    @test("status page with search filter")
-    def _():
-        status = wp.get_status(search="SDK")
-        assert isinstance(status, dict)
-
-    @test("status page with status filter")
-    def _():
-        status = wp.get_status(status="up")
-        assert isinstance(status, dict)
-
-    @test("status page with group filter")
-    def _():
-        status = wp.get_status(group="Updated Group")
-        assert isinstance(status, dict)
-
-    @test("status page with combined filters")
-    def _():
-        status = wp.get_status(search="SDK", tag="updated-tag")
-        assert isinstance(status, dict)
-
-    @test("status page ids= batch filter returns matching monitors")
-    def _():
-        # Use the monitor_id we already have from earlier in the test run
-        status = wp.get_status(ids=[monitor_id])
-        assert isinstance(status, dict)
-        monitors = status.get("monitors", [])
-        assert isinstance(monitors, list)
-        # The monitor should appear (it's public)
-        found = [m for m in monitors if m.get("id") == monitor_id]
-        assert len(found) == 1, f"Expected monitor {monitor_id} in ids= response, got {[m.get('id') for m in monitors]}"
-
-    @test("status page ids= with nonexistent id silently excludes")
-    def _():
-        status = wp.get_status(ids=["00000000-0000-0000-0000-000000000000"])
-        monitors = status.get("monitors", [])
-        assert not any(m.get("id") == "00000000-0000-0000-0000-000000000000" for m in monitors)
+    section("Status (Filters)")
+
+    with concurrent():
+        status_filters = [
+            ("status page with search filter", {"search": "SDK"}),
+            ("status page with status filter", {"status": "up"}),
+            ("status page with group filter", {"group": "Updated Group"}),
+            ("status page with combined filters", {"search": "SDK", "tag": "updated-tag"}),
+        ]
+        for what, filters in status_filters:
+            @test(what)
+            def _(filters=filters):
+                status = wp.get_status(**filters)
+                assert isinstance(status, dict), f"Not a dict for {filters}: {type(status)}"
+
+        @test("status page ids= batch filter returns matching monitors")
+        def _():
+            # Use the monitor_id we already have from earlier in the test run
+            status = wp.get_status(ids=[monitor_id])
+            assert isinstance(status, dict)
+            monitors = status.get("monitors", [])
+            assert isinstance(monitors, list)
+            # The monitor should appear (it's public)
+            found = [m for m in monitors if m.get("id") == monitor_id]
+            assert len(found) == 1, f"Expected monitor {monitor_id} in ids= response, got {[m.get('id') for m in monitors]}"
+
+        @test("status page ids= with nonexistent id silently excludes")
+        def _():
+            status = wp.get_status(ids=[ZERO_UUID])
+            monitors = status.get("monitors", [])
+            assert not any(m.get("id") == ZERO_UUID for m in monitors)
 
     # ── SLA Advanced ────────────────────────────────────────────────────
-    print("\nSLA (Advanced):")
+    section("SLA (Advanced)")
 
     @test("SLA returns expected fields")
     def _():
@@ -1332,226 +1533,355 @@ def main():
         assert "target_pct" in sla or "target" in sla or "status" in sla
 
     # ── Uptime Advanced ─────────────────────────────────────────────────
-    print("\nUptime (Advanced):")
-
-    @test("uptime returns expected fields")
-    def _():
-        up = wp.get_uptime(monitor_id)
-        # Should have period-based uptime
-        assert isinstance(up, dict)
-
-    @test("uptime history with different day ranges")
-    def _():
-        for days in (7, 14, 30):
-            hist = wp.get_uptime_history(monitor_id, days=days)
-            assert isinstance(hist, (list, dict)), f"Failed for days={days}"
-
-    @test("aggregate uptime history")
-    def _():
-        hist = wp.get_uptime_history(days=7)
-        assert isinstance(hist, (list, dict))
-
-    @test("uptime for nonexistent monitor raises NotFoundError")
-    def _():
-        try:
-            wp.get_uptime("00000000-0000-0000-0000-000000000000")
-            assert False, "Expected NotFoundError"
-        except NotFoundError:
-            pass
+    section("Uptime (Advanced)")
+
+    with concurrent():
+        @test("uptime returns expected fields")
+        def _():
+            up = wp.get_uptime(monitor_id)
+            # Should have period-based uptime
+            assert isinstance(up, dict)
+
+        @test("uptime histories for 7, 14 and 30 days")
+        def _():
+            histories = wp.get_uptime_histories(monitor_id, (7, 14, 30))
+            assert list(histories) == [7, 14, 30], f"Wrong ranges: {list(histories)}"
+            for days, history in histories.items():
+                assert isinstance(history, list), f"days={days}: {type(history)}"
+
+        shape_tests([("aggregate uptime history", lambda: wp.get_uptime_history(days=7))])
+
+        @test("uptime histories for nonexistent monitor raise NotFoundError")
+        def _():
+            with expect_raises(NotFoundError):
+                wp.get_uptime_histories(ZERO_UUID)
+
+        @test("uptime for nonexistent monitor raises NotFoundError")
+        def _():
+            with expect_raises(NotFoundError):
+                wp.get_uptime(ZERO_UUID)
 
     # ── Monitor Types (TCP/DNS detail checks) ───────────────────────────
-    print("\nMonitor Types (Detail Checks):")
-
-    @test("TCP monitor has correct type")
-    def _():
-        # Find our TCP monitor
-        monitors = wp.list_monitors(search="TCP Test")
-        tcp_found = [m for m in monitors if m.get("name") == "TCP Test"]
-        if tcp_found:
-            assert tcp_found[0].get("monitor_type") == "tcp"
-
-    @test("DNS monitor has correct type and record_type")
-    def _():
-        monitors = wp.list_monitors(search="DNS Test")
-        dns_found = [m for m in monitors if m.get("name") == "DNS Test"]
-        if dns_found:
-            assert dns_found[0].get("monitor_type") == "dns"
-
-    @test("create monitor with body_contains")
-    def _():
-        mon = wp.create_monitor(
-            "Body Check",
-            "https://httpbin.org/html",
-            is_public=True,
-            body_contains="html",
-        )
-        created_monitors.append((mon["id"], mon["manage_key"]))
-        m = wp.get_monitor(mon["id"])
-        assert m.get("body_contains") == "html"
-
-    @test("create monitor with custom headers")
-    def _():
-        mon = wp.create_monitor(
-            "Header Check",
-            "https://httpbin.org/headers",
-            is_public=True,
-            headers={"X-Custom": "test-value"},
-        )
-        created_monitors.append((mon["id"], mon["manage_key"]))
+    section("Monitor Types (Detail Checks)")
+
+    with concurrent():
+        @test("TCP monitor has correct type")
+        def _():
+            mon = wp.get_monitor(setup["TCP Test"]["id"])
+            assert mon.get("monitor_type") == "tcp", f"Wrong type: {mon}"
+
+        @test("DNS monitor has correct type and record_type")
+        def _():
+            mon = wp.get_monitor(setup["DNS Test"]["id"])
+            assert mon.get("monitor_type") == "dns", f"Wrong type: {mon}"
+            assert mon.get("dns_record_type") == "A", f"Wrong record type: {mon}"
+
+        @test("create monitor with body_contains")
+        def _():
+            mon = wp.create_monitor(
+                "Body Check",
+                f"{HTTPBIN_URL}/html",
+                is_public=True,
+                body_contains="html",
+            )
+            created_monitors[mon["id"]] = mon["manage_key"]
+            assert mon.get("body_contains") == "html"
+
+        @test("create monitor with custom headers")
+        def _():
+            mon = wp.create_monitor(
+                "Header Check",
+                f"{HTTPBIN_URL}/headers",
+                is_public=True,
+                headers={"X-Custom": "test-value"},
+            )
+            created_monitors[mon["id"]] = mon["manage_key"]
+            assert mon.get("headers"), f"Headers not stored: {mon}"
 
     # ── Convenience Helpers (Advanced) ──────────────────────────────────
-    print("\nConvenience Helpers (Advanced):")
+    section("Convenience Helpers (Advanced)")
 
-    @test("get_downtime_summary has all expected fields")
-    def _():
-        summary = wp.get_downtime_summary(monitor_id)
-        expected_fields = ["is_down", "current_status", "current_incident", "uptime_24h", "uptime_7d", "uptime_30d"]
-        for f in expected_fields:
-            assert f in summary, f"Missing field: {f}"
+    with concurrent():
+        @test("get_downtime_summary has all expected fields")
+        def _():
+            summary = wp.get_downtime_summary(monitor_id)
+            missing = DOWNTIME_SUMMARY_FIELDS - summary.keys()
+            assert not missing, f"Missing fields: {sorted(missing)}"
 
-    @test("is_up for nonexistent monitor raises NotFoundError")
-    def _():
-        try:
-            wp.is_up("00000000-0000-0000-0000-000000000000")
-            assert False, "Expected NotFoundError"
-        except NotFoundError:
-            pass
+        @test("is_up for nonexistent monitor raises NotFoundError")
+        def _():
+            with expect_raises(NotFoundError):
+                wp.is_up(ZERO_UUID)
 
     # ── Discovery (Advanced) ────────────────────────────────────────────
-    print("\nDiscovery (Advanced):")
-
-    @test("llms.txt contains expected sections")
-    def _():
-        txt = wp.get_llms_txt()
-        assert "monitor" in txt.lower()
-        assert "api" in txt.lower()
-
-    @test("skills index has expected structure")
-    def _():
-        idx = wp.get_skills_index()
-        # Should have a skills array
-        assert "skills" in idx or isinstance(idx, dict)
-
-    @test("health response has expected fields")
-    def _():
-        h = wp.health()
-        assert "status" in h, f"Missing status: {h}"
-        assert h.get("status") == "ok"
+    section("Discovery (Advanced)")
+
+    with concurrent():
+        @test("llms.txt contains expected sections")
+        def _():
+            txt = wp.get_llms_txt()
+            assert "monitor" in txt.lower()
+            assert "api" in txt.lower()
+
+        @test("skills index has expected structure")
+        def _():
+            idx = wp.get_skills_index()
+            # Should have a skills array
+            assert "skills" in idx or isinstance(idx, dict)
+
+        @test("health response has expected fields")
+        def _():
+            h = wp.health()
+            assert "status" in h, f"Missing status: {h}"
+            assert h.get("status") == "ok"
 
     # ── Delete Cascade ──────────────────────────────────────────────────
-    print("\nDelete Cascade:")
-
-    cascade_mon_id = None
-    cascade_mon_key = None
-
-    @test("create monitor for cascade test")
-    def _():
-        nonlocal cascade_mon_id, cascade_mon_key
-        mon = wp.create_monitor("Cascade Test", "https://httpbin.org/status/200", is_public=True)
-        cascade_mon_id = mon["id"]
-        cascade_mon_key = mon["manage_key"]
-
-    @test("add notification to cascade monitor")
-    def _():
-        wp.create_notification(
-            cascade_mon_id, "Cascade Notif", "webhook",
-            {"url": "https://httpbin.org/post"},
-            cascade_mon_key,
-        )
+    section("Delete Cascade")
+
+    # The monitor comes from the bulk setup; its children are independent
+    with concurrent():
+        @test("add notification to cascade monitor")
+        def _():
+            cascade_mon_id, cascade_mon_key = setup["Cascade Test"]["id"], setup["Cascade Test"]["manage_key"]
+            wp.create_notification(
+                cascade_mon_id, "Cascade Notif", "webhook",
+                {"url": f"{HTTPBIN_URL}/post"},
+                cascade_mon_key,
+            )
 
-    @test("add maintenance window to cascade monitor")
-    def _():
-        wp.create_maintenance(
-            cascade_mon_id, "Cascade Maint",
-            "2099-01-01T00:00:00Z", "2099-01-01T01:00:00Z",
-            cascade_mon_key,
-        )
+        @test("add maintenance window to cascade monitor")
+        def _():
+            cascade_mon_id, cascade_mon_key = setup["Cascade Test"]["id"], setup["Cascade Test"]["manage_key"]
+            wp.create_maintenance(
+                cascade_mon_id, "Cascade Maint",
+                FUTURE_START, FUTURE_END,
+                cascade_mon_key,
+            )
 
     @test("delete cascade monitor removes everything")
     def _():
+        cascade_mon_id, cascade_mon_key = setup["Cascade Test"]["id"], setup["Cascade Test"]["manage_key"]
         wp.delete_monitor(cascade_mon_id, cascade_mon_key)
+        del created_monitors[cascade_mon_id]
         # Verify monitor is gone
-        try:
+        with expect_raises(NotFoundError):
             wp.get_monitor(cascade_mon_id)
-            assert False, "Monitor should be deleted"
-        except NotFoundError:
-            pass
 
     # ── Error Handling (Comprehensive) ──────────────────────────────────
-    print("\nError Handling (Comprehensive):")
-
-    @test("NotFoundError has status_code")
-    def _():
-        try:
-            wp.get_monitor("00000000-0000-0000-0000-000000000000")
-            assert False, "Expected NotFoundError"
-        except NotFoundError as e:
+    section("Error Handling (Comprehensive)")
+
+    with concurrent():
+        # One 404 round trip covers every facet of the raised exception
+        @test("nonexistent monitor raises NotFoundError with status, body and message")
+        def _():
+            with expect_raises(NotFoundError) as raised:
+                wp.get_monitor(ZERO_UUID)
+            e = raised.value
+            assert isinstance(e, WatchpostError)
             assert e.status_code == 404
-
-    @test("AuthError has status_code")
-    def _():
-        try:
-            wp.delete_monitor(monitor_id, "invalid-key")
-            assert False, "Expected AuthError"
-        except AuthError as e:
-            assert e.status_code in (401, 403)
-
-    @test("WatchpostError base class catches all API errors")
-    def _():
-        try:
-            wp.get_monitor("00000000-0000-0000-0000-000000000000")
-            assert False, "Expected error"
-        except WatchpostError:
-            pass  # Caught via base class
-
-    @test("NotFoundError is WatchpostError subclass")
-    def _():
-        assert issubclass(NotFoundError, WatchpostError)
-        assert issubclass(AuthError, WatchpostError)
-        assert issubclass(RateLimitError, WatchpostError)
-        assert issubclass(ValidationError, WatchpostError)
-        assert issubclass(ConflictError, WatchpostError)
-
-    @test("WatchpostError has body attribute")
-    def _():
-        try:
-            wp.get_monitor("00000000-0000-0000-0000-000000000000")
-        except WatchpostError as e:
-            assert hasattr(e, "body")
-            assert hasattr(e, "status_code")
+            assert isinstance(e.body, dict) and "error" in e.body, f"Missing error field in body: {e.body}"
+            assert str(e), "Empty error message"
+
+        @test("AuthError has status_code")
+        def _():
+            with expect_raises(AuthError) as raised:
+                wp.delete_monitor(monitor_id, "invalid-key")
+            assert raised.value.status_code in (401, 403)
+
+        @test("NotFoundError is WatchpostError subclass")
+        def _():
+            assert issubclass(NotFoundError, WatchpostError)
+            assert issubclass(AuthError, WatchpostError)
+            assert issubclass(RateLimitError, WatchpostError)
+            assert issubclass(ValidationError, WatchpostError)
+            assert issubclass(ConflictError, WatchpostError)
 
     # ── Constructor Variants ────────────────────────────────────────────
-    print("\nConstructor Variants:")
+    section("Constructor Variants")
 
     @test("constructor with env var fallback")
     def _():
-        old = os.environ.get("WATCHPOST_URL")
-        os.environ["WATCHPOST_URL"] = BASE_URL
-        try:
-            wp2 = Watchpost()
-            h = wp2.health()
-            assert h.get("status") == "ok"
-        finally:
-            if old:
-                os.environ["WATCHPOST_URL"] = old
-            elif "WATCHPOST_URL" in os.environ:
-                del os.environ["WATCHPOST_URL"]
+        with mock.patch.dict(os.environ, {"WATCHPOST_URL": BASE_URL}), Watchpost() as wp2:
+            assert wp2.health().get("status") == "ok"
 
     @test("constructor with trailing slash strips it")
     def _():
-        wp2 = Watchpost(BASE_URL + "/")
-        h = wp2.health()
-        assert h.get("status") == "ok"
+        with Watchpost(BASE_URL + "/") as wp2:
+            assert wp2.health().get("status") == "ok"
 
     @test("constructor with custom timeout")
     def _():
-        wp2 = Watchpost(BASE_URL, timeout=5)
-        assert wp2.timeout == 5
-        h = wp2.health()
-        assert h.get("status") == "ok"
+        with Watchpost(BASE_URL, timeout=5) as wp2:
+            assert wp2.timeout == 5
+            assert wp2.health().get("status") == "ok"
+
+    @test("per-call timeout bounds a stalled response")
+    def _():
+        # The SSE stream never finishes, so reading it to the end stalls.
+        with Watchpost(BASE_URL) as wp2:
+            with expect_raises(socket.timeout):
+                wp2._get("/api/v1/events", timeout=0.5)
+            assert wp2.health(timeout=5).get("status") == "ok"
+
+    @test("strict_keys rejects malformed keys without a request")
+    def _():
+        # Nothing listens on the discard port; a request would fail with OSError.
+        with Watchpost("http://127.0.0.1:9", strict_keys=True) as wp2:
+            with expect_raises(AuthError):
+                wp2.get_alert_rules(monitor_id, "wrong-key")
+            with expect_raises(OSError):
+                wp2.get_alert_rules(monitor_id, monitor_key)
+
+    @test("client as context manager reuses and closes connections")
+    def _():
+        with Watchpost(BASE_URL) as wp2:
+            for _ in range(3):
+                assert wp2.health().get("status") == "ok"
+        # A closed client reconnects on demand
+        assert wp2.health().get("status") == "ok"
+        wp2.close()
+
+    @test("cached GETs are served until a write or invalidate()")
+    def _():
+        with Watchpost(BASE_URL, cache=True) as wp2:
+            first = wp2.get_monitor(dep_monitor_id)
+            assert wp2.get_monitor(dep_monitor_id) == first
+            wp.update_monitor(dep_monitor_id, dep_monitor_key, name="Upstream DB (cache probe)")
+            # Written through another client: the cached copy is stale
+            assert wp2.get_monitor(dep_monitor_id)["name"] == first["name"]
+            wp2.invalidate(f"/api/v1/monitors/{dep_monitor_id}")
+            assert wp2.get_monitor(dep_monitor_id)["name"] == "Upstream DB (cache probe)"
+
+    @test("a GET in flight during a write doesn't cache its pre-write body")
+    def _():
+        with slow_read_server() as server, Watchpost(server.url, cache=True) as wp2:
+            with ThreadPoolExecutor(max_workers=1) as pool:
+                slow = pool.submit(wp2.get_monitor, "m")
+                assert server.started.wait(5), "Slow GET never reached the server"
+                wp2.update_monitor("m", "key", name="new")
+                server.release.set()
+                assert slow.result()["name"] == "old"
+            assert wp2.get_monitor("m")["name"] == "new"
+
+    @test("a GET after a write doesn't join one that started before it")
+    def _():
+        with slow_read_server() as server, Watchpost(server.url, cache=True) as wp2:
+            with ThreadPoolExecutor(max_workers=2) as pool:
+                slow = pool.submit(wp2.get_monitor, "m")
+                assert server.started.wait(5), "Slow GET never reached the server"
+                wp2.update_monitor("m", "key", name="new")
+                fresh = pool.submit(wp2.get_monitor, "m")
+                try:
+                    # Joining the slow GET would block until release
+                    fresh_name = fresh.result(timeout=5)["name"]
+                finally:
+                    server.release.set()
+                assert fresh_name == "new", f"Joined the pre-write GET: {fresh_name}"
+                assert slow.result()["name"] == "old"
+            assert wp2.get_monitor("m")["name"] == "new", "Pre-write body replaced the fresh one"
+            assert server.gets == 2, f"Expected the last read from cache: {server.gets} GETs"
+
+    @test("cache drops the least recently used response past cache_maxsize")
+    def _():
+        with Watchpost(BASE_URL, cache=True, cache_maxsize=2) as wp2:
+            wp2.list_tags()
+            wp2.list_groups()
+            wp2.list_tags()  # now more recent than list_groups
+            wp2.get_status()
+            paths = [url[len(BASE_URL):] for url, _, _ in wp2._cache]
+            assert paths == ["/api/v1/tags", "/api/v1/status"], f"Unexpected cache contents: {paths}"
+
+    @test("get_monitor revalidates with ETag instead of refetching")
+    def _():
+        with Watchpost(BASE_URL) as wp2:
+            first = wp2.get_monitor(dep_monitor_id)
+            assert wp2._etags, "Server sent no ETag for GET /monitors/:id"
+            assert wp2.get_monitor(dep_monitor_id)["id"] == first["id"]
+            wp.update_monitor(dep_monitor_id, dep_monitor_key, name="Upstream DB (etag probe)")
+            assert wp2.get_monitor(dep_monitor_id)["name"] == "Upstream DB (etag probe)"
+
+    @test("stored ETag bodies are bounded by cache_maxsize")
+    def _():
+        with Watchpost(BASE_URL, cache_maxsize=1) as wp2:
+            wp2.get_monitor(monitor_id)
+            wp2.get_monitor(dep_monitor_id)
+            urls = [url for url, _ in wp2._etags]
+            assert urls == [f"{BASE_URL}/api/v1/monitors/{dep_monitor_id}"], f"Unexpected ETag entries: {urls}"
+
+    @test("deleting a monitor drops its stored ETag body")
+    def _():
+        with Watchpost(BASE_URL) as wp2:
+            (mon,) = create_monitors(wp2, created_monitors, ("ETag Drop", f"{HTTPBIN_URL}/status/200", {}))
+            wp2.get_monitor(mon["id"])
+            assert any(mon["id"] in url for url, _ in wp2._etags), "Server sent no ETag"
+            wp2.delete_monitor(mon["id"], mon["manage_key"])
+            del created_monitors[mon["id"]]
+            assert not any(mon["id"] in url for url, _ in wp2._etags), f"Stale ETag kept: {wp2._etags}"
+
+    @test("bulk-deleting monitors drops their stored ETag bodies")
+    def _():
+        with Watchpost(BASE_URL) as wp2:
+            mons = create_monitors(
+                wp2, created_monitors,
+                ("ETag Bulk Drop 1", f"{HTTPBIN_URL}/status/200", {}),
+                ("ETag Bulk Drop 2", f"{HTTPBIN_URL}/status/200", {}),
+            )
+            for mon in mons:
+                wp2.get_monitor(mon["id"])
+            assert wp2._etags, "Server sent no ETag"
+            result = wp2.bulk_delete_monitors([(m["id"], m["manage_key"]) for m in mons])
+            for mon in mons:
+                del created_monitors[mon["id"]]
+            assert result["succeeded"] == 2, f"Unexpected: {result}"
+            stale = [url for url, _ in wp2._etags if any(m["id"] in url for m in mons)]
+            assert not stale, f"Stale ETags kept: {stale}"
+
+    @test("discovery documents are cached without cache=True")
+    def _():
+        with Watchpost(BASE_URL) as wp2:
+            txt = wp2.get_llms_txt()
+            wp2.get_skills_index()
+            assert len(wp2._cache) == 2, f"Expected 2 cached documents: {list(wp2._cache)}"
+            assert wp2.get_llms_txt() == txt
+            wp2.list_tags()
+            assert len(wp2._cache) == 2, "Ordinary GETs must not be cached by default"
+
+    # ── Async Client ────────────────────────────────────────────────────
+    section("Async Client")
+
+    with concurrent():
+        @test("AsyncWatchpost gathers independent reads")
+        async def _():
+            async with AsyncWatchpost(BASE_URL) as awp:
+                mon, uptime, tags, groups, status = await asyncio.gather(
+                    awp.get_monitor(monitor_id),
+                    awp.get_uptime(monitor_id),
+                    awp.list_tags(),
+                    awp.list_groups(),
+                    awp.get_status(),
+                )
+            assert mon["id"] == monitor_id
+            assert isinstance(uptime, dict)
+            assert isinstance(tags, list) and isinstance(groups, list)
+            assert isinstance(status, dict)
+
+        @test("AsyncWatchpost raises SDK errors")
+        async def _():
+            async with AsyncWatchpost(BASE_URL) as awp:
+                with expect_raises(NotFoundError):
+                    await awp.get_monitor(ZERO_UUID)
+
+        @test("AsyncWatchpost(client=) shares the client's pool and leaves it open")
+        async def _():
+            with Watchpost(BASE_URL) as wp2:
+                async with AsyncWatchpost(client=wp2) as awp:
+                    assert awp.client is wp2
+                    assert (await awp.health()).get("status") == "ok"
+                assert wp2._pool, "Connection was not returned to the shared pool"
+                assert wp2.health().get("status") == "ok"
 
     # ── Unicode Handling ────────────────────────────────────────────────
-    print("\nUnicode Handling:")
+    section("Unicode Handling")
 
     unicode_mon_id = None
     unicode_mon_key = None
@@ -1561,172 +1891,169 @@ def main():
         nonlocal unicode_mon_id, unicode_mon_key
         mon = wp.create_monitor(
             "監視テスト 🔍",
-            "https://httpbin.org/status/200",
+            f"{HTTPBIN_URL}/status/200",
             is_public=True,
             tags=["日本語", "テスト"],
             group_name="グループA",
         )
         unicode_mon_id = mon["id"]
         unicode_mon_key = mon["manage_key"]
-        created_monitors.append((unicode_mon_id, unicode_mon_key))
-
-    @test("get unicode monitor preserves name")
-    def _():
-        mon = wp.get_monitor(unicode_mon_id)
-        assert "監視テスト" in mon["name"], f"Name not preserved: {mon['name']}"
-
-    @test("search unicode monitor by CJK name")
-    def _():
-        monitors = wp.list_monitors(search="監視テスト")
-        ids = [m["id"] for m in monitors]
-        assert unicode_mon_id in ids, "Unicode search failed"
-
-    @test("filter by unicode tag")
-    def _():
-        monitors = wp.list_monitors(tag="日本語")
-        assert isinstance(monitors, list)
-
-    @test("filter by unicode group")
-    def _():
-        monitors = wp.list_monitors(group="グループA")
-        assert isinstance(monitors, list)
-
-    @test("update monitor with emoji tags")
-    def _():
-        wp.update_monitor(unicode_mon_id, unicode_mon_key, tags=["🔥", "🚀", "テスト"])
-        mon = wp.get_monitor(unicode_mon_id)
-        assert "🔥" in mon.get("tags", [])
-
-    @test("create maintenance with unicode title")
-    def _():
-        m = wp.create_maintenance(
-            unicode_mon_id, "メンテナンス期間 🛠️",
-            "2099-06-01T00:00:00Z", "2099-06-01T02:00:00Z",
-            unicode_mon_key,
-        )
-        assert "id" in m
-        wp.delete_maintenance(m["id"], unicode_mon_key)
-
-    @test("create notification with unicode name")
-    def _():
-        n = wp.create_notification(
-            unicode_mon_id, "通知チャンネル 📢", "webhook",
-            {"url": "https://httpbin.org/post"},
-            unicode_mon_key,
-        )
-        assert "id" in n
-        wp.delete_notification(n["id"], unicode_mon_key)
-
-    @test("create status page with unicode")
-    def _():
-        page = wp.create_status_page(
-            "unicode-test-page",
-            "ステータス页面 📊",
-            description="Beschreibung mit Ümlauten und Ñ",
-        )
-        assert "manage_key" in page
-        pk = page["manage_key"]
-        created_pages.append(("unicode-test-page", pk))
-        got = wp.get_status_page("unicode-test-page")
-        assert "ステータス" in got.get("title", "")
-        wp.delete_status_page("unicode-test-page", pk)
-        created_pages.remove(("unicode-test-page", pk))
+        created_monitors[unicode_mon_id] = unicode_mon_key
+
+    with concurrent():
+        @test("get unicode monitor preserves name")
+        def _():
+            mon = wp.get_monitor(unicode_mon_id)
+            assert "監視テスト" in mon["name"], f"Name not preserved: {mon['name']}"
+
+        @test("search unicode monitor by CJK name")
+        def _():
+            monitors = wp.list_monitors(search="監視テスト")
+            ids = {m["id"] for m in monitors}
+            assert unicode_mon_id in ids, "Unicode search failed"
+
+        @test("filter by unicode tag")
+        def _():
+            monitors = wp.list_monitors(tag="日本語")
+            assert isinstance(monitors, list)
+
+        @test("filter by unicode group")
+        def _():
+            monitors = wp.list_monitors(group="グループA")
+            assert isinstance(monitors, list)
+
+        @test("update monitor with emoji tags")
+        def _():
+            mon = wp.update_monitor(unicode_mon_id, unicode_mon_key, tags=["🔥", "🚀", "テスト"])
+            assert "🔥" in mon.get("tags", [])
+
+        @test("create maintenance with unicode title")
+        def _():
+            m = wp.create_maintenance(
+                unicode_mon_id, "メンテナンス期間 🛠️",
+                "2099-06-01T00:00:00Z", "2099-06-01T02:00:00Z",
+                unicode_mon_key,
+            )
+            assert "id" in m
+            wp.delete_maintenance(m["id"], unicode_mon_key)
+
+        @test("create notification with unicode name")
+        def _():
+            n = wp.create_notification(
+                unicode_mon_id, "通知チャンネル 📢", "webhook",
+                {"url": f"{HTTPBIN_URL}/post"},
+                unicode_mon_key,
+            )
+            assert "id" in n
+            wp.delete_notification(n["id"], unicode_mon_key)
+
+        @test("create status page with unicode")
+        def _():
+            page = wp.create_status_page(
+                "unicode-test-page",
+                "ステータス页面 📊",
+                description="Beschreibung mit Ümlauten und Ñ",
+            )
+            assert "manage_key" in page
+            pk = page["manage_key"]
+            created_pages["unicode-test-page"] = pk
+            got = wp.get_status_page("unicode-test-page")
+            assert "ステータス" in got.get("title", "")
+            wp.delete_status_page("unicode-test-page", pk)
+            del created_pages["unicode-test-page"]
 
     # ── Monitor Response Fields ─────────────────────────────────────────
-    print("\nMonitor Response Fields:")
-
-    @test("create monitor response has all expected fields")
-    def _():
-        mon = wp.create_monitor("Fields Test", "https://httpbin.org/status/200", is_public=True)
-        created_monitors.append((mon["id"], mon["manage_key"]))
-        for f in ("id", "name", "url", "manage_key"):
-            assert f in mon, f"Missing field in create response: {f}"
-
-    @test("get monitor response has detailed fields")
-    def _():
-        mon = wp.get_monitor(monitor_id)
-        expected = ["id", "name", "url", "monitor_type", "method", "interval_seconds",
-                     "timeout_ms", "expected_status", "is_public", "current_status"]
-        for f in expected:
-            assert f in mon, f"Missing field in get: {f}"
-
-    @test("list monitors items have core fields")
-    def _():
-        monitors = wp.list_monitors()
-        if monitors:
-            m = monitors[0]
-            for f in ("id", "name", "url", "current_status"):
-                assert f in m, f"Missing field in list item: {f}"
-
-    @test("monitor has created_at field")
-    def _():
-        mon = wp.get_monitor(monitor_id)
-        assert "created_at" in mon, "Missing created_at"
-        assert isinstance(mon["created_at"], str)
-        assert len(mon["created_at"]) >= 19, f"Timestamp too short: {mon['created_at']}"
-
-    @test("monitor has is_paused field")
-    def _():
-        mon = wp.get_monitor(monitor_id)
-        assert "is_paused" in mon
-        assert isinstance(mon["is_paused"], bool)
+    section("Monitor Response Fields")
+
+    with concurrent():
+        # Also used by the Timestamps Lifecycle section below, which reads
+        # the creation state from this response rather than a GET.
+        ts_mon = {}
+        ts_mon_id = None
+        ts_mon_key = None
+
+        @test("create monitor response has all expected fields")
+        def _():
+            nonlocal ts_mon, ts_mon_id, ts_mon_key
+            mon = ts_mon = wp.create_monitor("Timestamp Test", f"{HTTPBIN_URL}/status/200", is_public=True)
+            ts_mon_id = mon["id"]
+            ts_mon_key = mon["manage_key"]
+            created_monitors[ts_mon_id] = ts_mon_key
+            missing = CREATE_RESPONSE_FIELDS - mon.keys()
+            assert not missing, f"Missing fields in create response: {sorted(missing)}"
+
+        @test("get monitor response has detailed fields")
+        def _():
+            mon = wp.get_monitor(monitor_id)
+            missing = MONITOR_DETAIL_FIELDS - mon.keys()
+            assert not missing, f"Missing fields in get: {sorted(missing)}"
+
+        @test("list monitors items have core fields")
+        def _():
+            monitors = wp.list_monitors()
+            if monitors:
+                missing = MONITOR_LIST_ITEM_FIELDS - monitors[0].keys()
+                assert not missing, f"Missing fields in list item: {sorted(missing)}"
+
+        @test("monitor has created_at field")
+        def _():
+            mon = wp.get_monitor(monitor_id)
+            assert "created_at" in mon, "Missing created_at"
+            assert isinstance(mon["created_at"], str)
+            assert len(mon["created_at"]) >= 19, f"Timestamp too short: {mon['created_at']}"
+
+        @test("monitor has is_paused field")
+        def _():
+            mon = wp.get_monitor(monitor_id)
+            assert "is_paused" in mon
+            assert isinstance(mon["is_paused"], bool)
 
     # ── Timestamps Lifecycle ────────────────────────────────────────────
-    print("\nTimestamps Lifecycle:")
-
-    ts_mon_id = None
-    ts_mon_key = None
+    section("Timestamps Lifecycle")
 
     @test("monitor created_at set on creation")
     def _():
-        nonlocal ts_mon_id, ts_mon_key
-        mon = wp.create_monitor("Timestamp Test", "https://httpbin.org/status/200", is_public=True)
-        ts_mon_id = mon["id"]
-        ts_mon_key = mon["manage_key"]
-        created_monitors.append((ts_mon_id, ts_mon_key))
-        got = wp.get_monitor(ts_mon_id)
-        assert "created_at" in got
-        assert len(got["created_at"]) > 10, f"Suspicious created_at: {got['created_at']}"
+        assert "created_at" in ts_mon, f"Missing created_at: {ts_mon}"
+        assert len(ts_mon["created_at"]) > 10, f"Suspicious created_at: {ts_mon['created_at']}"
 
-    @test("monitor updated_at changes on update")
+    @test("update_monitor returns updated_at that does not go backwards")
     def _():
-        before = wp.get_monitor(ts_mon_id)
-        time.sleep(0.1)
-        wp.update_monitor(ts_mon_id, ts_mon_key, name="Timestamp Updated")
-        after = wp.get_monitor(ts_mon_id)
-        if "updated_at" in before and "updated_at" in after:
-            assert after["updated_at"] >= before.get("updated_at", ""), "updated_at not advanced"
+        # Timestamps have one-second resolution, so an update in the same
+        # second keeps updated_at; only going backwards is a failure.
+        before = ts_mon
+        after = wp.update_monitor(ts_mon_id, ts_mon_key, name="Timestamp Updated")
+        assert after["name"] == "Timestamp Updated", f"Update not applied: {after}"
+        assert "updated_at" in before, f"Create response has no updated_at: {before}"
+        assert "updated_at" in after, f"Update response has no updated_at: {after}"
+        assert after["updated_at"] >= before["updated_at"], "updated_at went backwards"
 
     # ── Multi-Monitor Isolation ─────────────────────────────────────────
-    print("\nMulti-Monitor Isolation:")
+    section("Multi-Monitor Isolation")
 
     iso_mon_a_id = None
     iso_mon_a_key = None
     iso_mon_b_id = None
     iso_mon_b_key = None
 
-    @test("create two isolated monitors")
+    @test("two isolated monitors from bulk setup", setup=True)
     def _():
         nonlocal iso_mon_a_id, iso_mon_a_key, iso_mon_b_id, iso_mon_b_key
-        a = wp.create_monitor("Iso-A", "https://httpbin.org/status/200", is_public=True, tags=["iso-a"])
-        b = wp.create_monitor("Iso-B", "https://httpbin.org/status/201", is_public=True, tags=["iso-b"])
+        a, b = setup["Iso-A"], setup["Iso-B"]
         iso_mon_a_id = a["id"]
         iso_mon_a_key = a["manage_key"]
         iso_mon_b_id = b["id"]
         iso_mon_b_key = b["manage_key"]
-        created_monitors.append((iso_mon_a_id, iso_mon_a_key))
-        created_monitors.append((iso_mon_b_id, iso_mon_b_key))
 
     @test("notifications are monitor-scoped")
     def _():
         n = wp.create_notification(iso_mon_a_id, "A-only", "webhook",
-                                    {"url": "https://httpbin.org/post"}, iso_mon_a_key)
+                                    {"url": f"{HTTPBIN_URL}/post"}, iso_mon_a_key)
         notifs_a = wp.list_notifications(iso_mon_a_id, iso_mon_a_key)
         notifs_b = wp.list_notifications(iso_mon_b_id, iso_mon_b_key)
         items_a = notifs_a if isinstance(notifs_a, list) else notifs_a.get("notifications", [])
         items_b = notifs_b if isinstance(notifs_b, list) else notifs_b.get("notifications", [])
-        a_ids = [x["id"] for x in items_a]
-        b_ids = [x["id"] for x in items_b]
+        a_ids = {x["id"] for x in items_a}
+        b_ids = {x["id"] for x in items_b}
         assert n["id"] in a_ids, "Notification not in monitor A"
         assert n["id"] not in b_ids, "Notification leaked to monitor B"
         wp.delete_notification(n["id"], iso_mon_a_key)
@@ -1734,13 +2061,13 @@ def main():
     @test("maintenance windows are monitor-scoped")
     def _():
         m = wp.create_maintenance(iso_mon_a_id, "A-maint",
-                                   "2099-01-01T00:00:00Z", "2099-01-01T01:00:00Z", iso_mon_a_key)
+                                   FUTURE_START, FUTURE_END, iso_mon_a_key)
         mw_a = wp.list_maintenance(iso_mon_a_id)
         mw_b = wp.list_maintenance(iso_mon_b_id)
         items_a = mw_a if isinstance(mw_a, list) else mw_a.get("windows", [])
         items_b = mw_b if isinstance(mw_b, list) else mw_b.get("windows", [])
-        a_ids = [x.get("id") for x in items_a]
-        b_ids = [x.get("id") for x in items_b]
+        a_ids = {x.get("id") for x in items_a}
+        b_ids = {x.get("id") for x in items_b}
         assert m["id"] in a_ids, "Maintenance not in monitor A"
         assert m["id"] not in b_ids, "Maintenance leaked to monitor B"
         wp.delete_maintenance(m["id"], iso_mon_a_key)
@@ -1762,350 +2089,330 @@ def main():
 
     @test("key A cannot modify monitor B")
     def _():
-        try:
+        with expect_raises(AuthError):
             wp.update_monitor(iso_mon_b_id, iso_mon_a_key, name="Hacked")
-            assert False, "Expected AuthError"
-        except AuthError:
-            pass
 
     @test("key A cannot delete monitor B")
     def _():
-        try:
+        with expect_raises(AuthError):
             wp.delete_monitor(iso_mon_b_id, iso_mon_a_key)
-            assert False, "Expected AuthError"
-        except AuthError:
-            pass
 
     @test("key A cannot pause monitor B")
     def _():
-        try:
+        with expect_raises(AuthError):
             wp.pause_monitor(iso_mon_b_id, iso_mon_a_key)
-            assert False, "Expected AuthError"
-        except AuthError:
-            pass
-
-    # ── Dependency Chain ────────────────────────────────────────────────
-    print("\nDependency Chain:")
-
-    chain_a_id = None
-    chain_a_key = None
-    chain_b_id = None
-    chain_b_key = None
-    chain_c_id = None
-    chain_c_key = None
-
-    @test("create 3-level dependency chain")
-    def _():
-        nonlocal chain_a_id, chain_a_key, chain_b_id, chain_b_key, chain_c_id, chain_c_key
-        a = wp.create_monitor("Chain-A (DB)", "https://httpbin.org/status/200", is_public=True)
-        b = wp.create_monitor("Chain-B (API)", "https://httpbin.org/status/200", is_public=True)
-        c = wp.create_monitor("Chain-C (Web)", "https://httpbin.org/status/200", is_public=True)
-        chain_a_id, chain_a_key = a["id"], a["manage_key"]
-        chain_b_id, chain_b_key = b["id"], b["manage_key"]
-        chain_c_id, chain_c_key = c["id"], c["manage_key"]
-        created_monitors.extend([
-            (chain_a_id, chain_a_key),
-            (chain_b_id, chain_b_key),
-            (chain_c_id, chain_c_key),
-        ])
-        # C depends on B, B depends on A
-        wp.add_dependency(chain_b_id, chain_a_id, chain_b_key)
-        wp.add_dependency(chain_c_id, chain_b_id, chain_c_key)
-
-    @test("chain: C has B as dependency")
-    def _():
-        deps = wp.list_dependencies(chain_c_id)
-        dep_ids = [d.get("depends_on_id") for d in (deps if isinstance(deps, list) else [])]
-        assert chain_b_id in dep_ids, f"B not in C's deps: {dep_ids}"
-
-    @test("chain: A has B as dependent")
-    def _():
-        deps = wp.list_dependents(chain_a_id)
-        assert isinstance(deps, (list, dict))
-
-    @test("chain: circular dependency C→A raises error")
-    def _():
-        try:
-            wp.add_dependency(chain_a_id, chain_c_id, chain_a_key)
-            assert False, "Expected error for circular dependency"
-        except (ConflictError, ValidationError, WatchpostError):
-            pass
-
-    @test("chain: delete middle (B) removes B's deps")
-    def _():
-        # After deleting B, C's dependency on B should be orphaned
-        wp.delete_monitor(chain_b_id, chain_b_key)
-        created_monitors.remove((chain_b_id, chain_b_key))
-        # C should still exist
-        c = wp.get_monitor(chain_c_id)
-        assert c["name"] == "Chain-C (Web)"
-
-    # ── Notification Enable/Disable Lifecycle ───────────────────────────
-    print("\nNotification Lifecycle:")
-
-    notif_lc_id = None
-
-    @test("create notification, disable, re-enable")
-    def _():
-        nonlocal notif_lc_id
-        n = wp.create_notification(
-            monitor_id, "Lifecycle Notif", "webhook",
-            {"url": "https://httpbin.org/post"}, monitor_key,
-        )
-        notif_lc_id = n["id"]
-        # Disable
-        wp.update_notification(notif_lc_id, monitor_key, is_enabled=False)
-        notifs = wp.list_notifications(monitor_id, monitor_key)
-        items = notifs if isinstance(notifs, list) else notifs.get("notifications", [])
-        found = [x for x in items if x["id"] == notif_lc_id]
-        assert found and found[0].get("is_enabled") == False, "Not disabled"
-        # Re-enable
-        wp.update_notification(notif_lc_id, monitor_key, is_enabled=True)
-        notifs2 = wp.list_notifications(monitor_id, monitor_key)
-        items2 = notifs2 if isinstance(notifs2, list) else notifs2.get("notifications", [])
-        found2 = [x for x in items2 if x["id"] == notif_lc_id]
-        assert found2 and found2[0].get("is_enabled") == True, "Not re-enabled"
 
-    @test("delete notification lifecycle")
-    def _():
-        wp.delete_notification(notif_lc_id, monitor_key)
-
-    # ── Multiple Maintenance Windows ────────────────────────────────────
-    print("\nMultiple Maintenance Windows:")
-
-    @test("create multiple maintenance windows on same monitor")
-    def _():
-        m1 = wp.create_maintenance(monitor_id, "Window 1",
-                                    "2099-03-01T00:00:00Z", "2099-03-01T01:00:00Z", monitor_key)
-        m2 = wp.create_maintenance(monitor_id, "Window 2",
-                                    "2099-04-01T00:00:00Z", "2099-04-01T01:00:00Z", monitor_key)
-        mw = wp.list_maintenance(monitor_id)
-        items = mw if isinstance(mw, list) else mw.get("windows", [])
-        ids = [x.get("id") for x in items]
-        assert m1["id"] in ids and m2["id"] in ids, "Both windows should exist"
-        wp.delete_maintenance(m1["id"], monitor_key)
-        wp.delete_maintenance(m2["id"], monitor_key)
-
-    @test("maintenance window response has expected fields")
-    def _():
-        m = wp.create_maintenance(monitor_id, "Field Check",
-                                   "2099-05-01T00:00:00Z", "2099-05-01T02:00:00Z", monitor_key)
-        assert "id" in m
-        assert "title" in m or "starts_at" in m
-        wp.delete_maintenance(m["id"], monitor_key)
-
-    # ── Alert Rules Partial Update ──────────────────────────────────────
-    print("\nAlert Rules (Partial):")
-
-    @test("set alert rules and verify all fields")
-    def _():
-        wp.set_alert_rules(monitor_id, monitor_key,
-                           repeat_interval_minutes=20, max_repeats=8, escalation_after_minutes=45)
-        rules = wp.get_alert_rules(monitor_id, monitor_key)
-        assert rules.get("repeat_interval_minutes") == 20
-        assert rules.get("max_repeats") == 8
-        assert rules.get("escalation_after_minutes") == 45
-
-    @test("overwrite alert rules with new values")
-    def _():
-        wp.set_alert_rules(monitor_id, monitor_key,
-                           repeat_interval_minutes=10, max_repeats=3, escalation_after_minutes=15)
-        rules = wp.get_alert_rules(monitor_id, monitor_key)
-        assert rules.get("repeat_interval_minutes") == 10
-        assert rules.get("max_repeats") == 3
-
-    @test("alert rules with zeros (disabled)")
-    def _():
-        wp.set_alert_rules(monitor_id, monitor_key,
-                           repeat_interval_minutes=0, max_repeats=0, escalation_after_minutes=0)
-        rules = wp.get_alert_rules(monitor_id, monitor_key)
-        assert rules.get("repeat_interval_minutes") == 0
-
-    @test("cleanup alert rules")
-    def _():
-        wp.delete_alert_rules(monitor_id, monitor_key)
-
-    # ── Bulk Create Large Batch ─────────────────────────────────────────
-    print("\nBulk Create (Large Batch):")
-
-    @test("bulk create 10 monitors")
-    def _():
-        monitors = [
-            {"name": f"Bulk-{i}", "url": f"https://httpbin.org/status/{200+i}", "is_public": True}
-            for i in range(10)
-        ]
-        result = wp.bulk_create_monitors(monitors)
-        created_count = result.get("succeeded", len(result.get("created", [])))
-        assert created_count >= 10, f"Expected 10 created, got {created_count}"
-        if "created" in result:
-            for m in result["created"]:
-                if "id" in m and "manage_key" in m:
-                    created_monitors.append((m["id"], m["manage_key"]))
-
-    @test("bulk create with mixed types")
-    def _():
-        monitors = [
-            {"name": "Bulk HTTP", "url": "https://httpbin.org/status/200", "is_public": True},
-            {"name": "Bulk TCP", "url": "httpbin.org:443", "monitor_type": "tcp", "is_public": True},
-            {"name": "Bulk DNS", "url": "httpbin.org", "monitor_type": "dns", "is_public": True},
-        ]
-        result = wp.bulk_create_monitors(monitors)
-        assert result.get("succeeded", 0) >= 3 or len(result.get("created", [])) >= 3
-        if "created" in result:
-            for m in result["created"]:
-                if "id" in m and "manage_key" in m:
-                    created_monitors.append((m["id"], m["manage_key"]))
-
-    # ── Status Page Advanced ────────────────────────────────────────────
-    print("\nStatus Page (Advanced):")
-
-    @test("create private status page")
-    def _():
-        page = wp.create_status_page("private-test", "Private Page", is_public=False)
-        pk = page["manage_key"]
-        created_pages.append(("private-test", pk))
-        # Should still be gettable by slug
-        got = wp.get_status_page("private-test")
-        assert "title" in got
-
-    @test("update status page logo_url")
-    def _():
-        pk = [k for s, k in created_pages if s == "private-test"][0]
-        wp.update_status_page("private-test", pk, logo_url="https://example.com/logo.png")
-        got = wp.get_status_page("private-test")
-        assert got.get("logo_url") == "https://example.com/logo.png"
-
-    @test("status page with custom domain")
-    def _():
-        page = wp.create_status_page(
-            "domain-test", "Domain Page",
-            custom_domain="status.example.com",
-        )
-        pk = page["manage_key"]
-        created_pages.append(("domain-test", pk))
-        got = wp.get_status_page("domain-test")
-        assert got.get("custom_domain") == "status.example.com"
-
-    @test("status page add and list monitors")
-    def _():
-        pk = [k for s, k in created_pages if s == "private-test"][0]
-        wp.add_monitors_to_page("private-test", [monitor_id, unicode_mon_id], pk)
-        mons = wp.list_page_monitors("private-test")
-        assert isinstance(mons, list)
-        assert len(mons) >= 2
-
-    @test("cleanup advanced status pages")
-    def _():
-        for slug, key in list(created_pages):
-            if slug in ("private-test", "domain-test"):
-                try:
-                    wp.delete_status_page(slug, key)
-                    created_pages.remove((slug, key))
-                except Exception:
-                    pass
+    # These chains each touch their own resources, so they run side by side;
+    # tests within a chain stay in order.
+    with concurrent():
+        # ── Dependency Chain ────────────────────────────────────────────
+        with group("deps"):
+            section("Dependency Chain")
+
+            chain_a_id = None
+            chain_a_key = None
+            chain_b_id = None
+            chain_b_key = None
+            chain_c_id = None
+            chain_c_key = None
+
+            @test("create 3-level dependency chain", setup=True)
+            def _():
+                nonlocal chain_a_id, chain_a_key, chain_b_id, chain_b_key, chain_c_id, chain_c_key
+                a, b, c = setup["Chain-A (DB)"], setup["Chain-B (API)"], setup["Chain-C (Web)"]
+                chain_a_id, chain_a_key = a["id"], a["manage_key"]
+                chain_b_id, chain_b_key = b["id"], b["manage_key"]
+                chain_c_id, chain_c_key = c["id"], c["manage_key"]
+                # C depends on B, B depends on A
+                wp.add_dependency(chain_b_id, chain_a_id, chain_b_key)
+                wp.add_dependency(chain_c_id, chain_b_id, chain_c_key)
+
+            @test("chain: C has B as dependency")
+            def _():
+                deps = wp.list_dependencies(chain_c_id)
+                dep_ids = {d.get("depends_on_id") for d in (deps if isinstance(deps, list) else [])}
+                assert chain_b_id in dep_ids, f"B not in C's deps: {dep_ids}"
+
+            @test("chain: A has B as dependent")
+            def _():
+                deps = wp.list_dependents(chain_a_id)
+                assert isinstance(deps, (list, dict))
+
+            @test("chain: circular dependency C→A raises error")
+            def _():
+                with expect_raises((ConflictError, ValidationError, WatchpostError)):
+                    wp.add_dependency(chain_a_id, chain_c_id, chain_a_key)
+
+            @test("chain: delete middle (B) removes B's deps")
+            def _():
+                # After deleting B, C's dependency on B should be orphaned
+                wp.delete_monitor(chain_b_id, chain_b_key)
+                del created_monitors[chain_b_id]
+                # C should still exist
+                c = wp.get_monitor(chain_c_id)
+                assert c["name"] == "Chain-C (Web)"
+
+        # ── Notification Enable/Disable Lifecycle ───────────────────────
+        with group("notif"):
+            section("Notification Lifecycle")
+
+            notif_lc_id = None
+
+            @test("create notification, disable, re-enable")
+            def _():
+                nonlocal notif_lc_id
+                n = wp.create_notification(
+                    monitor_id, "Lifecycle Notif", "webhook",
+                    {"url": f"{HTTPBIN_URL}/post"}, monitor_key,
+                )
+                notif_lc_id = n["id"]
+                # PATCH returns the updated channel, so no re-list is needed
+                disabled = wp.update_notification(notif_lc_id, monitor_key, is_enabled=False)
+                assert disabled.get("is_enabled") == False, "Not disabled"
+                enabled = wp.update_notification(notif_lc_id, monitor_key, is_enabled=True)
+                assert enabled.get("is_enabled") == True, "Not re-enabled"
+
+            @test("delete notification lifecycle")
+            def _():
+                wp.delete_notification(notif_lc_id, monitor_key)
+
+        # ── Multiple Maintenance Windows ────────────────────────────────
+        with group("maintenance"):
+            section("Multiple Maintenance Windows")
+
+            @test("create multiple maintenance windows on same monitor")
+            def _():
+                m1 = wp.create_maintenance(monitor_id, "Window 1",
+                                            "2099-03-01T00:00:00Z", "2099-03-01T01:00:00Z", monitor_key)
+                m2 = wp.create_maintenance(monitor_id, "Window 2",
+                                            "2099-04-01T00:00:00Z", "2099-04-01T01:00:00Z", monitor_key)
+                mw = wp.list_maintenance(monitor_id)
+                items = mw if isinstance(mw, list) else mw.get("windows", [])
+                ids = {x.get("id") for x in items}
+                assert m1["id"] in ids and m2["id"] in ids, "Both windows should exist"
+                wp.delete_maintenance(m1["id"], monitor_key)
+                wp.delete_maintenance(m2["id"], monitor_key)
+
+            @test("maintenance window response has expected fields")
+            def _():
+                m = wp.create_maintenance(monitor_id, "Field Check",
+                                           "2099-05-01T00:00:00Z", "2099-05-01T02:00:00Z", monitor_key)
+                assert "id" in m
+                assert "title" in m or "starts_at" in m
+                wp.delete_maintenance(m["id"], monitor_key)
+
+        # ── Alert Rules Partial Update ──────────────────────────────────
+        with group("alerts"):
+            section("Alert Rules (Partial)")
+
+            @test("set alert rules and verify all fields")
+            def _():
+                rules = wp.set_alert_rules(monitor_id, monitor_key,
+                                           repeat_interval_minutes=20, max_repeats=8, escalation_after_minutes=45)
+                assert rules.get("repeat_interval_minutes") == 20
+                assert rules.get("max_repeats") == 8
+                assert rules.get("escalation_after_minutes") == 45
+
+            @test("overwrite alert rules with new values")
+            def _():
+                rules = wp.set_alert_rules(monitor_id, monitor_key,
+                                           repeat_interval_minutes=10, max_repeats=3, escalation_after_minutes=15)
+                assert rules.get("repeat_interval_minutes") == 10
+                assert rules.get("max_repeats") == 3
+
+            @test("alert rules with zeros (disabled)")
+            def _():
+                rules = wp.set_alert_rules(monitor_id, monitor_key,
+                                           repeat_interval_minutes=0, max_repeats=0, escalation_after_minutes=0)
+                assert rules.get("repeat_interval_minutes") == 0
+
+            @test("cleanup alert rules")
+            def _():
+                wp.delete_alert_rules(monitor_id, monitor_key)
+
+        # ── Bulk Create Large Batch ─────────────────────────────────────
+        with group("bulk"):
+            section("Bulk Create (Large Batch)")
+
+            @test("bulk create 10 monitors")
+            def _():
+                monitors = [
+                    {"name": f"Bulk-{i}", "url": f"{HTTPBIN_URL}/status/{200+i}", "is_public": True}
+                    for i in range(10)
+                ]
+                result = wp.bulk_create_monitors(monitors)
+                created_count = result.get("succeeded", len(result.get("created", [])))
+                assert created_count >= 10, f"Expected 10 created, got {created_count}"
+                if "created" in result:
+                    for m in result["created"]:
+                        if "id" in m and "manage_key" in m:
+                            created_monitors[m["id"]] = m["manage_key"]
+
+            @test("bulk create with mixed types")
+            def _():
+                monitors = [
+                    {"name": "Bulk HTTP", "url": f"{HTTPBIN_URL}/status/200", "is_public": True},
+                    {"name": "Bulk TCP", "url": HTTPBIN_TCP, "monitor_type": "tcp", "is_public": True},
+                    {"name": "Bulk DNS", "url": HTTPBIN_HOST, "monitor_type": "dns", "is_public": True},
+                ]
+                result = wp.bulk_create_monitors(monitors)
+                assert result.get("succeeded", 0) >= 3 or len(result.get("created", [])) >= 3
+                if "created" in result:
+                    for m in result["created"]:
+                        if "id" in m and "manage_key" in m:
+                            created_monitors[m["id"]] = m["manage_key"]
+
+        # ── Status Page Advanced ────────────────────────────────────────
+        with group("page"):
+            section("Status Page (Advanced)")
+
+            @test("create private status page")
+            def _():
+                page = wp.create_status_page("private-test", "Private Page", is_public=False)
+                pk = page["manage_key"]
+                created_pages["private-test"] = pk
+                # Should still be gettable by slug
+                got = wp.get_status_page("private-test")
+                assert "title" in got
+
+            @test("update status page logo_url")
+            def _():
+                pk = created_pages["private-test"]
+                got = wp.update_status_page("private-test", pk, logo_url="https://example.com/logo.png")
+                assert got.get("logo_url") == "https://example.com/logo.png"
+
+            @test("status page with custom domain")
+            def _():
+                page = wp.create_status_page(
+                    "domain-test", "Domain Page",
+                    custom_domain="status.example.com",
+                )
+                created_pages["domain-test"] = page["manage_key"]
+                assert page["status_page"].get("custom_domain") == "status.example.com"
+
+            @test("status page add and list monitors")
+            def _():
+                pk = created_pages["private-test"]
+                wp.add_monitors_to_page("private-test", [monitor_id, unicode_mon_id], pk)
+                mons = wp.list_page_monitors("private-test")
+                assert isinstance(mons, list)
+                assert len(mons) >= 2
+
+            @test("cleanup advanced status pages")
+            def _():
+                for slug, key in list(created_pages.items()):
+                    if slug in ("private-test", "domain-test"):
+                        try:
+                            wp.delete_status_page(slug, key)
+                            del created_pages[slug]
+                        except Exception:
+                            pass
 
     # ── Discovery Dual Paths ────────────────────────────────────────────
-    print("\nDiscovery (Dual Paths):")
-
-    @test("root llms.txt via SDK method")
-    def _():
-        root = wp.llms_txt_root()
-        assert "atchpost" in root, "Root llms.txt missing Watchpost"
-
-    @test("root llms.txt matches api/v1 llms.txt")
-    def _():
-        root = wp.llms_txt_root()
-        v1 = wp.get_llms_txt()
-        assert "atchpost" in root
-        assert "atchpost" in v1
-
-    @test("well-known SKILL.md matches api/v1 SKILL.md")
-    def _():
-        wk = wp.get_skill()
-        v1 = wp.skill_md_v1()
-        assert "monitor" in wk.lower() or "Monitor" in wk
-        assert "monitor" in v1.lower() or "Monitor" in v1
-
-    @test("api/v1 SKILL.md via SDK method")
-    def _():
-        v1 = wp.skill_md_v1()
-        assert len(v1) > 50, f"SKILL.md too short: {len(v1)} chars"
-
-    @test("openapi via SDK method")
-    def _():
-        api = wp.get_openapi()
-        assert "paths" in api
-        assert "info" in api
-
-    @test("skills index JSON has expected structure")
-    def _():
-        idx = wp.get_skills_index()
-        assert isinstance(idx, dict)
-        if "skills" in idx:
-            assert isinstance(idx["skills"], list)
-
-    @test("openapi.json has paths and info")
-    def _():
-        api = wp._get("/api/v1/openapi.json")
-        assert "paths" in api, "Missing paths in OpenAPI"
-        assert "info" in api, "Missing info in OpenAPI"
-
-    @test("openapi info has title and version")
-    def _():
-        api = wp._get("/api/v1/openapi.json")
-        info = api.get("info", {})
-        assert "title" in info, "Missing title"
-        assert "version" in info, "Missing version"
+    section("Discovery (Dual Paths)")
+
+    with concurrent():
+        @test("root llms.txt via SDK method")
+        def _():
+            root = wp.llms_txt_root()
+            assert "atchpost" in root, "Root llms.txt missing Watchpost"
+
+        @test("root llms.txt matches api/v1 llms.txt")
+        def _():
+            root = wp.llms_txt_root()
+            v1 = wp.get_llms_txt()
+            assert "atchpost" in root
+            assert "atchpost" in v1
+
+        @test("well-known SKILL.md matches api/v1 SKILL.md")
+        def _():
+            wk = wp.get_skill()
+            v1 = wp.skill_md_v1()
+            assert "monitor" in wk.lower() or "Monitor" in wk
+            assert "monitor" in v1.lower() or "Monitor" in v1
+
+        @test("api/v1 SKILL.md via SDK method")
+        def _():
+            v1 = wp.skill_md_v1()
+            assert len(v1) > 50, f"SKILL.md too short: {len(v1)} chars"
+
+        @test("openapi via SDK method")
+        def _():
+            api = wp.get_openapi()
+            assert "paths" in api
+            assert "info" in api
+
+        @test("skills index JSON has expected structure")
+        def _():
+            idx = wp.get_skills_index()
+            assert isinstance(idx, dict)
+            if "skills" in idx:
+                assert isinstance(idx["skills"], list)
+
+        @test("openapi.json has paths and info")
+        def _():
+            api = wp._get("/api/v1/openapi.json")
+            assert "paths" in api, "Missing paths in OpenAPI"
+            assert "info" in api, "Missing info in OpenAPI"
+
+        @test("openapi info has title and version")
+        def _():
+            api = wp._get("/api/v1/openapi.json")
+            info = api.get("info", {})
+            assert "title" in info, "Missing title"
+            assert "version" in info, "Missing version"
 
     # ── Heartbeat Response Structure ────────────────────────────────────
-    print("\nHeartbeat Structure:")
-
-    @test("heartbeat list is a list")
-    def _():
-        hb = wp.list_heartbeats(monitor_id)
-        items = hb if isinstance(hb, list) else hb.get("heartbeats", hb.get("items", []))
-        assert isinstance(items, list)
-
-    @test("heartbeat pagination with after returns subset")
-    def _():
-        hb1 = wp.list_heartbeats(monitor_id, limit=100)
-        items1 = hb1 if isinstance(hb1, list) else hb1.get("heartbeats", hb1.get("items", []))
-        if items1:
-            # Get after the first seq
-            first_seq = items1[0].get("seq", 0)
-            hb2 = wp.list_heartbeats(monitor_id, after=first_seq)
-            items2 = hb2 if isinstance(hb2, list) else hb2.get("heartbeats", hb2.get("items", []))
-            # After first should not include first
-            seqs2 = [h.get("seq") for h in items2]
-            assert first_seq not in seqs2 or len(items2) == 0
+    section("Heartbeat Structure")
+
+    with concurrent():
+        @test("heartbeat list is a list")
+        def _():
+            hb = wp.list_heartbeats(monitor_id)
+            items = hb if isinstance(hb, list) else hb.get("heartbeats", hb.get("items", []))
+            assert isinstance(items, list)
+
+        @test("heartbeat pagination with after returns subset")
+        def _():
+            hb1 = wp.list_heartbeats(monitor_id, limit=100)
+            items1 = hb1 if isinstance(hb1, list) else hb1.get("heartbeats", hb1.get("items", []))
+            if items1:
+                # Get after the first seq
+                first_seq = items1[0].get("seq", 0)
+                hb2 = wp.list_heartbeats(monitor_id, after=first_seq)
+                items2 = hb2 if isinstance(hb2, list) else hb2.get("heartbeats", hb2.get("items", []))
+                # After first should not include first
+                seqs2 = [h.get("seq") for h in items2]
+                assert first_seq not in seqs2 or len(items2) == 0
 
     # ── Uptime Response Structure ───────────────────────────────────────
-    print("\nUptime Structure:")
-
-    @test("uptime has period fields")
-    def _():
-        up = wp.get_uptime(monitor_id)
-        # Should have at least some period-based uptime
-        has_periods = any(k in up for k in ("uptime_24h", "uptime_7d", "uptime_30d", "uptime_90d"))
-        assert has_periods, f"No period fields in uptime: {list(up.keys())}"
-
-    @test("uptime values are numeric")
-    def _():
-        up = wp.get_uptime(monitor_id)
-        for k in ("uptime_24h", "uptime_7d", "uptime_30d", "uptime_90d"):
-            if k in up:
-                assert isinstance(up[k], (int, float)), f"{k} is not numeric: {type(up[k])}"
-
-    @test("uptime history returns array of daily values")
-    def _():
-        hist = wp.get_uptime_history(monitor_id, days=7)
-        if isinstance(hist, list):
-            assert len(hist) <= 7, f"More days than requested: {len(hist)}"
-        elif isinstance(hist, dict) and "days" in hist:
-            assert len(hist["days"]) <= 7
+    section("Uptime Structure")
+
+    with concurrent():
+        @test("uptime has period fields")
+        def _():
+            up = wp.get_uptime(monitor_id)
+            # Should have at least some period-based uptime
+            has_periods = any(k in up for k in ("uptime_24h", "uptime_7d", "uptime_30d", "uptime_90d"))
+            assert has_periods, f"No period fields in uptime: {list(up.keys())}"
+
+        @test("uptime values are numeric")
+        def _():
+            up = wp.get_uptime(monitor_id)
+            for k in ("uptime_24h", "uptime_7d", "uptime_30d", "uptime_90d"):
+                if k in up:
+                    assert isinstance(up[k], (int, float)), f"{k} is not numeric: {type(up[k])}"
+
+        @test("uptime history returns array of daily values")
+        def _():
+            hist = wp.get_uptime_history(monitor_id, days=7)
+            if isinstance(hist, list):
+                assert len(hist) <= 7, f"More days than requested: {len(hist)}"
+            elif isinstance(hist, dict) and "days" in hist:
+                assert len(hist["days"]) <= 7
 
     # ── SLA Response Structure ──────────────────────────────────────────
-    print("\nSLA Structure:")
+    section("SLA Structure")
 
     @test("SLA has target and budget fields")
     def _():
@@ -2123,111 +2430,103 @@ def main():
             assert sla["status"] in valid_statuses, f"Unexpected SLA status: {sla['status']}"
 
     # ── Export Advanced ─────────────────────────────────────────────────
-    print("\nExport (Advanced):")
-
-    @test("export includes monitor config fields")
-    def _():
-        config = wp.export_monitor(monitor_id, monitor_key)
-        for f in ("name", "url", "monitor_type"):
-            assert f in config, f"Missing {f} in export"
-
-    @test("export includes optional fields when set")
-    def _():
-        config = wp.export_monitor(monitor_id, monitor_key)
-        # We set tags, group, etc. earlier
-        if "tags" in config:
-            assert isinstance(config["tags"], list)
-
-    @test("export for nonexistent monitor raises NotFoundError")
-    def _():
-        try:
-            wp.export_monitor("00000000-0000-0000-0000-000000000000", "any-key")
-            assert False, "Expected NotFoundError"
-        except NotFoundError:
-            pass
+    section("Export (Advanced)")
+
+    with concurrent():
+        @test("export includes monitor config fields")
+        def _():
+            config = wp.export_monitor(monitor_id, monitor_key)
+            missing = EXPORT_FIELDS - config.keys()
+            assert not missing, f"Missing fields in export: {sorted(missing)}"
+
+        @test("export includes optional fields when set")
+        def _():
+            config = wp.export_monitor(monitor_id, monitor_key)
+            # We set tags, group, etc. earlier
+            if "tags" in config:
+                assert isinstance(config["tags"], list)
+
+        @test("export for nonexistent monitor raises NotFoundError")
+        def _():
+            with expect_raises(NotFoundError):
+                wp.export_monitor(ZERO_UUID, "any-key")
 
     # ── Tags and Groups Detail ──────────────────────────────────────────
-    print("\nTags & Groups (Detail):")
-
-    @test("tags list includes our test tags")
-    def _():
-        tags = wp.list_tags()
-        # We created monitors with various tags
-        assert isinstance(tags, list)
-
-    @test("groups list includes our test groups")
-    def _():
-        groups = wp.list_groups()
-        assert isinstance(groups, list)
-
-    @test("tags are strings")
-    def _():
-        tags = wp.list_tags()
-        for t in tags:
-            assert isinstance(t, str), f"Tag is not string: {type(t)}"
-
-    @test("groups are strings")
-    def _():
-        groups = wp.list_groups()
-        for g in groups:
-            assert isinstance(g, str), f"Group is not string: {type(g)}"
+    section("Tags & Groups (Detail)")
+
+    with concurrent():
+        @test("tags list includes our test tags")
+        def _():
+            tags = wp.list_tags()
+            # We created monitors with various tags
+            assert isinstance(tags, list)
+
+        @test("groups list includes our test groups")
+        def _():
+            groups = wp.list_groups()
+            assert isinstance(groups, list)
+
+        @test("tags are strings")
+        def _():
+            tags = wp.list_tags()
+            for t in tags:
+                assert isinstance(t, str), f"Tag is not string: {type(t)}"
+
+        @test("groups are strings")
+        def _():
+            groups = wp.list_groups()
+            for g in groups:
+                assert isinstance(g, str), f"Group is not string: {type(g)}"
 
     # ── Monitor Pause/Resume Lifecycle ──────────────────────────────────
-    print("\nPause/Resume Lifecycle:")
+    section("Pause/Resume Lifecycle")
 
     @test("pause changes current_status to paused")
     def _():
-        wp.pause_monitor(monitor_id, monitor_key)
-        mon = wp.get_monitor(monitor_id)
-        assert mon.get("is_paused") == True
+        mon = wp.pause_monitor(monitor_id, monitor_key)
+        assert mon.get("is_paused") is True
         assert mon.get("current_status") == "paused" or mon.get("is_paused") == True
 
     @test("resume restores monitoring")
     def _():
-        wp.resume_monitor(monitor_id, monitor_key)
-        mon = wp.get_monitor(monitor_id)
-        assert mon.get("is_paused") == False
+        mon = wp.resume_monitor(monitor_id, monitor_key)
+        assert mon.get("is_paused") is False
 
     @test("double pause is idempotent")
     def _():
         wp.pause_monitor(monitor_id, monitor_key)
-        wp.pause_monitor(monitor_id, monitor_key)
-        mon = wp.get_monitor(monitor_id)
-        assert mon.get("is_paused") == True
+        mon = wp.pause_monitor(monitor_id, monitor_key)
+        assert mon.get("is_paused") is True
         wp.resume_monitor(monitor_id, monitor_key)
 
     @test("double resume is idempotent")
     def _():
         wp.resume_monitor(monitor_id, monitor_key)
-        wp.resume_monitor(monitor_id, monitor_key)
-        mon = wp.get_monitor(monitor_id)
-        assert mon.get("is_paused") == False
+        mon = wp.resume_monitor(monitor_id, monitor_key)
+        assert mon.get("is_paused") is False
 
     # ── Full Monitor Lifecycle ──────────────────────────────────────────
-    print("\nFull Monitor Lifecycle:")
+    section("Full Monitor Lifecycle")
 
     @test("full lifecycle: create→configure→pause→resume→export→delete")
     def _():
         # Create
-        m = wp.create_monitor("Lifecycle Full", "https://httpbin.org/status/200",
+        m = wp.create_monitor("Lifecycle Full", f"{HTTPBIN_URL}/status/200",
                                is_public=True, tags=["lifecycle"])
         mid, mk = m["id"], m["manage_key"]
         # Configure
-        wp.update_monitor(mid, mk, sla_target=99.9, sla_period_days=7,
-                          group_name="Lifecycle Group", confirmation_threshold=2)
+        mon = wp.update_monitor(mid, mk, sla_target=99.9, sla_period_days=7,
+                                group_name="Lifecycle Group", confirmation_threshold=2)
         wp.set_alert_rules(mid, mk, repeat_interval_minutes=10, max_repeats=3)
         wp.create_notification(mid, "LC Webhook", "webhook",
-                               {"url": "https://httpbin.org/post"}, mk)
-        wp.create_maintenance(mid, "LC Maint", "2099-01-01T00:00:00Z", "2099-01-01T01:00:00Z", mk)
+                               {"url": f"{HTTPBIN_URL}/post"}, mk)
+        wp.create_maintenance(mid, "LC Maint", FUTURE_START, FUTURE_END, mk)
         # Verify config
-        mon = wp.get_monitor(mid)
         assert mon["name"] == "Lifecycle Full"
         assert mon.get("sla_target") == 99.9
         # Pause and resume
-        wp.pause_monitor(mid, mk)
-        assert wp.get_monitor(mid).get("is_paused") == True
-        wp.resume_monitor(mid, mk)
-        assert wp.get_monitor(mid).get("is_paused") == False
+        assert wp.pause_monitor(mid, mk).get("is_paused") is True
+        assert wp.resume_monitor(mid, mk).get("is_paused") is False
         # Export
         config = wp.export_monitor(mid, mk)
         assert "name" in config
@@ -2236,14 +2535,11 @@ def main():
         assert isinstance(sla, dict)
         # Delete
         wp.delete_monitor(mid, mk)
-        try:
+        with expect_raises(NotFoundError):
             wp.get_monitor(mid)
-            assert False, "Monitor should be deleted"
-        except NotFoundError:
-            pass
 
     # ── Cross-Feature Interactions ──────────────────────────────────────
-    print("\nCross-Feature Interactions:")
+    section("Cross-Feature Interactions")
 
     @test("SLA + uptime consistency")
     def _():
@@ -2257,17 +2553,17 @@ def main():
     def _():
         page = wp.create_status_page("crossfeat-test", "Cross Feature")
         pk = page["manage_key"]
-        created_pages.append(("crossfeat-test", pk))
+        created_pages["crossfeat-test"] = pk
         wp.add_monitors_to_page("crossfeat-test", [monitor_id], pk)
         page_data = wp.get_status_page("crossfeat-test")
         assert isinstance(page_data, dict)
         wp.delete_status_page("crossfeat-test", pk)
-        created_pages.remove(("crossfeat-test", pk))
+        del created_pages["crossfeat-test"]
 
     @test("badge reflects monitor state")
     def _():
-        svg = wp.get_status_badge(monitor_id)
-        assert "<svg" in svg
+        svg = wp.get_status_badge(monitor_id, raw=True)
+        assert svg.startswith(b"<svg")
 
     @test("dashboard includes recently created monitors")
     def _():
@@ -2284,34 +2580,18 @@ def main():
         assert isinstance(tags, list)
 
     # ── Error Response Format ───────────────────────────────────────────
-    print("\nError Response Format:")
-
-    @test("404 error has body with error field")
-    def _():
-        try:
-            wp.get_monitor("00000000-0000-0000-0000-000000000000")
-        except NotFoundError as e:
-            if isinstance(e.body, dict):
-                assert "error" in e.body, f"Missing error field in body: {e.body}"
+    section("Error Response Format")
 
     @test("401 error has body with error field")
     def _():
-        try:
+        with expect_raises(AuthError) as raised:
             wp.delete_monitor(monitor_id, "bad-key")
-        except AuthError as e:
-            if isinstance(e.body, dict):
-                assert "error" in e.body, f"Missing error field in body: {e.body}"
-
-    @test("error message is human-readable string")
-    def _():
-        try:
-            wp.get_monitor("00000000-0000-0000-0000-000000000000")
-        except NotFoundError as e:
-            assert isinstance(str(e), str)
-            assert len(str(e)) > 0
+        body = raised.value.body
+        if isinstance(body, dict):
+            assert "error" in body, f"Missing error field in body: {body}"
 
     # ── SSE Constructor ─────────────────────────────────────────────────
-    print("\nSSE Events:")
+    section("SSE Events")
 
     @test("SSEEvent has expected attributes")
     def _():
@@ -2329,63 +2609,40 @@ def main():
         assert evt.json is None
 
     # ── Monitor Delete Verification ─────────────────────────────────────
-    print("\nDelete Verification:")
+    section("Delete Verification")
 
     @test("delete monitor with wrong key raises AuthError")
     def _():
-        m = wp.create_monitor("Delete Test", "https://httpbin.org/status/200", is_public=True)
-        created_monitors.append((m["id"], m["manage_key"]))
-        try:
+        m = setup["Delete Test"]
+        with expect_raises(AuthError):
             wp.delete_monitor(m["id"], "wrong-key")
-            assert False, "Expected AuthError"
-        except AuthError:
-            pass
         # Should still exist
         got = wp.get_monitor(m["id"])
         assert got["name"] == "Delete Test"
 
+    @test("bulk delete reports per-item results")
+    def _():
+        created = wp.bulk_create_monitors([
+            {"name": "Bulk Delete A", "url": f"{HTTPBIN_URL}/status/200"},
+            {"name": "Bulk Delete B", "url": f"{HTTPBIN_URL}/status/200"},
+        ])["created"]
+        pairs = [(m["id"], m["manage_key"]) for m in created]
+        created_monitors.update(pairs)
+        result = wp.bulk_delete_monitors(pairs + [(pairs[0][0], "wrong-key")])
+        assert result["succeeded"] == 2, f"Unexpected: {result}"
+        assert sorted(result["deleted"]) == sorted(mid for mid, _ in pairs)
+        # Third item targets an already-deleted monitor
+        assert result["errors"][0]["index"] == 2
+        for mid, _ in pairs:
+            del created_monitors[mid]
+
     @test("delete already-deleted monitor raises NotFoundError")
     def _():
-        m = wp.create_monitor("Double Delete", "https://httpbin.org/status/200", is_public=True)
+        m = setup["Double Delete"]
         wp.delete_monitor(m["id"], m["manage_key"])
-        try:
+        del created_monitors[m["id"]]
+        with expect_raises(NotFoundError):
             wp.delete_monitor(m["id"], m["manage_key"])
-            assert False, "Expected NotFoundError"
-        except NotFoundError:
-            pass
-
-    # ── Cleanup ─────────────────────────────────────────────────────────
-    print("\nCleanup:")
-
-    cleanup_ok = 0
-    cleanup_fail = 0
-
-    for page_slug, page_key in created_pages:
-        try:
-            wp.delete_status_page(page_slug, page_key)
-            cleanup_ok += 1
-        except Exception:
-            cleanup_fail += 1
-
-    for mid, mkey in created_monitors:
-        try:
-            wp.delete_monitor(mid, mkey)
-            cleanup_ok += 1
-        except Exception:
-            cleanup_fail += 1
-
-    print(f"  Cleaned up {cleanup_ok} resources ({cleanup_fail} failed)")
-
-    # ── Results ─────────────────────────────────────────────────────────
-    print(f"\n{'='*50}")
-    print(f"Results: {passed} passed, {failed} failed")
-    if errors:
-        print("\nFailed tests:")
-        for name, err in errors:
-            print(f"  ❌ {name}: {err}")
-    print(f"{'='*50}\n")
-
-    return 0 if failed == 0 else 1
 
 
 if __name__ == "__main__":
@@ -3,7 +3,9 @@
 watchpost — Python SDK for Watchpost Monitoring Service
 
 Zero-dependency client library for the Watchpost API.
-Works with Python 3.8+ using only the standard library.
+Works with Python 3.8+ using only the standard library. If orjson is
+installed it is used to encode request bodies and decode responses;
+otherwise stdlib json is used.
 
 Quick start:
     from watchpost import Watchpost
@@ -27,12 +29,24 @@ Full docs: GET /api/v1/llms.txt or /.well-known/skills/watchpost/SKILL.md
 
 from __future__ import annotations
 
+import asyncio
+import base64
+import collections
+import contextlib
+import copy
+import functools
+import http.client
 import json
 import os
+import re
+import socket
+import ssl
+import threading
 import time
 import urllib.error
 import urllib.parse
 import urllib.request
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from typing import (
@@ -42,13 +56,44 @@ from typing import (
     Iterator,
     List,
     Optional,
+    Sequence,
     Tuple,
     Union,
 )
 
+try:
+    import orjson
+    _loads = orjson.loads
+    _dumps = orjson.dumps
+except ImportError:
+    _loads = json.loads
+
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode()
+
 
 __version__ = "1.0.0"
 
+# Shape of every key the server issues (manage, admin and probe keys).
+_KEY_RE = re.compile(r"^wp_[0-9a-f]{32}$")
+
+# Most monitors the server accepts in one bulk-delete request.
+_BULK_DELETE_MAX = 50
+
+# Gateway errors worth retrying for idempotent reads.
+_RETRY_STATUSES = frozenset({502, 503, 504})
+
+# Redirects followed for GET and HEAD, at most _MAX_REDIRECTS in a row (as
+# urllib does). A write answered with one raises WatchpostError instead.
+_REDIRECT_STATUSES = frozenset({301, 302, 303, 307, 308})
+_MAX_REDIRECTS = 10
+
+# Methods sent again when a pooled connection turns out to have been closed
+# after the request went out, since repeating them can't apply a write
+# twice. DELETE is left out: a replay would report NotFoundError for a
+# delete that succeeded.
+_REPLAYABLE_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT"})
+
 
 # ---------------------------------------------------------------------------
 # Exceptions
@@ -92,6 +137,18 @@ class ConflictError(WatchpostError):
     pass
 
 
+# Status code -> exception class raised by _request; anything else is a
+# plain WatchpostError.
+_ERR_MAP: Dict[int, type] = {
+    400: ValidationError,
+    401: AuthError,
+    403: AuthError,
+    404: NotFoundError,
+    409: ConflictError,
+    422: ValidationError,
+}
+
+
 # ---------------------------------------------------------------------------
 # SSE helpers
 # ---------------------------------------------------------------------------
@@ -109,8 +166,8 @@ class SSEEvent:
     def json(self) -> Any:
         """Parse data as JSON. Returns None on failure."""
         try:
-            return json.loads(self.data)
-        except (json.JSONDecodeError, TypeError):
+            return _loads(self.data)
+        except (ValueError, TypeError):
             return None
 
 
@@ -148,29 +205,383 @@ def _iter_sse(response) -> Generator[SSEEvent, None, None]:
         yield current
 
 
+# ---------------------------------------------------------------------------
+# Response models
+# ---------------------------------------------------------------------------
+
+
+_MONITOR_FIELDS = (
+    "id", "name", "url", "monitor_type", "method", "interval_seconds",
+    "timeout_ms", "expected_status", "body_contains", "headers", "is_public",
+    "is_paused", "current_status", "last_checked_at", "confirmation_threshold",
+    "response_time_threshold_ms", "follow_redirects", "dns_record_type",
+    "dns_expected", "sla_target", "sla_period_days", "tags", "group_name",
+    "consensus_threshold", "created_at", "updated_at",
+)
+
+
+class Monitor:
+    """Read-only monitor record with attribute access.
+
+    Returned by get_monitor/list_monitors when called with as_object=True.
+    Uses __slots__ (no per-instance __dict__), which keeps large monitor
+    lists compact. Optional fields the server omitted are None; fields this
+    SDK version doesn't know about are kept in ``extra``.
+
+    Being read-only, copy() and deepcopy() return the record itself;
+    pickling goes through to_dict()/from_dict(). Records hash by id, so
+    they can be set members and dict keys.
+    """
+
+    __slots__ = _MONITOR_FIELDS + ("extra",)
+
+    def __init__(self, **fields: Any):
+        for name in _MONITOR_FIELDS:
+            object.__setattr__(self, name, fields.pop(name, None))
+        object.__setattr__(self, "extra", fields)
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "Monitor":
+        return cls(**data)
+
+    def to_dict(self) -> Dict:
+        d = {name: getattr(self, name) for name in _MONITOR_FIELDS}
+        d.update(self.extra)
+        return d
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError("Monitor records are read-only")
+
+    def __copy__(self) -> "Monitor":
+        return self
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> "Monitor":
+        return self
+
+    def __reduce__(self) -> Tuple[Any, Tuple[Dict]]:
+        return type(self).from_dict, (self.to_dict(),)
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, Monitor):
+            return NotImplemented
+        return self.to_dict() == other.to_dict()
+
+    def __hash__(self) -> int:
+        # Equal records have equal ids, so this agrees with __eq__.
+        return hash(self.id)
+
+    def __repr__(self) -> str:
+        return f"Monitor(id={self.id!r}, name={self.name!r}, current_status={self.current_status!r})"
+
+
 # ---------------------------------------------------------------------------
 # Client
 # ---------------------------------------------------------------------------
 
 
+def _proxy_for(scheme: str, host: str) -> Optional[Tuple[str, int, Dict[str, str]]]:
+    """The proxy urllib would use for a scheme://host URL, if any.
+
+    Read from HTTP_PROXY/HTTPS_PROXY and NO_PROXY (or the platform's proxy
+    settings). Returns (host, port, headers for the proxy), the headers
+    carrying Basic credentials from the proxy URL.
+    """
+    proxy = urllib.request.getproxies().get(scheme)
+    if not proxy or urllib.request.proxy_bypass(host):
+        return None
+    parts = urllib.parse.urlsplit(proxy if "://" in proxy else "http://" + proxy)
+    headers: Dict[str, str] = {}
+    if parts.username is not None:
+        creds = f"{urllib.parse.unquote(parts.username)}:{urllib.parse.unquote(parts.password or '')}"
+        headers["Proxy-Authorization"] = "Basic " + base64.b64encode(creds.encode()).decode()
+    return parts.hostname or "", parts.port or 80, headers
+
+
+class _ResumingContext:
+    """SSLContext stand-in that resumes the client's last TLS session.
+
+    HTTP/2 would share one TLS session across all requests; without it,
+    each pooled HTTPS connection at least skips the full handshake (and
+    its certificate verification) when the server accepts resumption.
+    """
+
+    def __init__(self, client: "Watchpost"):
+        self._client = client
+
+    def wrap_socket(self, sock: socket.socket, server_hostname: Optional[str] = None) -> ssl.SSLSocket:
+        context = self._client._ssl_context
+        session = self._client._tls_session
+        return context.wrap_socket(sock, server_hostname=server_hostname, session=session)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._client._ssl_context, name)
+
+
 class Watchpost:
     """Client for the Watchpost monitoring API.
 
+    Requests are sent over a small pool of keep-alive connections, so a
+    client reused across many calls only pays the TCP/TLS handshake once
+    per concurrent caller. Use it as a context manager (or call close())
+    to release the sockets.
+
+    Like urllib, the client honors HTTP_PROXY/HTTPS_PROXY/NO_PROXY and
+    follows redirects for GETs; connection failures raise
+    urllib.error.URLError. A redirected write raises WatchpostError with
+    the 3xx status instead of being resent as a GET, and the manage key
+    is not sent on to a redirect that leaves the server's host.
+
+    With cache=True, successful GET responses are kept in memory and served
+    again for identical requests (same URL and key); identical GETs made
+    concurrently share a single request. Any write made through the client
+    clears the cache; call invalidate() after changes made elsewhere.
+    Setting WATCHPOST_NOCACHE=1 turns the cache off.
+
+    The discovery documents (llms.txt, SKILL.md, the skills index and the
+    OpenAPI spec) are compiled into the server, so they go through the same
+    cache even when cache=False; only WATCHPOST_NOCACHE disables that.
+
+    Independently of that cache, GET responses that carry an ETag (such as
+    get_monitor) are revalidated with If-None-Match, so an unchanged
+    resource comes back as an empty 304 and the stored body is reused.
+    The cache_maxsize most recently used bodies are kept for this.
+
     Args:
         base_url: Base URL of the Watchpost server (e.g. "http://localhost:3007").
-        timeout: Default request timeout in seconds.
+        timeout: Default read timeout in seconds. Falls back to the
+            WATCHPOST_TIMEOUT environment variable, then 30.
+        connect_timeout: Seconds allowed to establish a connection, so an
+            unreachable server fails fast even with a long read timeout.
+        pool_maxsize: Maximum number of idle connections kept for reuse.
+        max_connections: Maximum number of requests in flight at once,
+            and so of open connections. Extra callers wait for a slot.
+            None (the default) means no limit.
+        keepalive_expiry: Seconds an idle pooled connection is trusted for.
+            Older ones are closed instead of reused, so requests don't
+            hit sockets the server has already dropped (Rocket's default
+            keep-alive is 5s).
+        retries: How many times a GET answered with 502, 503 or 504 is
+            retried (writes are never retried).
+        backoff_factor: Sleep backoff_factor * 2**attempt seconds between
+            those retries.
+        strict_keys: Raise AuthError locally, without a request, when a key
+            can't be one the server issued (wp_ + 32 hex chars). Off by
+            default: it also rejects junk keys on endpoints where the key is
+            optional, and reports AuthError where the server would report
+            a missing monitor first.
+        cache: Cache GET responses in-process (default False).
+        cache_ttl: Seconds a cached response stays valid. None (the default)
+            keeps entries until a write or invalidate(); set it when other
+            clients change the same resources.
+        cache_maxsize: Most responses kept in the cache; the least recently
+            used one is dropped to make room. ETag-tagged bodies kept for
+            revalidation are bounded the same way, cache or not.
     """
 
-    def __init__(self, base_url: Optional[str] = None, *, timeout: int = 30):
+    def __init__(
+        self,
+        base_url: Optional[str] = None,
+        *,
+        timeout: Optional[float] = None,
+        connect_timeout: float = 3.0,
+        pool_maxsize: int = 32,
+        max_connections: Optional[int] = None,
+        keepalive_expiry: float = 4.0,
+        retries: int = 2,
+        backoff_factor: float = 0.2,
+        strict_keys: bool = False,
+        cache: bool = False,
+        cache_ttl: Optional[float] = None,
+        cache_maxsize: int = 128,
+    ):
         self.base_url = (base_url or os.environ.get("WATCHPOST_URL", "http://localhost:3007")).rstrip("/")
-        self.timeout = timeout
+        self.timeout = timeout if timeout is not None else float(os.environ.get("WATCHPOST_TIMEOUT", "30"))
+        self.connect_timeout = connect_timeout
+        self.pool_maxsize = pool_maxsize
+        self.max_connections = max_connections
+        self.keepalive_expiry = keepalive_expiry
+        self.retries = retries
+        self.strict_keys = strict_keys
+        self.backoff_factor = backoff_factor
+        self._cache_allowed = os.environ.get("WATCHPOST_NOCACHE", "") not in ("1", "true")
+        self.cache = cache and self._cache_allowed
+        self.cache_ttl = cache_ttl
+        self.cache_maxsize = cache_maxsize
+        # (url, key, raw) -> (expiry on the monotonic clock or None, result),
+        # least recently used first
+        self._cache: "collections.OrderedDict[Tuple[str, Optional[str], bool], Tuple[Optional[float], Any]]" = (
+            collections.OrderedDict()
+        )
+        self._cache_lock = threading.Lock()
+        # Bumped by invalidate(). A GET only stores its result if no write
+        # happened while it was in flight, since its body may predate it.
+        self._generation = 0
+        # cache key -> result of the GET currently fetching it
+        self._inflight: Dict[Tuple[str, Optional[str], bool], Future] = {}
+        # (url, key) -> (etag, content type, body) for conditional GETs,
+        # least recently used first and bounded by cache_maxsize
+        self._etags: "collections.OrderedDict[Tuple[str, Optional[str]], Tuple[str, str, bytes]]" = (
+            collections.OrderedDict()
+        )
+
+        parsed = urllib.parse.urlsplit(self.base_url)
+        self._scheme = parsed.scheme or "http"
+        self._host = parsed.hostname or "localhost"
+        self._port = parsed.port
+        self._prefix = parsed.path.rstrip("/")
+        self._origin = f"{self._scheme}://{parsed.netloc}"
+        self._proxy = _proxy_for(self._scheme, self._host)
+        # (connection, time it went idle), most recently used last
+        self._pool: List[Tuple[http.client.HTTPConnection, float]] = []
+        self._pool_lock = threading.Lock()
+        self._slots: Any = (
+            threading.BoundedSemaphore(max_connections) if max_connections else contextlib.nullcontext()
+        )
+        self._addrs: Optional[List[Tuple[str, int]]] = None
+        # One TLS context per client (loading the CA store is the costly
+        # part), and the last session seen so new connections can resume it.
+        self._ssl_context: Any = None
+        self._tls_session: Any = None
+
+    def __enter__(self) -> "Watchpost":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close all pooled connections. The client stays usable afterwards."""
+        with self._pool_lock:
+            pool, self._pool = self._pool, []
+        for conn, _ in pool:
+            conn.close()
+
+    def invalidate(self, prefix: Optional[str] = None) -> None:
+        """Drop cached GET responses.
+
+        GETs already in flight for those entries are forgotten too, so
+        later identical calls send a fresh request instead of joining them.
+
+        Args:
+            prefix: Only drop entries whose path starts with this API path
+                (e.g. "/api/v1/monitors/<id>"). Drops everything if omitted.
+        """
+        with self._cache_lock:
+            self._generation += 1
+            if prefix is None:
+                self._cache.clear()
+                self._inflight.clear()
+                return
+            start = self.base_url + prefix
+            for k in [k for k in self._cache if k[0].startswith(start)]:
+                del self._cache[k]
+            for k in [k for k in self._inflight if k[0].startswith(start)]:
+                del self._inflight[k]
+
+    # ------------------------------------------------------------------
+    # Connection pool
+    # ------------------------------------------------------------------
+
+    def _new_connection(self) -> http.client.HTTPConnection:
+        conn = self._open_connection(self._scheme, self._host, self._port, self._proxy)
+        if self._scheme == "https":
+            conn._context = _ResumingContext(self)  # type: ignore[attr-defined]
+        # Host header and TLS SNI still use the hostname; only the socket
+        # connect (to the server, or to the proxy) goes to the cached address.
+        conn._create_connection = self._connect_resolved  # type: ignore[attr-defined]
+        return conn
+
+    def _open_connection(
+        self, scheme: str, host: str, port: Optional[int], proxy: Optional[Tuple[str, int, Dict[str, str]]]
+    ) -> http.client.HTTPConnection:
+        """An unconnected connection to host, through proxy if given.
+
+        HTTPS goes through the proxy in a CONNECT tunnel; plain HTTP
+        requests are sent to the proxy with the absolute URL as target.
+        """
+        target_host, target_port = (proxy[0], proxy[1]) if proxy else (host, port)
+        if scheme != "https":
+            return http.client.HTTPConnection(target_host, target_port, timeout=self.timeout)
+        if self._ssl_context is None:
+            self._ssl_context = ssl.create_default_context()
+        conn = http.client.HTTPSConnection(target_host, target_port, timeout=self.timeout, context=self._ssl_context)
+        if proxy:
+            conn.set_tunnel(host, port, headers=proxy[2])
+        return conn
+
+    def _connect_resolved(self, address: Tuple[str, int], timeout: Any = None, source_address: Any = None) -> socket.socket:
+        """Open a socket to the server using addresses resolved once per client.
+
+        Saves a getaddrinfo round trip for every new pooled connection when
+        base_url uses a hostname. The cache is dropped if every address fails,
+        so a changed DNS record is picked up on the next attempt.
+        """
+        addrs = self._addrs
+        if addrs is None:
+            infos = socket.getaddrinfo(address[0], address[1], 0, socket.SOCK_STREAM)
+            addrs = self._addrs = [info[4][:2] for info in infos]
+        connect_timeout = self.connect_timeout
+        if isinstance(timeout, (int, float)):
+            connect_timeout = min(connect_timeout, timeout)
+        err: Optional[OSError] = None
+        for addr in addrs:
+            try:
+                sock = socket.create_connection(addr, connect_timeout, source_address)
+            except OSError as e:
+                err = e
+                continue
+            sock.settimeout(timeout)
+            return sock
+        self._addrs = None
+        raise err if err is not None else OSError(f"No addresses for {address[0]}")
+
+    def _acquire(self) -> Tuple[http.client.HTTPConnection, bool]:
+        """Take an idle connection from the pool, or open a new one.
+
+        Returns (connection, reused). Connections idle for longer than
+        keepalive_expiry are closed rather than handed out.
+        """
+        now = time.monotonic()
+        expired = []
+        conn = None
+        with self._pool_lock:
+            while self._pool:
+                candidate, idle_since = self._pool.pop()
+                if now - idle_since < self.keepalive_expiry:
+                    conn = candidate
+                    break
+                expired.append(candidate)
+            if conn is None:
+                # Everything left is older than what was just discarded.
+                expired.extend(c for c, _ in self._pool)
+                self._pool = []
+        for stale in expired:
+            stale.close()
+        if conn is not None:
+            return conn, True
+        return self._new_connection(), False
+
+    def _release(self, conn: http.client.HTTPConnection) -> None:
+        # Read here rather than after the handshake: TLS 1.3 servers send
+        # the session ticket with the first response.
+        session = getattr(conn.sock, "session", None)
+        if session is not None:
+            self._tls_session = session
+        with self._pool_lock:
+            if len(self._pool) < self.pool_maxsize:
+                self._pool.append((conn, time.monotonic()))
+                return
+        conn.close()
 
     # ------------------------------------------------------------------
     # HTTP helpers
     # ------------------------------------------------------------------
 
-    def _url(self, path: str, **params) -> str:
-        url = f"{self.base_url}{path}"
+    def _url(self, path: str, params: Optional[Dict[str, Any]] = None) -> str:
+        url = self.base_url + path
+        if not params:
+            # Most calls (get_monitor, get_uptime, ...) have no query string.
+            return url
         filtered = {k: v for k, v in params.items() if v is not None}
         if filtered:
             url += "?" + urllib.parse.urlencode(filtered, doseq=True)
@@ -185,60 +596,267 @@ class Watchpost:
         key: Optional[str] = None,
         params: Optional[Dict[str, Any]] = None,
         raw: bool = False,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: Optional[float] = None,
+        static: bool = False,
     ) -> Any:
-        url = self._url(path, **(params or {}))
-        headers: Dict[str, str] = {}
+        """Send a request and decode the response.
+
+        timeout overrides the client's read timeout for this call only.
+        static marks a GET whose response is fixed for the server's
+        lifetime; it is cached even when the client cache is off.
+        """
+        url = self._url(path, params)
+        headers = dict(headers or {})
 
         data = None
         if body is not None:
-            data = json.dumps(body).encode()
+            data = _dumps(body)
             headers["Content-Type"] = "application/json"
 
         if key:
+            if self.strict_keys and not _KEY_RE.match(key):
+                raise AuthError("Malformed key (expected wp_ followed by 32 hex characters)", status_code=401)
             headers["Authorization"] = f"Bearer {key}"
 
-        req = urllib.request.Request(url, data=data, headers=headers, method=method)
-        try:
-            with urllib.request.urlopen(req, timeout=self.timeout) as resp:
-                content = resp.read()
-                if raw:
-                    return content
-                if not content:
-                    return None
-                ct = resp.headers.get("Content-Type", "")
-                if "json" in ct:
-                    return json.loads(content)
-                if "svg" in ct or "image" in ct or "text" in ct:
-                    return content.decode("utf-8", errors="replace")
-                return json.loads(content)
-        except urllib.error.HTTPError as e:
-            body_bytes = e.read()
+        cache_key = None
+        if method == "GET" and (self.cache or (static and self._cache_allowed)):
+            cache_key = (url, key, raw)
+            with self._cache_lock:
+                generation = self._generation
+                entry = self._cache.get(cache_key)
+                if entry is not None:
+                    if entry[0] is None or time.monotonic() < entry[0]:
+                        self._cache.move_to_end(cache_key)
+                        return copy.deepcopy(entry[1])
+                    del self._cache[cache_key]
+                # Concurrent identical GETs share one request.
+                leader = self._inflight.get(cache_key)
+                if leader is None:
+                    future: Future = Future()
+                    self._inflight[cache_key] = future
+            if leader is not None:
+                return copy.deepcopy(leader.result())
             try:
-                err_body = json.loads(body_bytes)
-            except Exception:
-                err_body = body_bytes.decode("utf-8", errors="replace") if body_bytes else None
-
-            msg = str(err_body) if err_body else e.reason
-            if isinstance(err_body, dict) and "error" in err_body:
-                msg = err_body["error"]
-
-            if e.code == 404:
-                raise NotFoundError(msg, status_code=404, body=err_body)
-            if e.code in (401, 403):
-                raise AuthError(msg, status_code=e.code, body=err_body)
-            if e.code == 409:
-                raise ConflictError(msg, status_code=409, body=err_body)
-            if e.code == 429:
-                retry = 0
-                if isinstance(err_body, dict):
-                    retry = err_body.get("retry_after_secs", 0)
-                raise RateLimitError(msg, retry_after=retry, status_code=429, body=err_body)
-            if e.code in (400, 422):
-                raise ValidationError(msg, status_code=e.code, body=err_body)
-            raise WatchpostError(msg, status_code=e.code, body=err_body)
-
-    def _get(self, path: str, *, key: Optional[str] = None, params: Optional[Dict] = None, raw: bool = False):
-        return self._request("GET", path, key=key, params=params, raw=raw)
+                result = self._fetch(method, url, key, data, headers, raw, timeout, cache_key, generation)
+            except BaseException as e:
+                future.set_exception(e)
+                raise
+            else:
+                future.set_result(copy.deepcopy(result))
+            finally:
+                with self._cache_lock:
+                    # invalidate() may have dropped it, and a newer GET
+                    # may have taken its place.
+                    if self._inflight.get(cache_key) is future:
+                        del self._inflight[cache_key]
+            return result
+
+        return self._fetch(method, url, key, data, headers, raw, timeout, cache_key)
+
+    def _fetch(
+        self,
+        method: str,
+        url: str,
+        key: Optional[str],
+        data: Optional[bytes],
+        headers: Dict[str, str],
+        raw: bool,
+        timeout: Optional[float],
+        cache_key: Optional[Tuple[str, Optional[str], bool]],
+        generation: int = 0,
+    ) -> Any:
+        """Send a request (with GET retries and ETag revalidation) and decode
+        the response, storing it under cache_key if given and the cache
+        generation is still the one read before the request."""
+        # Revalidate bodies the server tagged with an ETag; a 304 reuses the
+        # stored body instead of transferring it again.
+        etag_key = (url, key)
+        stored = None
+        if method == "GET":
+            with self._cache_lock:
+                stored = self._etags.get(etag_key)
+                if stored is not None:
+                    self._etags.move_to_end(etag_key)
+            if stored is not None:
+                headers["If-None-Match"] = stored[0]
+
+        try:
+            attempt = 0
+            while True:
+                status, resp_headers, content = self._send(method, url, data, headers, timeout)
+                if method != "GET" or status not in _RETRY_STATUSES or attempt >= self.retries:
+                    break
+                time.sleep(self.backoff_factor * (2 ** attempt))
+                attempt += 1
+        finally:
+            if method != "GET" and self.cache:
+                self.invalidate()
+
+        ct = resp_headers.get("Content-Type", "")
+        if method == "GET":
+            if status == 304 and stored is not None:
+                status, ct, content = 200, stored[1], stored[2]
+            elif status == 200 and resp_headers.get("ETag"):
+                with self._cache_lock:
+                    self._etags[etag_key] = (resp_headers["ETag"], ct, content)
+                    self._etags.move_to_end(etag_key)
+                    while len(self._etags) > self.cache_maxsize:
+                        self._etags.popitem(last=False)
+        elif method == "DELETE" and status < 300 and self._etags:
+            # The resource is gone; its stored body would never revalidate.
+            with self._cache_lock:
+                for k in [k for k in self._etags if k[0] == url]:
+                    del self._etags[k]
+
+        if status < 300:
+            if raw:
+                result = content
+            elif not content:
+                result = None
+            elif "json" in ct:
+                result = _loads(content)
+            elif "svg" in ct or "image" in ct or "text" in ct:
+                result = content.decode("utf-8", errors="replace")
+            else:
+                result = _loads(content)
+            if cache_key is not None:
+                with self._cache_lock:
+                    if self._generation != generation:
+                        # A write landed while this GET was in flight.
+                        return result
+                    expires = None if self.cache_ttl is None else time.monotonic() + self.cache_ttl
+                    self._cache[cache_key] = (expires, copy.deepcopy(result))
+                    self._cache.move_to_end(cache_key)
+                    while len(self._cache) > self.cache_maxsize:
+                        self._cache.popitem(last=False)
+            return result
+
+        try:
+            err_body = _loads(content)
+        except Exception:
+            err_body = content.decode("utf-8", errors="replace") if content else None
+
+        msg = str(err_body) if err_body else http.client.responses.get(status, "")
+        if isinstance(err_body, dict) and "error" in err_body:
+            msg = err_body["error"]
+
+        if status == 429:
+            retry = 0
+            if isinstance(err_body, dict):
+                retry = err_body.get("retry_after_secs", 0)
+            raise RateLimitError(msg, retry_after=retry, status_code=429, body=err_body)
+        raise _ERR_MAP.get(status, WatchpostError)(msg, status_code=status, body=err_body)
+
+    def _send(
+        self,
+        method: str,
+        url: str,
+        data: Optional[bytes],
+        headers: Dict[str, str],
+        timeout: Optional[float] = None,
+    ) -> Tuple[int, http.client.HTTPMessage, bytes]:
+        """Send a request, following redirects for GET and HEAD.
+
+        Returns the status, headers and body of the final response; a 3xx
+        is only returned for other methods or past _MAX_REDIRECTS.
+        """
+        headers = dict(headers, Connection="keep-alive")
+        redirects = 0
+        while True:
+            status, resp_headers, content = self._send_once(method, url, data, headers, timeout)
+            location = resp_headers.get("Location")
+            if (
+                status not in _REDIRECT_STATUSES
+                or not location
+                or method not in ("GET", "HEAD")
+                or redirects >= _MAX_REDIRECTS
+            ):
+                return status, resp_headers, content
+            redirects += 1
+            next_url = urllib.parse.urljoin(url, location)
+            if urllib.parse.urlsplit(next_url).netloc != urllib.parse.urlsplit(url).netloc:
+                headers.pop("Authorization", None)
+            url = next_url
+
+    def _send_once(
+        self,
+        method: str,
+        url: str,
+        data: Optional[bytes],
+        headers: Dict[str, str],
+        timeout: Optional[float],
+    ) -> Tuple[int, http.client.HTTPMessage, bytes]:
+        """Send one request and read the response.
+
+        URLs on base_url's origin go over a pooled connection; anything a
+        redirect points elsewhere gets a one-off connection. A pooled
+        connection may have been closed by the server while idle. The
+        request is then sent once more on a fresh connection, provided
+        that can't repeat a write: either the request never reached the
+        server or its method is in _REPLAYABLE_METHODS. Failures before
+        the request is sent raise urllib.error.URLError.
+        With max_connections set, this blocks until a slot is free.
+        """
+        parts = urllib.parse.urlsplit(url)
+        foreign = f"{parts.scheme}://{parts.netloc}" != self._origin
+        proxy = _proxy_for(parts.scheme, parts.hostname or "") if foreign else self._proxy
+        if proxy and parts.scheme != "https":
+            target = url
+            headers = dict(headers, **proxy[2])
+        else:
+            target = urllib.parse.urlunsplit(("", "", parts.path or "/", parts.query, ""))
+        read_timeout = self.timeout if timeout is None else timeout
+        retried = False
+        with self._slots:
+            while True:
+                if foreign:
+                    conn, reused = self._open_connection(parts.scheme, parts.hostname or "", parts.port, proxy), False
+                else:
+                    conn, reused = self._acquire()
+                # Pooled connections may carry another call's override.
+                conn.timeout = read_timeout
+                if conn.sock is not None:
+                    conn.sock.settimeout(read_timeout)
+                sent = False
+                try:
+                    conn.request(method, target, body=data, headers=headers)
+                    sent = True
+                    resp = conn.getresponse()
+                    content = resp.read()
+                except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError) as e:
+                    conn.close()
+                    if reused and not retried and (not sent or method in _REPLAYABLE_METHODS):
+                        retried = True
+                        continue
+                    if not sent:
+                        raise urllib.error.URLError(e) from e
+                    raise
+                except OSError as e:
+                    conn.close()
+                    if not sent:
+                        raise urllib.error.URLError(e) from e
+                    raise
+                except Exception:
+                    conn.close()
+                    raise
+                if foreign or resp.will_close:
+                    conn.close()
+                else:
+                    self._release(conn)
+                return resp.status, resp.headers, content
+
+    def _get(
+        self,
+        path: str,
+        *,
+        key: Optional[str] = None,
+        params: Optional[Dict] = None,
+        raw: bool = False,
+        timeout: Optional[float] = None,
+        static: bool = False,
+    ):
+        return self._request("GET", path, key=key, params=params, raw=raw, timeout=timeout, static=static)
 
     def _post(self, path: str, body: Any = None, *, key: Optional[str] = None, params: Optional[Dict] = None):
         return self._request("POST", path, body=body, key=key, params=params)
@@ -274,9 +892,13 @@ class Watchpost:
     # Health
     # ------------------------------------------------------------------
 
-    def health(self) -> Dict:
-        """GET /api/v1/health"""
-        return self._get("/api/v1/health")
+    def health(self, *, timeout: Optional[float] = None) -> Dict:
+        """GET /api/v1/health
+
+        Args:
+            timeout: Read timeout for this call (defaults to the client's).
+        """
+        return self._get("/api/v1/health", timeout=timeout)
 
     # ------------------------------------------------------------------
     # Monitors — CRUD
@@ -360,7 +982,8 @@ class Watchpost:
         status: Optional[str] = None,
         group: Optional[str] = None,
         tag: Optional[str] = None,
-    ) -> List[Dict]:
+        as_object: bool = False,
+    ) -> Union[List[Dict], List[Monitor]]:
         """List public monitors with optional filters.
 
         Args:
@@ -368,6 +991,7 @@ class Watchpost:
             status: Filter by status (up/down/degraded/unknown).
             group: Filter by group name.
             tag: Filter by tag.
+            as_object: Return Monitor records instead of dicts.
         """
         params: Dict[str, Any] = {}
         if search:
@@ -378,11 +1002,18 @@ class Watchpost:
             params["group"] = group
         if tag:
             params["tag"] = tag
-        return self._get("/api/v1/monitors", params=params)
+        monitors = self._get("/api/v1/monitors", params=params)
+        if as_object:
+            return [Monitor.from_dict(m) for m in monitors]
+        return monitors
 
-    def get_monitor(self, monitor_id: str) -> Dict:
-        """Get monitor details including current status."""
-        return self._get(f"/api/v1/monitors/{monitor_id}")
+    def get_monitor(self, monitor_id: str, *, as_object: bool = False) -> Union[Dict, Monitor]:
+        """Get monitor details including current status.
+
+        Pass as_object=True to get a Monitor record instead of a dict.
+        """
+        mon = self._get(f"/api/v1/monitors/{monitor_id}")
+        return Monitor.from_dict(mon) if as_object else mon
 
     def update_monitor(self, monitor_id: str, key: str, **fields) -> Dict:
         """Update monitor config. Pass only fields to change.
@@ -391,20 +1022,46 @@ class Watchpost:
             monitor_id: Monitor UUID.
             key: Manage key.
             **fields: Any monitor fields to update (name, url, interval_seconds, etc.)
+
+        Returns:
+            The monitor as stored after the update.
         """
-        return self._flatten_monitor_response(self._patch(f"/api/v1/monitors/{monitor_id}", fields, key=key))
+        return self._write_monitor("PATCH", f"/api/v1/monitors/{monitor_id}", monitor_id, key, fields)
 
     def delete_monitor(self, monitor_id: str, key: str) -> None:
         """Delete a monitor and all its data."""
         self._delete(f"/api/v1/monitors/{monitor_id}", key=key)
+        self._forget_monitors([monitor_id])
+
+    def _forget_monitors(self, monitor_ids: List[str]) -> None:
+        """Drop stored ETag bodies of deleted monitors and their sub-resources."""
+        if not self._etags or not monitor_ids:
+            return
+        roots = {f"{self.base_url}/api/v1/monitors/{mid}" for mid in monitor_ids}
+        below = tuple(root + sep for root in roots for sep in ("/", "?"))
+        with self._cache_lock:
+            for k in [k for k in self._etags if k[0] in roots or k[0].startswith(below)]:
+                del self._etags[k]
 
     def pause_monitor(self, monitor_id: str, key: str) -> Dict:
-        """Pause monitoring checks."""
-        return self._flatten_monitor_response(self._post(f"/api/v1/monitors/{monitor_id}/pause", key=key))
+        """Pause monitoring checks. Returns the updated monitor."""
+        return self._write_monitor("POST", f"/api/v1/monitors/{monitor_id}/pause", monitor_id, key)
 
     def resume_monitor(self, monitor_id: str, key: str) -> Dict:
-        """Resume monitoring checks."""
-        return self._flatten_monitor_response(self._post(f"/api/v1/monitors/{monitor_id}/resume", key=key))
+        """Resume monitoring checks. Returns the updated monitor."""
+        return self._write_monitor("POST", f"/api/v1/monitors/{monitor_id}/resume", monitor_id, key)
+
+    def _write_monitor(self, method: str, path: str, monitor_id: str, key: str, body: Any = None) -> Dict:
+        """Send a monitor write and return the monitor as stored afterwards.
+
+        Asks for the post-write monitor with Prefer: return=representation.
+        Servers that predate it only return a message; for those the
+        monitor is fetched with a follow-up GET instead.
+        """
+        resp = self._request(method, path, body=body, key=key, headers={"Prefer": "return=representation"})
+        if isinstance(resp, dict) and isinstance(resp.get("monitor"), dict):
+            return self._flatten_monitor_response(resp)
+        return self.get_monitor(monitor_id)
 
     def export_monitor(self, monitor_id: str, key: str) -> Dict:
         """Export monitor config for backup/migration."""
@@ -428,6 +1085,78 @@ class Watchpost:
             result["created"] = [self._flatten_monitor_response(m) for m in result["created"]]
         return result
 
+    def bulk_delete_monitors(self, monitors: List[Tuple[str, str]]) -> Dict:
+        """Delete monitors, 50 per request.
+
+        Args:
+            monitors: List of (monitor_id, manage_key) pairs. Longer lists
+                are split into concurrent requests of at most 50 (the
+                server's limit) and the results merged, with error indexes
+                relative to this list.
+
+        Servers that predate the bulk endpoint (404/405 on the route) are
+        handled by deleting each monitor individually, with the result in
+        the same shape.
+
+        Returns:
+            Dict with deleted (ids), errors, total, succeeded, failed.
+        """
+        if len(monitors) <= _BULK_DELETE_MAX:
+            return self._bulk_delete_chunk(monitors)
+        starts = range(0, len(monitors), _BULK_DELETE_MAX)
+        with ThreadPoolExecutor(max_workers=max(1, min(len(starts), self.pool_maxsize))) as pool:
+            results = list(pool.map(lambda i: self._bulk_delete_chunk(monitors[i:i + _BULK_DELETE_MAX]), starts))
+        deleted, errors = [], []
+        for start, result in zip(starts, results):
+            deleted.extend(result["deleted"])
+            errors.extend(dict(e, index=e["index"] + start) for e in result["errors"])
+        return {
+            "deleted": deleted,
+            "errors": errors,
+            "total": len(monitors),
+            "succeeded": len(deleted),
+            "failed": len(errors),
+        }
+
+    def _bulk_delete_chunk(self, monitors: List[Tuple[str, str]]) -> Dict:
+        """One bulk-delete request, falling back to per-item deletes."""
+        deletions = [{"id": mid, "manage_key": key} for mid, key in monitors]
+        try:
+            result = self._post("/api/v1/monitors/bulk-delete", {"deletions": deletions})
+        except WatchpostError as e:
+            if e.status_code not in (404, 405):
+                raise
+            return self._delete_each_monitor(monitors)
+        self._forget_monitors(result.get("deleted", []) if isinstance(result, dict) else [])
+        return result
+
+    def _delete_each_monitor(self, monitors: List[Tuple[str, str]]) -> Dict:
+        """Per-item fallback for bulk_delete_monitors()."""
+
+        def delete(item: Tuple[str, str]) -> Optional[WatchpostError]:
+            try:
+                self.delete_monitor(*item)
+            except WatchpostError as e:
+                return e
+            return None
+
+        with ThreadPoolExecutor(max_workers=max(1, min(len(monitors), self.pool_maxsize))) as pool:
+            outcomes = list(pool.map(delete, monitors))
+        deleted, errors = [], []
+        for index, ((mid, _), err) in enumerate(zip(monitors, outcomes)):
+            if err is None:
+                deleted.append(mid)
+                continue
+            body = err.body if isinstance(err.body, dict) else {}
+            errors.append({"index": index, "error": str(err), "code": body.get("code", "INTERNAL_ERROR")})
+        return {
+            "deleted": deleted,
+            "errors": errors,
+            "total": len(monitors),
+            "succeeded": len(deleted),
+            "failed": len(errors),
+        }
+
     # ------------------------------------------------------------------
     # Heartbeats (check history)
     # ------------------------------------------------------------------
@@ -478,6 +1207,32 @@ class Watchpost:
             return self._get(f"/api/v1/monitors/{monitor_id}/uptime-history", params=params)
         return self._get("/api/v1/uptime-history", params=params)
 
+    def get_uptime_histories(
+        self,
+        monitor_id: str,
+        days: Sequence[int] = (7, 14, 30),
+    ) -> Dict[int, Any]:
+        """Get a monitor's daily uptime history for several ranges in one request.
+
+        Each list is the same as get_uptime_history(monitor_id, days=n).
+        Servers that predate the batch endpoint (404/405 on the route) are
+        handled by fetching the ranges one at a time.
+
+        Returns:
+            Dict mapping each day count to its daily history, in days order.
+        """
+        try:
+            histories = self._get(
+                f"/api/v1/monitors/{monitor_id}/uptime-histories",
+                params={"days": ",".join(str(d) for d in days)},
+            )
+            return {int(d): h for d, h in histories.items()}
+        except WatchpostError as e:
+            if e.status_code not in (404, 405):
+                raise
+        # A missing monitor raises NotFoundError again on the first of these.
+        return {d: self.get_uptime_history(monitor_id, days=d) for d in days}
+
     # ------------------------------------------------------------------
     # Incidents
     # ------------------------------------------------------------------
@@ -594,8 +1349,14 @@ class Watchpost:
         return self._get(f"/api/v1/monitors/{monitor_id}/notifications", key=key)
 
     def update_notification(self, notification_id: str, key: str, **fields) -> Dict:
-        """Update a notification channel (enable/disable, change config)."""
-        return self._patch(f"/api/v1/notifications/{notification_id}", fields, key=key)
+        """Update a notification channel (enable/disable, rename).
+
+        Returns the updated channel.
+        """
+        resp = self._patch(f"/api/v1/notifications/{notification_id}", fields, key=key)
+        if isinstance(resp, dict) and isinstance(resp.get("notification"), dict):
+            return resp["notification"]
+        return resp
 
     def delete_notification(self, notification_id: str, key: str) -> None:
         """Delete a notification channel."""
@@ -693,31 +1454,64 @@ class Watchpost:
         *,
         period: str = "24h",
         label: Optional[str] = None,
-    ) -> str:
+        raw: bool = False,
+    ) -> Union[str, bytes]:
         """Get SVG uptime badge (shields.io style).
 
         Args:
             period: "24h", "7d", "30d", or "90d".
             label: Custom badge label.
+            raw: Return the response body as bytes, skipping the decode
+                (e.g. when writing it straight to a file or response).
 
         Returns:
-            SVG string.
+            SVG string, or bytes with raw=True.
         """
         params: Dict[str, Any] = {"period": period}
         if label:
             params["label"] = label
-        return self._get(f"/api/v1/monitors/{monitor_id}/badge/uptime", params=params, raw=True).decode()
+        body = self._get(f"/api/v1/monitors/{monitor_id}/badge/uptime", params=params, raw=True)
+        return body if raw else body.decode()
 
-    def get_status_badge(self, monitor_id: str, *, label: Optional[str] = None) -> str:
+    def get_uptime_badges(
+        self,
+        monitor_id: str,
+        periods: Sequence[str] = ("24h", "7d", "30d", "90d"),
+    ) -> Dict[str, str]:
+        """Get uptime badges for several periods in one request.
+
+        Each SVG is the same as get_uptime_badge(period=...) with the
+        default label. Servers that predate the batch endpoint (404/405 on
+        the route) are handled by fetching the badges one at a time.
+
+        Returns:
+            Dict mapping each period to its SVG string, in periods order.
+        """
+        try:
+            return self._get(f"/api/v1/monitors/{monitor_id}/badges/uptime", params={"periods": ",".join(periods)})
+        except WatchpostError as e:
+            if e.status_code not in (404, 405):
+                raise
+        # A missing monitor raises NotFoundError again on the first of these.
+        return {p: self.get_uptime_badge(monitor_id, period=p) for p in periods}
+
+    def get_status_badge(
+        self, monitor_id: str, *, label: Optional[str] = None, raw: bool = False
+    ) -> Union[str, bytes]:
         """Get SVG status badge.
 
+        Args:
+            label: Custom badge label.
+            raw: Return the response body as bytes, skipping the decode.
+
         Returns:
-            SVG string.
+            SVG string, or bytes with raw=True.
         """
         params: Dict[str, Any] = {}
         if label:
             params["label"] = label
-        return self._get(f"/api/v1/monitors/{monitor_id}/badge/status", params=params, raw=True).decode()
+        body = self._get(f"/api/v1/monitors/{monitor_id}/badge/status", params=params, raw=True)
+        return body if raw else body.decode()
 
     # ------------------------------------------------------------------
     # Tags & Groups
@@ -870,6 +1664,9 @@ class Watchpost:
     ) -> Dict:
         """Set alert rules for a monitor (upsert).
 
+        Returns the stored rules, so there is no need to call
+        get_alert_rules afterwards.
+
         Args:
             repeat_interval_minutes: Re-send notifications every N minutes. 0 = disabled. Min 5.
             max_repeats: Cap on repeat notifications per incident. Max 100.
@@ -951,7 +1748,11 @@ class Watchpost:
         custom_domain: Optional[str] = None,
         is_public: bool = True,
     ) -> Dict:
-        """Create a named status page. Returns manage_key."""
+        """Create a named status page.
+
+        Returns {"status_page": {...}, "manage_key": "..."}; the page is the
+        row as stored, so it needn't be fetched again.
+        """
         payload: Dict[str, Any] = {"slug": slug, "title": title, "is_public": is_public}
         if description:
             payload["description"] = description
@@ -970,7 +1771,7 @@ class Watchpost:
         return self._get(f"/api/v1/status-pages/{slug_or_id}")
 
     def update_status_page(self, slug_or_id: str, key: str, **fields) -> Dict:
-        """Update a status page."""
+        """Update a status page. Returns the page as stored after the update."""
         return self._patch(f"/api/v1/status-pages/{slug_or_id}", fields, key=key)
 
     def delete_status_page(self, slug_or_id: str, key: str) -> None:
@@ -1021,27 +1822,27 @@ class Watchpost:
 
     def get_llms_txt(self) -> str:
         """Get the llms.txt agent integration guide (API v1 path)."""
-        return self._get("/api/v1/llms.txt", raw=True).decode()
+        return self._get("/api/v1/llms.txt", raw=True, static=True).decode()
 
     def llms_txt_root(self) -> str:
         """Get the llms.txt from root path."""
-        return self._get("/llms.txt", raw=True).decode()
+        return self._get("/llms.txt", raw=True, static=True).decode()
 
     def get_skills_index(self) -> Dict:
         """Get the well-known skills discovery index."""
-        return self._get("/.well-known/skills/index.json")
+        return self._get("/.well-known/skills/index.json", static=True)
 
     def get_skill(self) -> str:
         """Get the SKILL.md integration guide (well-known path)."""
-        return self._get("/.well-known/skills/watchpost/SKILL.md", raw=True).decode()
+        return self._get("/.well-known/skills/watchpost/SKILL.md", raw=True, static=True).decode()
 
     def skill_md_v1(self) -> str:
         """Get the SKILL.md via API v1 path."""
-        return self._get("/api/v1/skills/SKILL.md", raw=True).decode()
+        return self._get("/api/v1/skills/SKILL.md", raw=True, static=True).decode()
 
     def get_openapi(self) -> Dict:
         """Get the OpenAPI specification."""
-        return self._get("/api/v1/openapi.json")
+        return self._get("/api/v1/openapi.json", static=True)
 
     # ------------------------------------------------------------------
     # Convenience helpers
@@ -1086,6 +1887,7 @@ class Watchpost:
         """
         deadline = time.time() + timeout
         while time.time() < deadline:
+            self.invalidate(f"/api/v1/monitors/{monitor_id}")
             if self.is_up(monitor_id):
                 return True
             time.sleep(poll_interval)
@@ -1095,10 +1897,14 @@ class Watchpost:
         """Get a summary of current downtime status.
 
         Returns a dict with is_down, current_incident (if any), uptime stats.
+        The three underlying reads are independent and issued concurrently.
         """
-        mon = self.get_monitor(monitor_id)
-        uptime = self.get_uptime(monitor_id)
-        incidents = self.list_incidents(monitor_id, limit=1)
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            uptime_f = pool.submit(self.get_uptime, monitor_id)
+            incidents_f = pool.submit(self.list_incidents, monitor_id, limit=1)
+            mon = self.get_monitor(monitor_id)
+            uptime = uptime_f.result()
+            incidents = incidents_f.result()
 
         current_incident = None
         if isinstance(incidents, list) and incidents:
@@ -1118,3 +1924,78 @@ class Watchpost:
             "uptime_7d": uptime.get("uptime_7d"),
             "uptime_30d": uptime.get("uptime_30d"),
         }
+
+
+# ---------------------------------------------------------------------------
+# Async client
+# ---------------------------------------------------------------------------
+
+
+class AsyncWatchpost:
+    """asyncio front end for the Watchpost client.
+
+    Every public Watchpost method is available as a coroutine with the same
+    signature, so independent calls can be awaited together:
+
+        async with AsyncWatchpost("http://localhost:3007") as wp:
+            tags, groups = await asyncio.gather(wp.list_tags(), wp.list_groups())
+
+    Calls run on a private thread pool over one shared Watchpost instance,
+    so they share its keep-alive connection pool (and cache, if enabled).
+    stream_events is not available here; use the blocking client for SSE.
+
+    Args:
+        base_url: Base URL of the Watchpost server.
+        max_workers: Maximum number of requests in flight at once.
+        client: Existing Watchpost client to run calls on, so blocking and
+            async code share one connection pool. It is left open by
+            aclose(); base_url and kwargs are ignored when it is given.
+        **kwargs: Passed through to Watchpost (timeout, pool_maxsize,
+            keepalive_expiry, cache).
+    """
+
+    _BLOCKING_ONLY = frozenset({"stream_events", "close"})
+
+    def __init__(
+        self,
+        base_url: Optional[str] = None,
+        *,
+        max_workers: int = 32,
+        client: Optional[Watchpost] = None,
+        **kwargs: Any,
+    ):
+        self._owns_client = client is None
+        if client is None:
+            kwargs.setdefault("pool_maxsize", max_workers)
+            client = Watchpost(base_url, **kwargs)
+        self.client = client
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="watchpost")
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self.client, name)
+        if name.startswith("_") or not callable(attr):
+            return attr
+        if name in self._BLOCKING_ONLY:
+            raise AttributeError(f"AsyncWatchpost has no coroutine for {name!r}")
+
+        @functools.wraps(attr)
+        async def call(*args: Any, **kwargs: Any) -> Any:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, functools.partial(attr, *args, **kwargs))
+
+        return call
+
+    async def __aenter__(self) -> "AsyncWatchpost":
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Shut down the worker threads and close pooled connections.
+
+        A client passed in via client= is left open.
+        """
+        self._executor.shutdown(wait=True)
+        if self._owns_client:
+            self.client.close()
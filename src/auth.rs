@@ -94,3 +94,25 @@ impl<'r> FromRequest<'r> for ClientIp {
         Outcome::Success(ClientIp(ip))
     }
 }
+
+/// The raw If-None-Match header, if the client sent one.
+pub struct IfNoneMatch(pub Option<String>);
+
+impl IfNoneMatch {
+    /// True if the header lists `etag` (or is `*`).
+    pub fn matches(&self, etag: &str) -> bool {
+        match &self.0 {
+            Some(value) => value.split(',').map(str::trim).any(|tag| tag == etag || tag == "*"),
+            None => false,
+        }
+    }
+}
+
+#[rocket::async_trait]
+impl<'r> FromRequest<'r> for IfNoneMatch {
+    type Error = ();
+
+    async fn from_request(request: &'r Request<'_>) -> Outcome<Self, Self::Error> {
+        Outcome::Success(IfNoneMatch(request.headers().get_one("If-None-Match").map(str::to_string)))
+    }
+}
@@ -62,6 +62,7 @@ fn rocket() -> _ {
             routes::health,
             routes::create_monitor,
             routes::bulk_create_monitors,
+            routes::bulk_delete_monitors,
             routes::export_monitor,
             routes::list_monitors,
             routes::get_monitor,
@@ -80,6 +81,7 @@ fn rocket() -> _ {
             routes::admin_verify,
             routes::uptime_history,
             routes::monitor_uptime_history,
+            routes::monitor_uptime_histories,
             routes::status_page,
             routes::create_notification,
             routes::list_notifications,
@@ -95,6 +97,7 @@ fn rocket() -> _ {
             routes::llms_txt,
             routes::openapi_spec,
             routes::monitor_uptime_badge,
+            routes::monitor_uptime_badges,
             routes::monitor_status_badge,
             routes::monitor_sla,
             routes::global_events,
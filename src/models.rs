@@ -308,6 +308,26 @@ pub struct BulkError {
     pub code: String,
 }
 
+#[derive(Debug, Deserialize)]
+pub struct BulkDeleteMonitors {
+    pub deletions: Vec<BulkDeleteItem>,
+}
+
+#[derive(Debug, Deserialize)]
+pub struct BulkDeleteItem {
+    pub id: String,
+    pub manage_key: String,
+}
+
+#[derive(Debug, Serialize)]
+pub struct BulkDeleteResponse {
+    pub deleted: Vec<String>,
+    pub errors: Vec<BulkError>,
+    pub total: usize,
+    pub succeeded: usize,
+    pub failed: usize,
+}
+
 #[derive(Debug, Serialize, Clone)]
 pub struct MaintenanceWindow {
     pub id: String,
@@ -1,7 +1,7 @@
 use rocket::{get, serde::json::Json, State, http::{Status, ContentType}};
 use crate::db::Db;
 use super::get_monitor_from_db;
-use rusqlite::params;
+use rusqlite::{params, Connection};
 use std::sync::Arc;
 
 // ── Status Badges ──
@@ -71,6 +71,44 @@ fn status_color(status: &str) -> &'static str {
     }
 }
 
+/// Badge window in hours for a period name; unknown names fall back to 24h.
+fn period_hours(period: &str) -> u32 {
+    match period {
+        "7d" => 168,
+        "30d" => 720,
+        "90d" => 2160,
+        _ => 24,
+    }
+}
+
+/// (total, up) heartbeat counts for each window, from one scan of the widest.
+fn uptime_counts(conn: &Connection, id: &str, hours: &[u32]) -> Vec<(u32, u32)> {
+    let widest = hours.iter().copied().max().unwrap_or(24);
+    let columns: Vec<String> = hours
+        .iter()
+        .map(|h| format!(
+            "COALESCE(SUM(checked_at > datetime('now', '-{0} hours')), 0), \
+             COALESCE(SUM(checked_at > datetime('now', '-{0} hours') AND status = 'up'), 0)",
+            h
+        ))
+        .collect();
+    let sql = format!(
+        "SELECT {} FROM heartbeats WHERE monitor_id = ?1 AND checked_at > datetime('now', ?2)",
+        columns.join(", ")
+    );
+    conn.query_row(&sql, params![id, format!("-{} hours", widest)], |row| {
+        (0..hours.len())
+            .map(|i| -> rusqlite::Result<(u32, u32)> { Ok((row.get(2 * i)?, row.get(2 * i + 1)?)) })
+            .collect()
+    })
+    .unwrap_or_else(|_| vec![(0, 0); hours.len()])
+}
+
+fn uptime_badge(label: &str, (total, up): (u32, u32)) -> String {
+    let pct = if total > 0 { (up as f64 / total as f64) * 100.0 } else { 100.0 };
+    render_badge(label, &format!("{:.1}%", pct), uptime_color(pct))
+}
+
 #[get("/monitors/<id>/badge/uptime?<period>&<label>")]
 pub fn monitor_uptime_badge(
     id: &str,
@@ -82,37 +120,50 @@ pub fn monitor_uptime_badge(
     get_monitor_from_db(&conn, id)
         .map_err(|_| (Status::NotFound, Json(serde_json::json!({"error": "Monitor not found", "code": "NOT_FOUND"}))))?;
 
-    let hours = match period.unwrap_or("24h") {
-        "7d" => 168,
-        "30d" => 720,
-        "90d" => 2160,
-        _ => 24,
-    };
-
-    let total: u32 = conn.query_row(
-        "SELECT COUNT(*) FROM heartbeats WHERE monitor_id = ?1 AND checked_at > datetime('now', ?2)",
-        params![id, format!("-{} hours", hours)],
-        |row| row.get(0),
-    ).unwrap_or(0);
-
-    let up: u32 = conn.query_row(
-        "SELECT COUNT(*) FROM heartbeats WHERE monitor_id = ?1 AND status = 'up' AND checked_at > datetime('now', ?2)",
-        params![id, format!("-{} hours", hours)],
-        |row| row.get(0),
-    ).unwrap_or(0);
-
-    let pct = if total > 0 { (up as f64 / total as f64) * 100.0 } else { 100.0 };
-    let value = format!("{:.1}%", pct);
-    let color = uptime_color(pct);
     let period_str = period.unwrap_or("24h");
+    let counts = uptime_counts(&conn, id, &[period_hours(period_str)]);
     let default_label = format!("uptime {}", period_str);
     let badge_label = label.unwrap_or(&default_label);
 
-    let svg = render_badge(badge_label, &value, color);
+    let svg = uptime_badge(badge_label, counts[0]);
     let ct = ContentType::new("image", "svg+xml");
     Ok((ct, svg))
 }
 
+/// Several uptime badges in one response: {"24h": "<svg…>", "7d": "<svg…>"}.
+#[get("/monitors/<id>/badges/uptime?<periods>")]
+pub fn monitor_uptime_badges(
+    id: &str,
+    periods: Option<&str>,
+    db: &State<Arc<Db>>,
+) -> Result<Json<serde_json::Value>, (Status, Json<serde_json::Value>)> {
+    let conn = db.conn();
+    get_monitor_from_db(&conn, id)
+        .map_err(|_| (Status::NotFound, Json(serde_json::json!({"error": "Monitor not found", "code": "NOT_FOUND"}))))?;
+
+    let periods: Vec<&str> = periods
+        .unwrap_or("24h,7d,30d,90d")
+        .split(',')
+        .map(str::trim)
+        .filter(|p| !p.is_empty())
+        .collect();
+    if let Some(bad) = periods.iter().find(|p| !matches!(**p, "24h" | "7d" | "30d" | "90d")) {
+        return Err((Status::BadRequest, Json(serde_json::json!({
+            "error": format!("Unknown period '{}' (expected 24h, 7d, 30d or 90d)", bad),
+            "code": "VALIDATION_ERROR"
+        }))));
+    }
+
+    let hours: Vec<u32> = periods.iter().map(|p| period_hours(p)).collect();
+    let counts = uptime_counts(&conn, id, &hours);
+    let badges: serde_json::Map<String, serde_json::Value> = periods
+        .iter()
+        .zip(counts)
+        .map(|(p, c)| (p.to_string(), serde_json::Value::String(uptime_badge(&format!("uptime {}", p), c))))
+        .collect();
+    Ok(Json(serde_json::Value::Object(badges)))
+}
+
 #[get("/monitors/<id>/badge/status?<label>")]
 pub fn monitor_status_badge(
     id: &str,
@@ -22,19 +22,19 @@ mod webhook_deliveries;
 mod dependencies;
 
 // Re-export all route handlers so main.rs can use routes::* unchanged
-pub use monitors::{create_monitor, bulk_create_monitors, export_monitor, list_monitors, get_monitor, update_monitor, delete_monitor, pause_monitor, resume_monitor};
+pub use monitors::{create_monitor, bulk_create_monitors, export_monitor, list_monitors, get_monitor, update_monitor, delete_monitor, bulk_delete_monitors, pause_monitor, resume_monitor};
 pub use heartbeats::{get_heartbeats, get_uptime};
 pub use incidents::{get_incidents, get_incident, acknowledge_incident, create_incident_note, list_incident_notes};
 pub use dashboard_route::dashboard;
 pub use dashboard_route::admin_verify;
-pub use uptime::{uptime_history, monitor_uptime_history};
+pub use uptime::{uptime_history, monitor_uptime_history, monitor_uptime_histories};
 pub use status::status_page;
 pub use notifications::{create_notification, list_notifications, delete_notification, update_notification};
 pub use maintenance::{create_maintenance_window, list_maintenance_windows, delete_maintenance_window, is_in_maintenance};
 pub use tags::{list_tags, list_groups};
 pub use settings::{get_settings, update_settings};
 pub use system::{health, skill_md, llms_txt, root_llms_txt, openapi_spec, skills_index, skills_skill_md, api_skills_skill_md, spa_fallback};
-pub use badges::{monitor_uptime_badge, monitor_status_badge};
+pub use badges::{monitor_uptime_badge, monitor_uptime_badges, monitor_status_badge};
 pub use sla::monitor_sla;
 pub use stream::{global_events, monitor_events};
 pub use locations::{create_location, list_locations, get_location, delete_location, submit_probe, monitor_location_status, monitor_consensus};
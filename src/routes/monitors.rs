@@ -1,15 +1,17 @@
-use rocket::{get, post, patch, delete, serde::json::Json, State, http::Status};
+use rocket::{get, post, patch, delete, serde::json::Json, State, http::{Header, Status}, Responder};
 use crate::db::Db;
 use crate::models::{
     Monitor, CreateMonitor, UpdateMonitor, CreateMonitorResponse,
     BulkCreateMonitors, BulkCreateResponse, BulkError, ExportedMonitor,
+    BulkDeleteMonitors, BulkDeleteResponse,
 };
-use crate::auth::{ManageToken, ClientIp, generate_key, hash_key};
+use crate::auth::{ManageToken, ClientIp, IfNoneMatch, generate_key, hash_key};
 use super::{
     RateLimiter, get_monitor_from_db, row_to_monitor, tags_to_string,
     verify_manage_key, validate_tcp_address, validate_dns_hostname, VALID_DNS_RECORD_TYPES,
 };
 use rusqlite::params;
+use sha2::{Digest, Sha256};
 use std::sync::Arc;
 
 // ── Create Monitor ──
@@ -440,14 +442,37 @@ pub fn list_monitors(search: Option<&str>, status: Option<&str>, tag: Option<&st
 
 // ── Get Monitor ──
 
+/// A monitor with its ETag, or an empty 304 when the client's copy is current.
+#[derive(Responder)]
+pub enum MonitorResponse {
+    Fresh(Json<Monitor>, Header<'static>),
+    #[response(status = 304)]
+    NotModified((), Header<'static>),
+}
+
+/// Strong ETag over the serialized monitor, so any visible change (including
+/// status and last check) produces a new tag.
+fn monitor_etag(monitor: &Monitor) -> String {
+    let body = serde_json::to_vec(monitor).unwrap_or_default();
+    format!("\"{}\"", &hex::encode(Sha256::digest(&body))[..16])
+}
+
 #[get("/monitors/<id>")]
-pub fn get_monitor(id: &str, db: &State<Arc<Db>>) -> Result<Json<Monitor>, (Status, Json<serde_json::Value>)> {
+pub fn get_monitor(
+    id: &str,
+    if_none_match: IfNoneMatch,
+    db: &State<Arc<Db>>,
+) -> Result<MonitorResponse, (Status, Json<serde_json::Value>)> {
     let conn = db.conn();
     let monitor = get_monitor_from_db(&conn, id)
         .map_err(|_| (Status::NotFound, Json(serde_json::json!({
             "error": "Monitor not found", "code": "NOT_FOUND"
         }))))?;
-    Ok(Json(monitor))
+    let etag = monitor_etag(&monitor);
+    if if_none_match.matches(&etag) {
+        return Ok(MonitorResponse::NotModified((), Header::new("ETag", etag)));
+    }
+    Ok(MonitorResponse::Fresh(Json(monitor), Header::new("ETag", etag)))
 }
 
 // ── Update Monitor ──
@@ -626,7 +651,9 @@ pub fn update_monitor(
     }
 
     if updates.is_empty() {
-        return Ok(Json(serde_json::json!({"message": "No changes"})));
+        let monitor = get_monitor_from_db(&conn, id)
+            .map_err(|_| (Status::InternalServerError, Json(serde_json::json!({"error": "Internal server error"}))))?;
+        return Ok(Json(serde_json::json!({"message": "No changes", "monitor": monitor})));
     }
 
     updates.push("updated_at = datetime('now')".to_string());
@@ -637,7 +664,10 @@ pub fn update_monitor(
     conn.execute(&sql, params_vec.as_slice())
         .map_err(|_| (Status::InternalServerError, Json(serde_json::json!({"error": "Internal server error"}))))?;
 
-    Ok(Json(serde_json::json!({"message": "Monitor updated"})))
+    // Return the post-update monitor so clients don't need a follow-up GET
+    let monitor = get_monitor_from_db(&conn, id)
+        .map_err(|_| (Status::InternalServerError, Json(serde_json::json!({"error": "Internal server error"}))))?;
+    Ok(Json(serde_json::json!({"message": "Monitor updated", "monitor": monitor})))
 }
 
 // ── Delete Monitor ──
@@ -657,6 +687,57 @@ pub fn delete_monitor(
     Ok(Json(serde_json::json!({"message": "Monitor deleted"})))
 }
 
+// ── Bulk Delete Monitors ──
+
+#[post("/monitors/bulk-delete", format = "json", data = "<input>")]
+pub fn bulk_delete_monitors(
+    input: Json<BulkDeleteMonitors>,
+    db: &State<Arc<Db>>,
+) -> Result<Json<BulkDeleteResponse>, (Status, Json<serde_json::Value>)> {
+    let data = input.into_inner();
+
+    if data.deletions.is_empty() {
+        return Err((Status::BadRequest, Json(serde_json::json!({
+            "error": "deletions array is empty", "code": "VALIDATION_ERROR"
+        }))));
+    }
+    if data.deletions.len() > 50 {
+        return Err((Status::BadRequest, Json(serde_json::json!({
+            "error": "Maximum 50 monitors per bulk request", "code": "VALIDATION_ERROR"
+        }))));
+    }
+
+    let total = data.deletions.len();
+    let mut deleted = Vec::new();
+    let mut errors = Vec::new();
+    let conn = db.conn();
+
+    for (idx, item) in data.deletions.into_iter().enumerate() {
+        // Each item is authorized with its own manage key
+        if let Err((_, Json(err))) = verify_manage_key(&conn, &item.id, &item.manage_key) {
+            errors.push(BulkError {
+                index: idx,
+                error: err["error"].as_str().unwrap_or("Delete failed").to_string(),
+                code: err["code"].as_str().unwrap_or("INTERNAL_ERROR").to_string(),
+            });
+            continue;
+        }
+
+        match conn.execute("DELETE FROM monitors WHERE id = ?1", params![item.id]) {
+            Ok(_) => deleted.push(item.id),
+            Err(_) => errors.push(BulkError {
+                index: idx,
+                error: "Internal server error".into(),
+                code: "INTERNAL_ERROR".into(),
+            }),
+        }
+    }
+
+    let succeeded = deleted.len();
+    let failed = errors.len();
+    Ok(Json(BulkDeleteResponse { deleted, errors, total, succeeded, failed }))
+}
+
 // ── Pause / Resume ──
 
 #[post("/monitors/<id>/pause")]
@@ -669,7 +750,9 @@ pub fn pause_monitor(
     verify_manage_key(&conn, id, &token.0)?;
     conn.execute("UPDATE monitors SET is_paused = 1, updated_at = datetime('now') WHERE id = ?1", params![id])
         .map_err(|_| (Status::InternalServerError, Json(serde_json::json!({"error": "Internal server error"}))))?;
-    Ok(Json(serde_json::json!({"message": "Monitor paused"})))
+    let monitor = get_monitor_from_db(&conn, id)
+        .map_err(|_| (Status::InternalServerError, Json(serde_json::json!({"error": "Internal server error"}))))?;
+    Ok(Json(serde_json::json!({"message": "Monitor paused", "monitor": monitor})))
 }
 
 #[post("/monitors/<id>/resume")]
@@ -682,5 +765,7 @@ pub fn resume_monitor(
     verify_manage_key(&conn, id, &token.0)?;
     conn.execute("UPDATE monitors SET is_paused = 0, updated_at = datetime('now') WHERE id = ?1", params![id])
         .map_err(|_| (Status::InternalServerError, Json(serde_json::json!({"error": "Internal server error"}))))?;
-    Ok(Json(serde_json::json!({"message": "Monitor resumed"})))
+    let monitor = get_monitor_from_db(&conn, id)
+        .map_err(|_| (Status::InternalServerError, Json(serde_json::json!({"error": "Internal server error"}))))?;
+    Ok(Json(serde_json::json!({"message": "Monitor resumed", "monitor": monitor})))
 }
@@ -132,5 +132,23 @@ pub fn update_notification(
         ).map_err(|_| (Status::InternalServerError, Json(serde_json::json!({"error": "Internal server error"}))))?;
     }
 
-    Ok(Json(serde_json::json!({"message": "Notification channel updated"})))
+    // Return the post-update channel so clients don't need to re-list
+    let channel = conn.query_row(
+        "SELECT id, monitor_id, name, channel_type, config, is_enabled, created_at FROM notification_channels WHERE id = ?1",
+        params![id],
+        |row| {
+            let config_str: String = row.get(4)?;
+            Ok(NotificationChannel {
+                id: row.get(0)?,
+                monitor_id: row.get(1)?,
+                name: row.get(2)?,
+                channel_type: row.get(3)?,
+                config: serde_json::from_str(&config_str).unwrap_or(serde_json::Value::Null),
+                is_enabled: row.get(5)?,
+                created_at: row.get(6)?,
+            })
+        },
+    ).map_err(|_| (Status::InternalServerError, Json(serde_json::json!({"error": "Internal server error"}))))?;
+
+    Ok(Json(serde_json::json!({"message": "Notification channel updated", "notification": channel})))
 }
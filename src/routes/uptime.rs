@@ -90,3 +90,82 @@ pub fn monitor_uptime_history(
 
     Ok(Json(rows))
 }
+
+/// Several per-monitor histories in one scan: {"7": [...], "30": [...]}.
+///
+/// Each series matches /monitors/<id>/uptime-history?days=N, including the
+/// partial oldest day, since every window is summed separately per day.
+#[get("/monitors/<id>/uptime-histories?<days>")]
+pub fn monitor_uptime_histories(
+    id: &str,
+    days: Option<&str>,
+    db: &State<Arc<Db>>,
+) -> Result<Json<serde_json::Value>, (Status, Json<serde_json::Value>)> {
+    let requested: Vec<u32> = match days
+        .unwrap_or("7,14,30")
+        .split(',')
+        .map(str::trim)
+        .filter(|d| !d.is_empty())
+        .map(str::parse::<u32>)
+        .collect::<Result<Vec<_>, _>>()
+    {
+        Ok(v) if !v.is_empty() => v,
+        _ => return Err((Status::BadRequest, Json(serde_json::json!({
+            "error": "days must be a comma-separated list of numbers", "code": "VALIDATION_ERROR"
+        })))),
+    };
+    let windows: Vec<u32> = requested.iter().map(|d| (*d).clamp(1, 90)).collect();
+    let conn = db.conn();
+    let err_map = |_: rusqlite::Error| (Status::InternalServerError, Json(serde_json::json!({"error": "Internal server error"})));
+
+    get_monitor_from_db(&conn, id)
+        .map_err(|_| (Status::NotFound, Json(serde_json::json!({"error": "Monitor not found", "code": "NOT_FOUND"}))))?;
+
+    let columns: Vec<String> = windows
+        .iter()
+        .map(|d| {
+            let within = format!("checked_at > datetime('now', '-{} days')", d);
+            format!(
+                "SUM({0}), SUM({0} AND status = 'up'), SUM({0} AND status = 'down'), \
+                 AVG(CASE WHEN {0} AND status = 'up' THEN response_time_ms ELSE NULL END)",
+                within
+            )
+        })
+        .collect();
+    let sql = format!(
+        "SELECT date(checked_at) as day, {} FROM heartbeats \
+         WHERE monitor_id = ?1 AND checked_at > datetime('now', ?2) \
+         GROUP BY day ORDER BY day ASC",
+        columns.join(", ")
+    );
+    let widest = windows.iter().copied().max().unwrap_or(30);
+    let mut stmt = conn.prepare(&sql).map_err(err_map)?;
+    let mut rows = stmt.query(params![id, format!("-{} days", widest)]).map_err(err_map)?;
+
+    let mut series: Vec<Vec<UptimeHistoryDay>> = windows.iter().map(|_| Vec::new()).collect();
+    while let Some(row) = rows.next().map_err(err_map)? {
+        let date: String = row.get(0).map_err(err_map)?;
+        for (i, history) in series.iter_mut().enumerate() {
+            let base = 1 + 4 * i;
+            let total: u32 = row.get(base).map_err(err_map)?;
+            if total == 0 {
+                continue; // day is older than this window
+            }
+            let up: u32 = row.get(base + 1).map_err(err_map)?;
+            history.push(UptimeHistoryDay {
+                date: date.clone(),
+                uptime_pct: (up as f64 / total as f64) * 100.0,
+                total_checks: total,
+                up_checks: up,
+                down_checks: row.get(base + 2).map_err(err_map)?,
+                avg_response_ms: row.get(base + 3).map_err(err_map)?,
+            });
+        }
+    }
+
+    let mut out = serde_json::Map::new();
+    for (d, history) in requested.iter().zip(series) {
+        out.insert(d.to_string(), serde_json::to_value(history).unwrap_or_default());
+    }
+    Ok(Json(serde_json::Value::Object(out)))
+}
@@ -23,6 +23,7 @@ fn test_client_with_db() -> (Client, String) {
             watchpost::routes::health,
             watchpost::routes::create_monitor,
             watchpost::routes::bulk_create_monitors,
+            watchpost::routes::bulk_delete_monitors,
             watchpost::routes::export_monitor,
             watchpost::routes::list_monitors,
             watchpost::routes::get_monitor,
@@ -41,6 +42,7 @@ fn test_client_with_db() -> (Client, String) {
             watchpost::routes::admin_verify,
             watchpost::routes::uptime_history,
             watchpost::routes::monitor_uptime_history,
+            watchpost::routes::monitor_uptime_histories,
             watchpost::routes::status_page,
             watchpost::routes::create_notification,
             watchpost::routes::list_notifications,
@@ -56,6 +58,7 @@ fn test_client_with_db() -> (Client, String) {
             watchpost::routes::llms_txt,
             watchpost::routes::openapi_spec,
             watchpost::routes::monitor_uptime_badge,
+            watchpost::routes::monitor_uptime_badges,
             watchpost::routes::monitor_status_badge,
             watchpost::routes::monitor_sla,
             watchpost::routes::global_events,
@@ -207,6 +210,37 @@ fn test_get_monitor() {
     assert_eq!(body["name"], "Test Service");
 }
 
+#[test]
+fn test_get_monitor_etag() {
+    let client = test_client();
+    let (id, key) = create_test_monitor(&client);
+
+    let resp = client.get(format!("/api/v1/monitors/{}", id)).dispatch();
+    assert_eq!(resp.status(), Status::Ok);
+    let etag = resp.headers().get_one("ETag").expect("ETag header").to_string();
+
+    // Unchanged monitor: 304 with no body
+    let resp = client.get(format!("/api/v1/monitors/{}", id))
+        .header(rocket::http::Header::new("If-None-Match", etag.clone()))
+        .dispatch();
+    assert_eq!(resp.status(), Status::NotModified);
+    assert_eq!(resp.headers().get_one("ETag"), Some(etag.as_str()));
+
+    // After an update the old tag no longer matches
+    client.patch(format!("/api/v1/monitors/{}", id))
+        .header(ContentType::JSON)
+        .header(rocket::http::Header::new("Authorization", format!("Bearer {}", key)))
+        .body(r#"{"name": "Renamed Service"}"#)
+        .dispatch();
+    let resp = client.get(format!("/api/v1/monitors/{}", id))
+        .header(rocket::http::Header::new("If-None-Match", etag.clone()))
+        .dispatch();
+    assert_eq!(resp.status(), Status::Ok);
+    assert_ne!(resp.headers().get_one("ETag"), Some(etag.as_str()));
+    let body: serde_json::Value = resp.into_json().unwrap();
+    assert_eq!(body["name"], "Renamed Service");
+}
+
 #[test]
 fn test_get_monitor_not_found() {
     let client = test_client();
@@ -308,6 +342,45 @@ fn test_pause_resume() {
     assert_eq!(body["is_paused"], false);
 }
 
+#[test]
+fn test_write_responses_include_monitor() {
+    let client = test_client();
+    let (id, key) = create_test_monitor(&client);
+    let auth = rocket::http::Header::new("Authorization", format!("Bearer {}", key));
+
+    let resp = client.patch(format!("/api/v1/monitors/{}", id))
+        .header(ContentType::JSON)
+        .header(auth.clone())
+        .body(r#"{"name": "Renamed Service"}"#)
+        .dispatch();
+    assert_eq!(resp.status(), Status::Ok);
+    let body: serde_json::Value = resp.into_json().unwrap();
+    assert_eq!(body["message"], "Monitor updated");
+    assert_eq!(body["monitor"]["id"], id);
+    assert_eq!(body["monitor"]["name"], "Renamed Service");
+
+    let resp = client.patch(format!("/api/v1/monitors/{}", id))
+        .header(ContentType::JSON)
+        .header(auth.clone())
+        .body(r#"{}"#)
+        .dispatch();
+    let body: serde_json::Value = resp.into_json().unwrap();
+    assert_eq!(body["message"], "No changes");
+    assert_eq!(body["monitor"]["name"], "Renamed Service");
+
+    let resp = client.post(format!("/api/v1/monitors/{}/pause", id))
+        .header(auth.clone())
+        .dispatch();
+    let body: serde_json::Value = resp.into_json().unwrap();
+    assert_eq!(body["monitor"]["is_paused"], true);
+
+    let resp = client.post(format!("/api/v1/monitors/{}/resume", id))
+        .header(auth)
+        .dispatch();
+    let body: serde_json::Value = resp.into_json().unwrap();
+    assert_eq!(body["monitor"]["is_paused"], false);
+}
+
 #[test]
 fn test_heartbeats_empty() {
     let client = test_client();
@@ -751,6 +824,12 @@ fn test_notification_toggle() {
         .dispatch();
     assert_eq!(resp.status(), Status::Ok);
 
+    // The response carries the updated channel
+    let body: serde_json::Value = resp.into_json().unwrap();
+    assert_eq!(body["notification"]["id"], notif_id.as_str());
+    assert_eq!(body["notification"]["is_enabled"].as_bool(), Some(false));
+    assert_eq!(body["notification"]["name"], "Test Hook");
+
     // List and verify it's disabled
     let resp = client.get(format!("/api/v1/monitors/{}/notifications", id))
         .header(rocket::http::Header::new("Authorization", format!("Bearer {}", key)))
@@ -1349,6 +1428,52 @@ fn test_bulk_create_validation_errors() {
     assert_eq!(body["failed"], 2);
 }
 
+// ── Bulk Delete Tests ──
+
+#[test]
+fn test_bulk_delete_monitors() {
+    let client = test_client();
+    let (id1, key1) = create_test_monitor(&client);
+    let (id2, key2) = create_test_monitor(&client);
+    let (id3, _) = create_test_monitor(&client);
+
+    let resp = client.post("/api/v1/monitors/bulk-delete")
+        .header(ContentType::JSON)
+        .body(serde_json::json!({"deletions": [
+            {"id": id1, "manage_key": key1},
+            {"id": id2, "manage_key": key2},
+            {"id": id3, "manage_key": "wp_wrong_key"},
+            {"id": "00000000-0000-0000-0000-000000000000", "manage_key": key1}
+        ]}).to_string())
+        .dispatch();
+    assert_eq!(resp.status(), Status::Ok);
+    let body: serde_json::Value = resp.into_json().unwrap();
+
+    assert_eq!(body["total"], 4);
+    assert_eq!(body["succeeded"], 2);
+    assert_eq!(body["failed"], 2);
+    assert_eq!(body["deleted"], serde_json::json!([id1, id2]));
+    assert_eq!(body["errors"][0]["index"], 2);
+    assert_eq!(body["errors"][0]["code"], "FORBIDDEN");
+    assert_eq!(body["errors"][1]["index"], 3);
+    assert_eq!(body["errors"][1]["code"], "NOT_FOUND");
+
+    assert_eq!(client.get(format!("/api/v1/monitors/{}", id1)).dispatch().status(), Status::NotFound);
+    assert_eq!(client.get(format!("/api/v1/monitors/{}", id2)).dispatch().status(), Status::NotFound);
+    assert_eq!(client.get(format!("/api/v1/monitors/{}", id3)).dispatch().status(), Status::Ok);
+}
+
+#[test]
+fn test_bulk_delete_empty_array() {
+    let client = test_client();
+
+    let resp = client.post("/api/v1/monitors/bulk-delete")
+        .header(ContentType::JSON)
+        .body(r#"{"deletions": []}"#)
+        .dispatch();
+    assert_eq!(resp.status(), Status::BadRequest);
+}
+
 // ── Export Monitor Tests ──
 
 #[test]
@@ -1879,6 +2004,58 @@ fn test_uptime_history_with_heartbeats() {
     assert_eq!(days[0]["total_checks"], 2);
 }
 
+#[test]
+fn test_monitor_uptime_histories_match_single_ranges() {
+    let (client, db_path) = test_client_with_db();
+    let (id, _key) = create_test_monitor(&client);
+
+    // One check now, one 10 days ago: only the 14-day window sees both
+    {
+        let conn = rusqlite::Connection::open(&db_path).unwrap();
+        for (status, age) in &[("up", "-1 minutes"), ("down", "-10 days")] {
+            conn.execute(
+                "INSERT INTO heartbeats (id, monitor_id, status, response_time_ms, status_code, checked_at, seq)
+                 VALUES (?1, ?2, ?3, 100, 200, datetime('now', ?4), (SELECT COALESCE(MAX(seq),0)+1 FROM heartbeats))",
+                params![uuid::Uuid::new_v4().to_string(), id, status, age],
+            ).unwrap();
+        }
+    }
+
+    let resp = client.get(format!("/api/v1/monitors/{}/uptime-histories?days=7,14", id)).dispatch();
+    assert_eq!(resp.status(), Status::Ok);
+    let body: serde_json::Value = resp.into_json().unwrap();
+    assert_eq!(body["7"].as_array().unwrap().len(), 1);
+    assert_eq!(body["14"].as_array().unwrap().len(), 2);
+
+    for days in [7, 14] {
+        let single: serde_json::Value = client
+            .get(format!("/api/v1/monitors/{}/uptime-history?days={}", id, days))
+            .dispatch()
+            .into_json()
+            .unwrap();
+        assert_eq!(body[days.to_string()], single, "days={}", days);
+    }
+}
+
+#[test]
+fn test_monitor_uptime_histories_validation() {
+    let client = test_client();
+    let (id, _key) = create_test_monitor(&client);
+
+    let resp = client.get(format!("/api/v1/monitors/{}/uptime-histories", id)).dispatch();
+    assert_eq!(resp.status(), Status::Ok);
+    let body: serde_json::Value = resp.into_json().unwrap();
+    for key in ["7", "14", "30"] {
+        assert!(body[key].as_array().unwrap().is_empty(), "missing {}", key);
+    }
+
+    let resp = client.get(format!("/api/v1/monitors/{}/uptime-histories?days=7,week", id)).dispatch();
+    assert_eq!(resp.status(), Status::BadRequest);
+
+    let resp = client.get("/api/v1/monitors/nonexistent/uptime-histories").dispatch();
+    assert_eq!(resp.status(), Status::NotFound);
+}
+
 // ── Badge Tests ──
 
 #[test]
@@ -1941,6 +2118,56 @@ fn test_uptime_badge_with_heartbeats() {
     assert!(body.contains("#e05d44"));
 }
 
+#[test]
+fn test_uptime_badges_batch() {
+    let (client, db_path) = test_client_with_db();
+    let (id, _key) = create_test_monitor(&client);
+
+    // 1 up now, 1 down 3 days ago: 24h sees only the up check, 7d sees both
+    {
+        let conn = rusqlite::Connection::open(&db_path).unwrap();
+        for (status, age) in &[("up", "-1 minutes"), ("down", "-3 days")] {
+            conn.execute(
+                "INSERT INTO heartbeats (id, monitor_id, status, response_time_ms, status_code, checked_at, seq)
+                 VALUES (?1, ?2, ?3, 100, 200, datetime('now', ?4), (SELECT COALESCE(MAX(seq),0)+1 FROM heartbeats))",
+                params![uuid::Uuid::new_v4().to_string(), id, status, age],
+            ).unwrap();
+        }
+    }
+
+    let resp = client.get(format!("/api/v1/monitors/{}/badges/uptime?periods=24h,7d", id)).dispatch();
+    assert_eq!(resp.status(), Status::Ok);
+    let body: serde_json::Value = resp.into_json().unwrap();
+    let badges = body.as_object().unwrap();
+    assert_eq!(badges.len(), 2);
+    assert!(badges["24h"].as_str().unwrap().contains("100.0%"));
+    assert!(badges["7d"].as_str().unwrap().contains("50.0%"));
+    assert!(badges["7d"].as_str().unwrap().contains("uptime 7d"));
+
+    // Same SVG as the single-badge endpoint
+    let single = client.get(format!("/api/v1/monitors/{}/badge/uptime?period=7d", id)).dispatch();
+    assert_eq!(badges["7d"].as_str().unwrap(), single.into_string().unwrap());
+}
+
+#[test]
+fn test_uptime_badges_defaults_and_validation() {
+    let client = test_client();
+    let (id, _key) = create_test_monitor(&client);
+
+    let resp = client.get(format!("/api/v1/monitors/{}/badges/uptime", id)).dispatch();
+    assert_eq!(resp.status(), Status::Ok);
+    let body: serde_json::Value = resp.into_json().unwrap();
+    for period in ["24h", "7d", "30d", "90d"] {
+        assert!(body[period].as_str().unwrap().starts_with("<svg"), "missing {}", period);
+    }
+
+    let resp = client.get(format!("/api/v1/monitors/{}/badges/uptime?periods=24h,1y", id)).dispatch();
+    assert_eq!(resp.status(), Status::BadRequest);
+
+    let resp = client.get("/api/v1/monitors/nonexistent/badges/uptime").dispatch();
+    assert_eq!(resp.status(), Status::NotFound);
+}
+
 #[test]
 fn test_status_badge() {
     let client = test_client();